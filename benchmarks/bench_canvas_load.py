@@ -0,0 +1,88 @@
+# Filename: benchmarks/bench_canvas_load.py
+# Module name: benchmarks
+# Description: Benchmark loading a large graph (5k nodes, 10k edges) into the Canvas.
+
+"""
+Times loading a synthetic graph item by item (`Canvas.create_node_repr` / `create_edge_repr`) and in bulk
+(`Canvas.load_snapshot`). Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_canvas_load [--nodes 5000] [--edges 10000] [--bulk]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import json
+import random
+import time
+import uuid
+
+# PySide6 (Python/Qt)
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.graph.canvas import Canvas
+
+
+def make_snapshot(nodes: int, edges: int, seed: int = 0, extent: float = 5000) -> dict:
+    """A random graph in the server's snapshot format, with nodes spread over an `extent` x `extent` square."""
+
+    rng = random.Random(seed)
+    nuids = [uuid.uuid4().hex for _ in range(nodes)]
+
+    return {
+        "nodes": {
+            nuid: {"meta": {"x": rng.uniform(0, extent), "y": rng.uniform(0, extent)}}
+            for nuid in nuids
+        },
+        "edges": {
+            uuid.uuid4().hex: dict(zip(("source_uid", "target_uid"), rng.sample(nuids, 2)))
+            for _ in range(edges)
+        },
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--edges", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bulk", action="store_true", help="Load with Canvas.load_snapshot")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    snapshot = make_snapshot(args.nodes, args.edges, args.seed)
+
+    if args.bulk:
+        canvas = Canvas()
+        view = QtWidgets.QGraphicsView(canvas)
+        start = time.perf_counter()
+        canvas.load_snapshot(snapshot)
+        print(f"snapshot: {len(canvas.items()):>6} items in {time.perf_counter() - start:8.3f} s")
+        view.close()
+
+    else:
+        canvas = Canvas()
+        start = time.perf_counter()
+        for nuid, data in snapshot["nodes"].items():
+            canvas.create_node_repr(canvas.uid, nuid, json.dumps(data["meta"]))
+        print(f"nodes:    {args.nodes:>6} in {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        for euid, data in snapshot["edges"].items():
+            canvas.create_edge_repr(canvas.uid, euid, json.dumps(data))
+        print(f"edges:    {args.edges:>6} in {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        for nuid in list(snapshot["nodes"])[:1000]:
+            canvas.find_item_by_uid(nuid)
+        print(f"lookups:    1000 in {time.perf_counter() - start:8.3f} s")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
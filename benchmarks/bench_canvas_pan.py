@@ -0,0 +1,78 @@
+# Filename: benchmarks/bench_canvas_pan.py
+# Module name: benchmarks
+# Description: Benchmark frame times while panning across a dense scene.
+
+"""
+Pans a view across a dense canvas and reports per-frame paint times. Every frame is painted synchronously with
+`viewport().repaint()`. Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_canvas_pan [--nodes 2000] [--edges 0] [--frames 120] [--large]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import statistics
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.graph.canvas import Canvas
+from gui.widgets.viewer import Viewer
+from benchmarks.bench_canvas_load import make_snapshot
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--edges", type=int, default=0)
+    parser.add_argument("--extent", type=float, default=2000, help="Side of the square the nodes are spread over")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--zoom", type=float, default=1.0)
+    parser.add_argument("--large", action="store_true", help="Use a Viewer in large-scene mode")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    if args.large:
+        view = Viewer(opengl=False, large_scene=True)
+        canvas = view.scene()
+    else:
+        canvas = Canvas()
+        view = QtWidgets.QGraphicsView(canvas)
+
+    canvas.load_snapshot(make_snapshot(args.nodes, args.edges, extent=args.extent))
+    view.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing)
+    view.resize(1600, 1000)
+    view.scale(args.zoom, args.zoom)
+    view.show()
+    app.processEvents()
+
+    # Pan horizontally across the populated region
+    half = view.viewport().width() / 2 / args.zoom
+    span = max(args.extent - 2 * half, 0.0)
+
+    times = []
+    for frame in range(args.frames):
+        view.centerOn(half + span * frame / max(args.frames - 1, 1), args.extent / 2)
+        start = time.perf_counter()
+        view.viewport().repaint()
+        times.append((time.perf_counter() - start) * 1e3)
+
+    times.sort()
+    print(f"frames:  {len(times):>6}")
+    print(f"mean:    {statistics.fmean(times):8.2f} ms")
+    print(f"median:  {statistics.median(times):8.2f} ms")
+    print(f"p95:     {times[int(0.95 * (len(times) - 1))]:8.2f} ms")
+    view.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
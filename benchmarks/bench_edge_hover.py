@@ -0,0 +1,114 @@
+# Filename: benchmarks/bench_edge_hover.py
+# Module name: benchmarks
+# Description: Benchmark hover and selection latency on a canvas with many edges.
+
+"""
+Moves the mouse onto random edges of a dense canvas and clicks them, reporting the time taken to dispatch each
+event and process the resulting (partial) viewport updates. Hovering also runs a few frames of the edge's
+thickness animation. Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_edge_hover [--nodes 2000] [--edges 10000] [--samples 100]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import random
+import statistics
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtTest
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.graph.canvas import Canvas
+from gui.graph.edge import EdgeRepr
+from benchmarks.bench_canvas_load import make_snapshot
+
+
+def _report(name: str, times: list[float]) -> None:
+
+    times = sorted(times)
+    print(
+        f"{name:<10} mean {statistics.fmean(times):8.2f} ms   "
+        f"median {statistics.median(times):8.2f} ms   "
+        f"p95 {times[int(0.95 * (len(times) - 1))]:8.2f} ms"
+    )
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--edges", type=int, default=10000)
+    parser.add_argument("--extent", type=float, default=5000)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    canvas = Canvas()
+    canvas.load_snapshot(make_snapshot(args.nodes, args.edges, extent=args.extent))
+    edges = [item for item in canvas.items() if isinstance(item, EdgeRepr)]
+
+    view = QtWidgets.QGraphicsView(canvas)
+    view.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing)
+    view.setMouseTracking(True)
+    view.resize(1600, 1000)
+    view.show()
+    app.processEvents()
+
+    rng = random.Random(args.seed)
+    hover, select, hit_test = [], [], []
+    selected = 0
+
+    for edge in rng.sample(edges, min(args.samples, len(edges))):
+
+        point = edge.mapToScene(edge._path.pointAtPercent(0.25))
+        view.centerOn(point)
+        app.processEvents()
+        viewport_pos = view.mapFromScene(point)
+
+        # Hit test: every item under the cursor, as used by hover and click dispatch
+        start = time.perf_counter()
+        view.items(viewport_pos)
+        hit_test.append((time.perf_counter() - start) * 1e3)
+
+        # Hover: mouse-move dispatch, plus the thickness animation's frames
+        start = time.perf_counter()
+        QtTest.QTest.mouseMove(view.viewport(), viewport_pos)
+        for _ in range(5):
+            time.sleep(0.016)
+            app.processEvents()
+        hover.append((time.perf_counter() - start - 5 * 0.016) * 1e3)
+
+        # Selection: click dispatch and the resulting updates
+        start = time.perf_counter()
+        QtTest.QTest.mouseClick(
+            view.viewport(), QtCore.Qt.MouseButton.LeftButton, pos=viewport_pos
+        )
+        app.processEvents()
+        select.append((time.perf_counter() - start) * 1e3)
+        selected += any(isinstance(item, EdgeRepr) for item in canvas.selectedItems())
+
+        # Move away, so the next sample starts from a non-hovered state
+        QtTest.QTest.mouseMove(view.viewport(), QtCore.QPoint(0, 0))
+        app.processEvents()
+
+    print(f"edges:   {len(edges):>6}")
+    print(f"clicks:  {selected:>6} of {len(select)} selected an edge")
+    _report("hit-test", hit_test)
+    _report("hover", hover)
+    _report("select", select)
+    view.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Filename: benchmarks/bench_graph_arrays.py
+# Module name: benchmarks
+# Description: Benchmark graph analytics over the COO/CSR export against walking the graph's dictionaries.
+
+"""
+Builds a large acyclic schematic (random edges from lower- to higher-numbered nodes, in 50 disconnected parts) and
+times a topological sort, a cycle check and weakly connected components: in Python over `links_in`/`links_out`
+(the evaluator's Kahn ordering, and a breadth-first search), and in igraph over `GraphArrays` (including the
+export, and with the export cached). Run from the repository root:
+
+    python -m benchmarks.bench_graph_arrays [--nodes 200000 --edges 400000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import time
+import uuid
+
+# Third-party
+import numpy as np
+
+# Climact
+from core.graph import GraphController, Node
+from core.graph.arrays import GraphArrays
+from core.graph.edge import Edge
+from core.graph.evaluator import Evaluator
+
+
+def build(nodes: int, edges: int, parts: int = 50) -> GraphController.Graph:
+
+    rng = np.random.default_rng(0)
+    graph = GraphController.Graph()
+
+    nuids = [uuid.uuid4().hex for _ in range(nodes)]
+    for nuid in nuids:
+        graph.nodes[nuid] = Node(nuid=nuid, meta={})
+
+    # Edges within each part, from lower to higher positions (acyclic)
+    size = nodes // parts
+    part = rng.integers(0, parts, edges)
+    a = part * size + rng.integers(0, size, edges)
+    b = part * size + rng.integers(0, size, edges)
+    keep = a != b
+
+    for s, t in zip(np.minimum(a, b)[keep].tolist(), np.maximum(a, b)[keep].tolist()):
+        euid = uuid.uuid4().hex
+        graph.edges[euid] = Edge.between(euid, nuids[s], nuids[t], graph.ids)
+        graph.links_out.setdefault(nuids[s], set()).add(euid)
+        graph.links_in.setdefault(nuids[t], set()).add(euid)
+
+    return graph
+
+
+def python_components(graph: GraphController.Graph) -> int:
+
+    seen, count = set(), 0
+    for root in graph.nodes:
+        if root in seen:
+            continue
+
+        count += 1
+        seen.add(root)
+        pending = [root]
+        while pending:
+            nuid = pending.pop()
+            for euid in graph.links_out.get(nuid, ()):
+                other = graph.edges[euid].target_uid
+                if other not in seen:
+                    seen.add(other)
+                    pending.append(other)
+            for euid in graph.links_in.get(nuid, ()):
+                other = graph.edges[euid].source_uid
+                if other not in seen:
+                    seen.add(other)
+                    pending.append(other)
+
+    return count
+
+
+def python(graph: GraphController.Graph) -> tuple[int, int]:
+
+    order = Evaluator(graph)._downstream(graph.nodes.keys())
+    return len(order), python_components(graph)
+
+
+def analytics(export: GraphArrays) -> tuple[int, int]:
+
+    if not export.is_acyclic():
+        raise RuntimeError("Expected an acyclic graph")
+
+    return len(export.topological_order()), len(export.components())
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--edges", type=int, default=400_000)
+    args = parser.parse_args()
+
+    graph = build(args.nodes, args.edges)
+    print(f"graph: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
+
+    start = time.perf_counter()
+    ordered, components = python(graph)
+    print(f"python dict walk:        {time.perf_counter() - start:7.2f} s  {ordered} ordered, {components} components")
+
+    start = time.perf_counter()
+    export = GraphArrays(graph)
+    print(f"export (COO/CSR):        {time.perf_counter() - start:7.2f} s")
+
+    start = time.perf_counter()
+    export.to_igraph()
+    print(f"igraph conversion:       {time.perf_counter() - start:7.2f} s")
+
+    start = time.perf_counter()
+    ordered, components = analytics(export)
+    print(f"igraph (cached export):  {time.perf_counter() - start:7.2f} s  {ordered} ordered, {components} components")
+
+
+if __name__ == "__main__":
+    main()
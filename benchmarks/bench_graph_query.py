@@ -0,0 +1,81 @@
+# Filename: benchmarks/bench_graph_query.py
+# Module name: benchmarks
+# Description: Benchmark attribute queries against comparing quantities node by node.
+
+"""
+Builds the plant graph of `bench_graph_search`, then times `graph.query` (first call, which builds the columns, and
+repeated calls) against fetching every node with `send_node_data` and comparing pint quantities in Python. Run from
+the repository root:
+
+    python -m benchmarks.bench_graph_query [--nodes 5000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+# Climact
+from core.graph import GraphController
+from core.streams import Quantity, ureg
+from benchmarks.bench_graph_search import build
+
+QUERY = "inp.*.CO2_emissions > 2 and out.Steel >= 0 kg/s"
+
+
+async def scan(controller: GraphController, guid: str) -> list[str]:
+
+    threshold = ureg.Quantity(2, "dimensionless")
+    zero = ureg.Quantity(0, "kg/s")
+
+    matches = []
+    for nuid in controller.database[guid].nodes:
+        data = (await controller.send_node_data(guid, nuid))["response"]
+        for tech in data["tech"].values():
+            emits = any(
+                "CO2_emissions" in stream and Quantity.from_dict(stream).CO2_emissions.quantity > threshold
+                for stream in tech["inp"].values()
+            )
+            steel = "Steel" in tech["out"] and Quantity.from_dict(tech["out"]["Steel"]).quantity >= zero
+            if emits and steel:
+                matches.append(nuid)
+                break
+
+    return matches
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    controller = GraphController()
+    guid = uuid.uuid4().hex
+    asyncio.run(build(controller, guid, args.nodes))
+
+    payload = json.dumps({"query": QUERY})
+
+    start = time.perf_counter()
+    response = asyncio.run(controller.query(guid, payload))
+    print(f"query (cold):  {(time.perf_counter() - start) * 1e3:8.2f} ms  {response['response']['count']} matches")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        asyncio.run(controller.query(guid, payload))
+    print(f"query (warm):  {(time.perf_counter() - start) / args.repeat * 1e3:8.2f} ms")
+
+    start = time.perf_counter()
+    matches = asyncio.run(scan(controller, guid))
+    print(f"scan:          {(time.perf_counter() - start) * 1e3:8.2f} ms  {len(matches)} matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Filename: benchmarks/bench_graph_records.py
+# Module name: benchmarks
+# Description: Benchmark the memory of slotted graph records against dict-backed dataclasses.
+
+"""
+Builds 1M edges across plant graphs (10 edges between 8 nodes per plant) from slotted `Edge` records, which store
+node indices into a per-graph `NodeIndex`, and from the previous dict-backed dataclasses, which store the node UIDs
+(decoded from each `create_edge` payload, so every edge holds its own copies) and an empty payload dict. Also
+compares per-object sizes of `Node` and `Technology`. Run from the repository root:
+
+    python -m benchmarks.bench_graph_records [--edges 1000000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+import typing
+import uuid
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+# Climact
+from core.graph import Node, Technology
+from core.graph.edge import Edge, NodeIndex
+
+
+NODES, EDGES = 8, 10
+
+
+@dataclass
+class DictEdge:
+    uid: str
+    source_uid: str
+    target_uid: str
+    payload: typing.Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class DictNode:
+    nuid: str
+    meta: dict
+    tech: dict = field(default_factory=dict)
+
+
+@dataclass
+class DictTechnology:
+    inp: dict = field(default_factory=dict)
+    out: dict = field(default_factory=dict)
+    par: dict = field(default_factory=dict)
+    eqn: dict = field(default_factory=dict)
+
+
+def plants(count: int) -> list[tuple[list[str], list[tuple[str, str, str]]]]:
+    """
+    Node UIDs and `create_edge` payloads of each plant graph.
+    """
+
+    graphs = []
+    for _ in range(count):
+        nuids = [uuid.uuid4().hex for _ in range(NODES)]
+        pairs = [(i, j) for i in range(NODES) for j in range(i + 1, NODES)][:EDGES]
+        payloads = [
+            json.dumps({"source_uid": nuids[i], "target_uid": nuids[j]})
+            for i, j in pairs
+        ]
+        graphs.append((nuids, [(uuid.uuid4().hex, payload) for payload in payloads]))
+
+    return graphs
+
+
+def slotted(graphs) -> list:
+
+    edges = []
+    for nuids, payloads in graphs:
+        index = NodeIndex()
+        for nuid in nuids:
+            index.index(nuid)
+
+        for euid, payload in payloads:
+            data = json.loads(payload)
+            edges.append(Edge.between(euid, data["source_uid"], data["target_uid"], index))
+
+    return edges
+
+
+def dict_backed(graphs) -> list:
+
+    edges = []
+    for _, payloads in graphs:
+        for euid, payload in payloads:
+            data = json.loads(payload)
+            edges.append(DictEdge(euid, data["source_uid"], data["target_uid"]))
+
+    return edges
+
+
+def measure(label: str, build, graphs) -> int:
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    edges = build(graphs)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:12} {len(edges):8d} edges  {elapsed:6.2f} s  {memory / 2**20:8.1f} MiB  "
+          f"{memory / len(edges):6.0f} B/edge")
+    return memory
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    graphs = plants(args.edges // EDGES)
+
+    baseline = measure("dict-backed", dict_backed, graphs)
+    memory = measure("slotted", slotted, graphs)
+    print(f"saved: {(baseline - memory) / 2**20:.1f} MiB ({1 - memory / baseline:.0%})")
+
+    nuid = uuid.uuid4().hex
+    for label, record in (
+        ("Node", (Node(nuid, {}), DictNode(nuid, {}))),
+        ("Technology", (Technology(), DictTechnology())),
+    ):
+        slots, dicts = record
+        size = sys.getsizeof(dicts) + sys.getsizeof(dicts.__dict__)
+        print(f"{label:12} slotted {sys.getsizeof(slots):4d} B   dict-backed {size:4d} B (excluding fields)")
+
+
+if __name__ == "__main__":
+    main()
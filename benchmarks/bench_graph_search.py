@@ -0,0 +1,141 @@
+# Filename: benchmarks/bench_graph_search.py
+# Module name: benchmarks
+# Description: Benchmark the graph search index against scanning every node.
+
+"""
+Creates a graph of plants (each consuming a fuel stream with emission attributes) through the controller, then
+times `graph.search` queries against a scan that serializes every node and matches substrings. Then creates one
+graph per plant (as `import_plants` does) and times a search across all of them, against querying each graph's own
+index in turn. Run from the repository root:
+
+    python -m benchmarks.bench_graph_search [--nodes 5000] [--graphs 5000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+
+# Climact
+from core.graph import GraphController
+
+STATES = ["Odisha", "Jharkhand", "Chhattisgarh", "Karnataka", "Maharashtra", "Gujarat"]
+FUELS = ["Coking Coal", "Natural Gas", "Hydrogen", "Biomass"]
+
+
+def _quantity(value, units, kind="Quantity", **attrs):
+    return {"type": kind, "value": value, "units": units, **attrs}
+
+
+async def build(controller: GraphController, guid: str, count: int) -> None:
+
+    rng = random.Random(0)
+    await controller.create_graph(guid)
+
+    for i in range(count):
+        fuel = rng.choice(FUELS)
+        meta = {"label": f"Plant {i} {fuel.split()[-1]}", "state": rng.choice(STATES)}
+        response = await controller.create_node(guid, json.dumps(meta))
+
+        stream = _quantity(1, "kg/s", "MassFlowRate")
+        if fuel != "Hydrogen":
+            stream["CO2_emissions"] = _quantity(rng.uniform(0.5, 3.0), "dimensionless")
+
+        tech = {"inp": {fuel: stream}, "out": {"Steel": _quantity(0, "kg/s", "MassFlowRate")}}
+        await controller.update_node_data(
+            guid, json.dumps({"tech": {"BF-BOF": tech}}), response["response"]["nuid"]
+        )
+
+
+async def build_graphs(controller: GraphController, count: int) -> list[str]:
+
+    rng = random.Random(1)
+    guids = []
+    for i in range(count):
+        guid = uuid.uuid4().hex
+        await controller.create_graph(guid)
+        meta = {"label": f"Site {i}", "state": rng.choice(STATES), "fuel": rng.choice(FUELS)}
+        await controller.create_node(guid, json.dumps(meta))
+        guids.append(guid)
+
+    return guids
+
+
+def fan_out(controller: GraphController, guids: list[str], text: str, limit: int) -> int:
+    """Search every graph's own index and merge the results (the alternative to the controller's shared index)."""
+
+    matches = []
+    for guid in guids:
+        matches.extend(score for _, score, _ in controller.database[guid].index.search(text, limit=limit))
+
+    return len(sorted(matches, reverse=True)[:limit])
+
+
+async def scan(controller: GraphController, guid: str, needle: str) -> list[str]:
+
+    matches = []
+    for nuid in controller.database[guid].nodes:
+        data = await controller.send_node_data(guid, nuid)
+        if needle in json.dumps(data["response"]).lower():
+            matches.append(nuid)
+
+    return matches
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    parser.add_argument("--graphs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    controller = GraphController()
+    guid = uuid.uuid4().hex
+
+    start = time.perf_counter()
+    asyncio.run(build(controller, guid, args.nodes))
+    print(f"build ({args.nodes} nodes, indexed on create/update): {time.perf_counter() - start:8.2f} s")
+
+    for text in ("odisha", "coal", "inp:coal attr:co2_emissions", "hydrogn", "plant 42"):
+        payload = json.dumps({"text": text, "limit": None})
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            response = asyncio.run(controller.search(guid, payload))
+        elapsed = (time.perf_counter() - start) / args.repeat * 1e3
+        print(f"search {text!r:32} {elapsed:8.2f} ms  {len(response['response']['matches']):5d} matches")
+
+    start = time.perf_counter()
+    matches = asyncio.run(scan(controller, guid, "odisha"))
+    print(f"scan   {'odisha'!r:32} {(time.perf_counter() - start) * 1e3:8.2f} ms  {len(matches):5d} matches")
+
+    guids = asyncio.run(build_graphs(controller, args.graphs))
+    print(f"\nacross {args.graphs} single-node graphs (plus the graph above):")
+
+    for text in ("odisha", "site 42", "hydrogn"):
+        payload = json.dumps({"text": text, "limit": 50})
+        asyncio.run(controller.search(None, payload))  # Indexes the deferred nodes
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            response = asyncio.run(controller.search(None, payload))
+        elapsed = (time.perf_counter() - start) / args.repeat * 1e3
+
+        fan_out(controller, guids, text, 50)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            fan_out(controller, guids, text, 50)
+        fanned = (time.perf_counter() - start) / args.repeat * 1e3
+
+        print(f"search {text!r:32} {elapsed:8.2f} ms  (per-graph fan-out {fanned:8.2f} ms)  "
+              f"{len(response['response']['matches']):5d} matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# Filename: benchmarks/bench_graph_templates.py
+# Module name: benchmarks
+# Description: Benchmark template instantiation against building each plant graph node by node.
+
+"""
+Defines a BF-BOF pathway template (with CCUS), then creates a graph per plant by instantiating the template (every
+tenth plant overrides its CCUS penetration), and by `create_graph`, `create_node`, `update_node_data` and
+`create_edge` calls. Reports time and traced memory per approach. Run from the repository root:
+
+    python -m benchmarks.bench_graph_templates [--plants 5000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import json
+import logging
+import time
+import tracemalloc
+import uuid
+
+# Climact
+from core.graph import GraphController
+
+
+def _quantity(value, units, kind="Quantity"):
+    return {"type": kind, "value": value, "units": units}
+
+
+def _flow(value=0.0):
+    return _quantity(value, "kg/s", "MassFlowRate")
+
+
+PATHWAY = {
+    "nodes": {
+        "mine": {
+            "meta": {"label": "Iron Ore Mine"},
+            "tech": {"default": {"out": {"ore": _flow()}, "par": {"rate": _flow(40)}, "eqn": {"ore": "rate"}}},
+        },
+        "sinter": {
+            "meta": {"label": "Sinter Plant"},
+            "tech": {"default": {
+                "inp": {"ore": _flow()},
+                "out": {"sinter": _flow()},
+                "par": {"yield": _quantity(0.95, "dimensionless")},
+                "eqn": {"sinter": "ore * yield"},
+            }},
+        },
+        "coke": {
+            "meta": {"label": "Coke Oven"},
+            "tech": {"default": {"out": {"coke": _flow()}, "par": {"rate": _flow(12)}, "eqn": {"coke": "rate"}}},
+        },
+        "blast_furnace": {
+            "meta": {"label": "Blast Furnace"},
+            "tech": {"default": {
+                "inp": {"sinter": _flow(), "coke": _flow()},
+                "out": {"hot_metal": _flow(), "CO2": _flow()},
+                "par": {"ef": _quantity(1.6, "dimensionless"), "yield": _quantity(0.6, "dimensionless")},
+                "eqn": {"hot_metal": "sinter * yield", "CO2": "coke * ef"},
+            }},
+        },
+        "bof": {
+            "meta": {"label": "BOF Converter"},
+            "tech": {"default": {
+                "inp": {"hot_metal": _flow()},
+                "out": {"steel": _flow()},
+                "par": {"yield": _quantity(0.9, "dimensionless")},
+                "eqn": {"steel": "hot_metal * yield"},
+            }},
+        },
+        "ccus": {
+            "meta": {"label": "CCUS"},
+            "tech": {"default": {
+                "inp": {"CO2": _flow()},
+                "out": {"emitted": _flow()},
+                "par": {"penetration": _quantity(0.0, "dimensionless")},
+                "eqn": {"emitted": "CO2 * (1 - penetration)"},
+            }},
+        },
+    },
+    "edges": [
+        ["mine", "sinter"],
+        ["sinter", "blast_furnace"],
+        ["coke", "blast_furnace"],
+        ["blast_furnace", "bof"],
+        ["blast_furnace", "ccus"],
+    ],
+}
+
+
+async def templated(controller: GraphController, plants: int) -> None:
+
+    await controller.create_template("BF-BOF", json.dumps(PATHWAY))
+    instances = [
+        {"meta": {"plant": f"P{i}"}, "parameters": {"ccus.penetration": 0.5} if i % 10 == 0 else {}}
+        for i in range(plants)
+    ]
+    await controller.instantiate_template("BF-BOF", json.dumps({"instances": instances}))
+
+
+async def individual(controller: GraphController, plants: int) -> None:
+
+    for i in range(plants):
+        guid = uuid.uuid4().hex
+        await controller.create_graph(guid)
+
+        nuids = {}
+        for key, node in PATHWAY["nodes"].items():
+            tech = json.loads(json.dumps(node["tech"]))
+            if i % 10 == 0 and key == "ccus":
+                tech["default"]["par"]["penetration"]["value"] = 0.5
+
+            meta = {**node["meta"], "plant": f"P{i}"}
+            response = await controller.create_node(guid, json.dumps(meta))
+            nuids[key] = response["response"]["nuid"]
+            await controller.update_node_data(guid, json.dumps({"tech": tech}), nuids[key])
+
+        for source, target in PATHWAY["edges"]:
+            payload = json.dumps({"source_uid": nuids[source], "target_uid": nuids[target]})
+            await controller.create_edge(guid, payload)
+
+
+def measure(label: str, run, plants: int) -> None:
+
+    controller = GraphController()
+    controller.database.clear()
+    controller.templates.clear()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(run(controller, plants))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:12} {plants:5d} plants  {elapsed:7.2f} s  {current / 2**20:7.1f} MiB retained")
+    controller.database.clear()
+    controller.templates.clear()
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plants", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    measure("template", templated, 1)
+    measure("template", templated, args.plants)
+    measure("individual", individual, 1)
+    measure("individual", individual, args.plants)
+
+
+if __name__ == "__main__":
+    main()
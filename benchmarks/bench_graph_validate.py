@@ -0,0 +1,104 @@
+# Filename: benchmarks/bench_graph_validate.py
+# Module name: benchmarks
+# Description: Benchmark full and incremental whole-graph validation.
+
+"""
+Builds plant graphs of increasing size (a mine, a furnace and a CCUS unit per plant, chained by two edges, with
+interned technologies) and times a full validation through the controller, to show that it scales linearly. Then
+edits a few nodes with `update_node_data` and times the next (incremental) validation. Run from the repository root:
+
+    python -m benchmarks.bench_graph_validate [--plants 10000 30000 100000 --edits 10]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+# Climact
+from core.graph import GraphController, Node, Technology
+from core.graph.edge import Edge
+
+
+def _quantity(value, units, kind="Quantity"):
+    return {"type": kind, "value": value, "units": units}
+
+
+MINE = {"out": {"ore": _quantity(0, "kg/s", "MassFlowRate")}}
+FURNACE = {
+    "inp": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+    "out": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+}
+CCUS = {
+    "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+    "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+}
+
+
+def build(controller: GraphController, plants: int) -> tuple[str, list[str]]:
+
+    guid = uuid.uuid4().hex
+    graph = controller.database[guid] = GraphController.Graph()
+
+    ccus = []
+    for _ in range(plants):
+        nuids = [uuid.uuid4().hex for _ in range(3)]
+        for nuid, tech in zip(nuids, (MINE, FURNACE, CCUS)):
+            graph.nodes[nuid] = Node(nuid, {}, {"default": Technology.intern(tech)})
+
+        for source, target in zip(nuids, nuids[1:]):
+            euid = uuid.uuid4().hex
+            graph.edges[euid] = Edge.between(euid, source, target, graph.ids)
+            graph.links_out.setdefault(source, set()).add(euid)
+            graph.links_in.setdefault(target, set()).add(euid)
+
+        ccus.append(nuids[2])
+
+    return guid, ccus
+
+
+def validate(controller: GraphController, guid: str, full: bool = False) -> dict:
+    return asyncio.run(controller.validate(guid, json.dumps({"full": full})))["response"]
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plants", type=int, nargs="+", default=[10_000, 30_000, 100_000])
+    parser.add_argument("--edits", type=int, default=10)
+    args = parser.parse_args()
+
+    controller = GraphController()
+    tech = {
+        "inp": {"CO2": _quantity(0, "kW", "EnergyFlowRate")},
+        "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+    }
+
+    for plants in args.plants:
+        guid, ccus = build(controller, plants)
+        graph = controller.database[guid]
+
+        start = time.perf_counter()
+        result = validate(controller, guid)
+        elapsed = time.perf_counter() - start
+        print(f"{plants:7d} plants ({len(graph.nodes):7d} nodes)  full:        {elapsed:7.3f} s  "
+              f"{elapsed / len(graph.nodes) * 1e6:5.2f} us/node  {len(result['issues'])} issues")
+
+        for nuid in ccus[: args.edits]:
+            asyncio.run(controller.update_node_data(guid, json.dumps({"tech": {"default": tech}}), nuid))
+
+        start = time.perf_counter()
+        result = validate(controller, guid)
+        elapsed = time.perf_counter() - start
+        print(f"{'':30}  incremental: {elapsed:7.3f} s  checked {result['checked']['nodes']} nodes, "
+              f"{result['checked']['edges']} edges, {len(result['added'])} added")
+
+        del controller.database[guid]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Filename: benchmarks/bench_map_layer.py
+# Module name: benchmarks
+# Description: Benchmark building, caching and painting the India map layer.
+
+"""
+Times building the map layer from GeoJSON (the cold start), loading it from the binary cache (every later start),
+building the painter path of each level, and painting the whole map at several zoom levels. Run from the repository
+root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_map_layer [--frames 20]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import json
+import statistics
+import tempfile
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtWidgets
+
+# Climact
+from gui.maps import MapLayer
+from gui.maps.layer import SOURCE
+
+
+def _ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    start = time.perf_counter()
+    json.loads(SOURCE.read_text())
+    print(f"parse GeoJSON only:      {_ms(start):8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        start = time.perf_counter()
+        MapLayer.load(cache_dir=cache_dir)
+        print(f"cold start (build):      {_ms(start):8.1f} ms")
+
+        start = time.perf_counter()
+        layer = MapLayer.load(cache_dir=cache_dir)
+        print(f"warm start (cache):      {_ms(start):8.1f} ms")
+
+    for index, level in enumerate(layer.levels):
+        start = time.perf_counter()
+        layer.path(index)
+        print(
+            f"level {index}: tolerance {level.tolerance:4.1f}, {len(level.points):6d} points, "
+            f"{len(level.rings) - 1:4d} rings, path built in {_ms(start):6.1f} ms"
+        )
+
+    # Paint the whole map into a fixed-size image at each zoom
+    bounds = layer.bounds
+    for zoom in (0.2, 0.5, 1.0, 2.0):
+
+        image = QtGui.QImage(
+            int(bounds.width() * zoom) + 1,
+            int(bounds.height() * zoom) + 1,
+            QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        times = []
+        for _ in range(args.frames):
+            image.fill(0xFFEFEFEF)
+            painter = QtGui.QPainter(image)
+            painter.scale(zoom, zoom)
+            painter.translate(-bounds.topLeft())
+
+            start = time.perf_counter()
+            layer.paint(painter)
+            times.append(_ms(start))
+            painter.end()
+
+        print(
+            f"paint at {zoom:3.1f}x (level {layer.level_for(zoom)}): "
+            f"median {statistics.median(times):7.2f} ms"
+        )
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Filename: benchmarks/bench_map_pins.py
+# Module name: benchmarks
+# Description: Benchmark clustered plant pins against one graphics item per plant.
+
+"""
+Places random plants over India on a map scene and reports:
+
+- the time to build the pin layer (index included),
+- viewport queries and filter updates,
+- paint times at several zooms, for the clustered `PinLayer` and for one QGraphicsEllipseItem per plant.
+
+Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_map_pins [--plants 5000] [--frames 20]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import random
+import statistics
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+# Climact
+from core.models import Plant
+from gui.maps import MapScene
+
+PATHWAYS = ["BF-BOF", "DRI-EAF", "Hybrid", "Scrap-EAF"]
+STATES = ["Odisha", "Jharkhand", "Chhattisgarh", "Karnataka", "Maharashtra", "Gujarat", "West Bengal", "Tamil Nadu"]
+
+
+def make_plants(count: int, seed: int = 0) -> list[Plant]:
+
+    rng = random.Random(seed)
+    return [
+        Plant(
+            id=f"P{i:05d}",
+            name=f"Plant {i}",
+            state=rng.choice(STATES),
+            lat=rng.uniform(8.0, 35.0),
+            lon=rng.uniform(68.0, 97.0),
+            capacity_mtpa=round(rng.uniform(0.1, 12.0), 2),
+            pathway=rng.choice(PATHWAYS),
+        )
+        for i in range(count)
+    ]
+
+
+def paint_times(view: QtWidgets.QGraphicsView, frames: int) -> float:
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        view.viewport().repaint()
+        times.append((time.perf_counter() - start) * 1e3)
+
+    return statistics.median(times)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plants", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    plants = make_plants(args.plants)
+
+    # Clustered layer
+    scene = MapScene()
+    start = time.perf_counter()
+    pins = scene.add_pins(plants)
+    print(f"build:             {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+    center = scene.to_scene(80.0, 22.0)
+    rect = QtCore.QRectF(center.x() - 400, center.y() - 250, 800, 500)
+    start = time.perf_counter()
+    for _ in range(100):
+        pins.index.query(rect)
+    print(f"viewport query:    {(time.perf_counter() - start) * 10:8.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        pins.set_filter(pathways=["DRI-EAF", "Hybrid"], capacity=(1.0, 8.0))
+    print(f"filter update:     {(time.perf_counter() - start) * 10:8.3f} ms")
+    pins.set_filter()
+
+    # One item per plant, for comparison
+    baseline = MapScene(scene.layer)
+    pen = QtGui.QPen(QtGui.QColor(0xFFFFFF), 1.5)
+    pen.setCosmetic(True)
+    for plant in plants:
+        pos = baseline.to_scene(plant.lon, plant.lat)
+        item = baseline.addEllipse(-5, -5, 10, 10, pen, QtGui.QBrush(QtGui.QColor(0xD64545)))
+        item.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        item.setPos(pos)
+
+    print(f"{'zoom':>6} {'PinLayer':>12} {'items':>12}")
+    for zoom in (0.25, 0.5, 1.0, 2.0, 4.0):
+
+        medians = []
+        for target in (scene, baseline):
+            view = QtWidgets.QGraphicsView(target)
+            view.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing)
+            view.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+            view.setCacheMode(QtWidgets.QGraphicsView.CacheModeFlag.CacheBackground)
+            view.resize(1600, 1000)
+            view.scale(zoom, zoom)
+            view.centerOn(center)
+            view.show()
+            app.processEvents()
+            medians.append(paint_times(view, args.frames))
+            view.close()
+
+        print(f"{zoom:>6} {medians[0]:9.2f} ms {medians[1]:9.2f} ms")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# Filename: benchmarks/bench_node_drag.py
+# Module name: benchmarks
+# Description: Benchmark dragging large multi-selections of nodes.
+
+"""
+Selects every node inside a square region of a dense canvas (as a rubber-band selection would) and drags the
+selection with the mouse, reporting the time taken per mouse-move event, both for dispatching the event (moving
+the nodes and recomputing edge paths) and in total (including the resulting repaints), and the number of edge-path
+recomputations. Once the mouse is released, it also times the scene-index update that Qt defers until shortly
+after the drag. Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_node_drag [--nodes 2000] [--edges 4000] [--selected 200] [--large]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import statistics
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtCore
+from PySide6 import QtGui
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.graph.canvas import Canvas
+from gui.widgets.viewer import Viewer
+from gui.graph.edge import EdgeRepr
+from gui.graph.node import NodeRepr
+from benchmarks.bench_canvas_load import make_snapshot
+
+
+def _send(widget: QtWidgets.QWidget, kind: QtCore.QEvent.Type, pos: QtCore.QPoint, buttons) -> None:
+
+    event = QtGui.QMouseEvent(
+        kind,
+        QtCore.QPointF(pos),
+        QtCore.QPointF(widget.mapToGlobal(pos)),
+        QtCore.Qt.MouseButton.LeftButton,
+        buttons,
+        QtCore.Qt.KeyboardModifier.NoModifier,
+    )
+    QtWidgets.QApplication.sendEvent(widget, event)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--edges", type=int, default=4000)
+    parser.add_argument("--extent", type=float, default=2000)
+    parser.add_argument("--selected", type=int, default=200, help="Approximate size of the selection")
+    parser.add_argument("--moves", type=int, default=60)
+    parser.add_argument("--large", action="store_true", help="Use a Viewer in large-scene mode")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    if args.large:
+        view = Viewer(opengl=False, large_scene=True)
+        canvas = view.scene()
+    else:
+        canvas = Canvas()
+        view = QtWidgets.QGraphicsView(canvas)
+
+    canvas.load_snapshot(make_snapshot(args.nodes, args.edges, extent=args.extent))
+    view.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing)
+    view.resize(1600, 1000)
+    view.show()
+    app.processEvents()
+
+    # Rubber-band selection: a centred square holding roughly `--selected` nodes
+    side = args.extent * min(1.0, (args.selected / args.nodes) ** 0.5)
+    region = QtGui.QPainterPath()
+    region.addRect(QtCore.QRectF(0, 0, side, side).translated((args.extent - side) / 2, (args.extent - side) / 2))
+    canvas.setSelectionArea(region)
+
+    selection = [item for item in canvas.selectedItems() if isinstance(item, NodeRepr)]
+    grabbed = selection[0]
+    view.centerOn(grabbed)
+    app.processEvents()
+
+    # Count edge-path recomputations
+    recomputed = 0
+    update_path = EdgeRepr.update_path
+
+    def counted(edge, origin, target):
+        nonlocal recomputed
+        recomputed += 1
+        update_path(edge, origin, target)
+
+    EdgeRepr.update_path = counted
+
+    viewport = view.viewport()
+    position = view.mapFromScene(grabbed.scenePos())
+    before = grabbed.scenePos()
+
+    held = QtCore.Qt.MouseButton.LeftButton
+    _send(viewport, QtCore.QEvent.Type.MouseButtonPress, position, held)
+    app.processEvents()
+
+    times, dispatch = [], []
+    for move in range(1, args.moves + 1):
+        start = time.perf_counter()
+        _send(viewport, QtCore.QEvent.Type.MouseMove, position + QtCore.QPoint(move * 2, move), held)
+        dispatch.append((time.perf_counter() - start) * 1e3)
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1e3)
+
+    release = position + QtCore.QPoint(args.moves * 2, args.moves)
+    _send(viewport, QtCore.QEvent.Type.MouseButtonRelease, release, QtCore.Qt.MouseButton.NoButton)
+    app.processEvents()
+    EdgeRepr.update_path = update_path
+
+    # Queries bring the scene index up to date; time the update that Qt would otherwise run on its index timer
+    start = time.perf_counter()
+    canvas.items(QtCore.QPointF())
+    settle = (time.perf_counter() - start) * 1e3
+
+    moved = grabbed.scenePos() - before
+    times.sort()
+    print(f"selected:  {len(selection):>6} nodes, moved by ({moved.x():.0f}, {moved.y():.0f})")
+    print(f"moves:     {len(times):>6}")
+    print(f"paths:     {recomputed / len(times):>9.1f} recomputed per move")
+    print(f"dispatch:  {statistics.fmean(dispatch):8.2f} ms mean")
+    print(f"mean:      {statistics.fmean(times):8.2f} ms")
+    print(f"median:    {statistics.median(times):8.2f} ms")
+    print(f"p95:       {times[int(0.95 * (len(times) - 1))]:8.2f} ms")
+    print(f"settle:    {settle:8.2f} ms (scene-index update after the drop)")
+    view.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Filename: benchmarks/bench_node_memory.py
+# Module name: benchmarks
+# Description: Benchmark the memory used per NodeRepr on a canvas.
+
+"""
+Creates N nodes on an offscreen canvas and reports the resident-memory growth per node. Run from the repository
+root (Linux only, reads /proc):
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_node_memory [--nodes 2000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import gc
+import os
+import time
+import uuid
+
+# PySide6 (Python/Qt)
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.graph.canvas import Canvas
+from gui.graph.node import NodeRepr
+
+
+def rss() -> int:
+    """Resident set size of this process, in bytes."""
+
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    canvas = Canvas()
+
+    # Warm up: the first node loads fonts, icons and styles that every later node shares
+    canvas.addItem(NodeRepr(uuid.uuid4().hex))
+    app.processEvents()
+    gc.collect()
+
+    before = rss()
+    start = time.perf_counter()
+    for i in range(args.nodes):
+        canvas.addItem(NodeRepr(uuid.uuid4().hex, pos=QtCore.QPointF(i % 100 * 50, i // 100 * 50)))
+    elapsed = time.perf_counter() - start
+
+    app.processEvents()
+    gc.collect()
+    growth = rss() - before
+
+    print(f"nodes:     {args.nodes:>8}")
+    print(f"time:      {elapsed:8.3f} s  ({elapsed / args.nodes * 1e3:.3f} ms/node)")
+    print(f"memory:    {growth / 2**20:8.1f} MiB ({growth / args.nodes / 2**10:.1f} KiB/node)")
+    print(f"widgets:   {len(QtWidgets.QApplication.allWidgets()):>8}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
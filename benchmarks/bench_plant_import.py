@@ -0,0 +1,150 @@
+# Filename: benchmarks/bench_plant_import.py
+# Module name: benchmarks
+# Description: Benchmark the streaming plant importer against a row-by-row import.
+
+"""
+Writes a plant table to a temporary CSV file, then imports it with `PlantImporter` and `create_plant_graphs`, and
+with a row-by-row import (a pint conversion per cell, `create_graph` and `create_node` per plant). Reports rows per
+second and peak traced memory (in a second, traced run). Run from the repository root:
+
+    python -m benchmarks.bench_plant_import [--rows 100000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+# Climact
+from core.graph import GraphController
+from core.models import PlantImporter
+from core.streams import ureg
+
+STATES = ["Odisha", "Jharkhand", "Chhattisgarh", "Karnataka", "Maharashtra", "Gujarat"]
+PATHWAYS = ["BF-BOF", "DRI-EAF", "Hybrid"]
+HEADER = ["id", "name", "state", "latitude", "longitude", "capacity [kilotonne/day]", "pathway", "year", "cost [INR/t]"]
+
+
+def write(path: str, rows: int) -> None:
+
+    rng = random.Random(0)
+    with open(path, "w", newline="") as stream:
+        writer = csv.writer(stream)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            writer.writerow([
+                f"P{i}",
+                f"Plant {i}",
+                rng.choice(STATES),
+                f"{rng.uniform(8, 35):.5f}",
+                f"{rng.uniform(68, 97):.5f}",
+                f"{rng.uniform(0.1, 30):.3f}",
+                rng.choice(PATHWAYS),
+                rng.randint(1950, 2024),
+                f"{rng.uniform(30000, 50000):.0f}",
+            ])
+
+
+async def read(path: str) -> int:
+    return sum(len(chunk) for chunk in PlantImporter().chunks(path))
+
+
+async def streaming(controller: GraphController, path: str) -> int:
+
+    count = 0
+    for chunk in PlantImporter().chunks(path):
+        response = await controller.create_plant_graphs(chunk)
+        count += response["response"]["count"]
+    return count
+
+
+async def naive(controller: GraphController, path: str) -> int:
+
+    count = 0
+    with open(path, newline="") as stream:
+        for row in csv.DictReader(stream):
+            capacity = ureg.Quantity(float(row["capacity [kilotonne/day]"]), "kilotonne/day").to("Mt/yr")
+            meta = {
+                "label": row["name"],
+                "plant": row["id"],
+                "state": row["state"],
+                "lat": ureg.Quantity(float(row["latitude"]), "degree").magnitude,
+                "lon": ureg.Quantity(float(row["longitude"]), "degree").magnitude,
+                "capacity_mtpa": capacity.magnitude,
+                "pathway": row["pathway"],
+                "year_commissioned": int(row["year"]),
+                "parameters": {"cost": {"value": float(row["cost [INR/t]"]), "units": "INR/t"}},
+            }
+
+            guid = uuid.uuid4().hex
+            await controller.create_graph(guid)
+            await controller.create_node(guid, json.dumps(meta))
+            count += 1
+
+    return count
+
+
+def measure(label: str, run, rows: int) -> None:
+    """
+    Time an import, then repeat it under `tracemalloc` (which slows allocations down) for its peak memory.
+    """
+
+    controller = GraphController()
+    controller.database.clear()
+
+    start = time.perf_counter()
+    count = asyncio.run(run(controller))
+    elapsed = time.perf_counter() - start
+    controller.database.clear()
+
+    tracemalloc.start()
+    asyncio.run(run(controller))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    controller.database.clear()
+
+    print(f"{label:10} {rows:7d} rows  {elapsed:7.2f} s  {rows / elapsed:9.0f} rows/s  peak {peak / 2**20:7.1f} MiB")
+    assert count == rows
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--baseline-rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "plants.csv")
+    small = os.path.join(directory, "plants-small.csv")
+
+    try:
+        write(path, args.rows)
+        write(small, args.baseline_rows)
+        print(f"table: {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        # Importer alone, and importer with graph creation
+        measure("read", lambda _: read(path), args.rows)
+        measure("import", lambda controller: streaming(controller, path), args.rows)
+        measure("row-wise", lambda controller: naive(controller, small), args.baseline_rows)
+
+    finally:
+        for file in (path, small):
+            if os.path.exists(file):
+                os.remove(file)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Filename: benchmarks/bench_startup_table.py
+# Module name: benchmarks
+# Description: Benchmark populating the startup dialog's project table.
+
+"""
+Fills a temporary directory with empty project files and reports, for a first launch (no cached listing) and a
+second launch (cached listing):
+
+- how long `StartupFileTable.populate()` blocks the GUI thread,
+- when the first rows appear, and
+- when the background scan completes.
+
+Caches are written to Qt's test-mode locations, not the user's. Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_startup_table [--files 2000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+# PySide6 (Python/Qt)
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from gui.startup.ftable import DirectoryScanner
+from gui.startup.ftable import StartupFileTable
+
+
+def launch(app: QtWidgets.QApplication, directory: str, label: str) -> None:
+
+    table = StartupFileTable()
+    table.resize(600, 600)
+    table.show()
+
+    start = time.perf_counter()
+    table.populate(directory, "*.h5")
+    blocked = time.perf_counter() - start
+
+    first = None
+    while table.scanning or first is None:
+        app.processEvents()
+        if first is None and table.projects.rowCount():
+            first = time.perf_counter() - start
+
+        if time.perf_counter() - start > 60:
+            break
+
+    app.processEvents()
+    done = time.perf_counter() - start
+
+    print(
+        f"{label:<8} blocked {blocked * 1e3:8.2f} ms   first rows {first * 1e3:8.2f} ms   "
+        f"done {done * 1e3:8.2f} ms   rows {table.projects.rowCount()}"
+    )
+    table.close()
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    args = parser.parse_args()
+
+    QtCore.QStandardPaths.setTestModeEnabled(True)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        for i in range(args.files):
+            Path(directory, f"project-{i:05d}.h5").touch()
+
+        DirectoryScanner.cache_path(directory, "*.h5").unlink(missing_ok=True)
+        launch(app, directory, "cold")
+        launch(app, directory, "cached")
+        DirectoryScanner.cache_path(directory, "*.h5").unlink(missing_ok=True)
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
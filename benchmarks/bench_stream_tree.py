@@ -0,0 +1,72 @@
+# Filename: benchmarks/bench_stream_tree.py
+# Module name: benchmarks
+# Description: Benchmark opening a stream tree with many streams.
+
+"""
+Loads a technology with many Electricity streams (18 attributes each) into a StreamTree and reports the load time,
+the number of widgets, and paint times with the streams collapsed and expanded. Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_stream_tree [--streams 300]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtWidgets
+
+# Climact
+import gui.widgets  # noqa: F401 - Resolves the gui.graph import order
+from core.graph.node import Technology
+from core.streams import EnergyFlowRate
+from gui.graph.node.tree import StreamTree
+
+
+def paint(view: QtWidgets.QAbstractItemView) -> float:
+
+    start = time.perf_counter()
+    view.viewport().repaint()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=300)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    technology = Technology()
+    for i in range(args.streams):
+        stream = EnergyFlowRate(f"{i} kW")
+        stream.category = "Electricity"
+        technology.inp[f"Electricity {i + 1}"] = stream
+
+    tree = StreamTree()
+    tree.resize(800, 600)
+    tree.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    tree.set_streams(technology.inp)
+    app.processEvents()
+    print(f"load:              {(time.perf_counter() - start) * 1e3:8.2f} ms")
+    print(f"widgets:           {len(tree.findChildren(QtWidgets.QWidget)):8d}")
+    print(f"paint (collapsed): {paint(tree):8.2f} ms")
+
+    start = time.perf_counter()
+    tree.expandAll()
+    app.processEvents()
+    print(f"expand all:        {(time.perf_counter() - start) * 1e3:8.2f} ms")
+    print(f"paint (expanded):  {paint(tree):8.2f} ms")
+
+    tree.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
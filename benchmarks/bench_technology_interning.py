@@ -0,0 +1,153 @@
+# Filename: benchmarks/bench_technology_interning.py
+# Module name: benchmarks
+# Description: Benchmark memory of a loaded project with and without shared technologies.
+
+"""
+Loads a project of plant graphs whose nodes draw their technologies from a small catalogue (the same blast furnace
+spec on hundreds of plants, with a few plant-specific variants) through `update_node_data`, which interns them.
+The same nodes are then built with `Technology.from_dict` (one copy per node, as before interning). Reports the
+dedup ratio and retained memory. Run from the repository root:
+
+    python -m benchmarks.bench_technology_interning [--plants 1000]
+"""
+
+from __future__ import annotations
+
+# Standard
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+import tracemalloc
+import typing
+import uuid
+
+# Climact
+from core.graph import GraphController, Technology
+
+
+def _quantity(value, units, kind="Quantity"):
+    return {"type": kind, "value": value, "units": units}
+
+
+def catalogue(variants: int) -> list[dict]:
+    """
+    Technology specs: a furnace, a CCUS unit and a power plant, each in a few variants.
+    """
+
+    specs = []
+    for i in range(variants):
+        specs.append({
+            "inp": {"coal": _quantity(0, "kg/s", "MassFlowRate"), "ore": _quantity(0, "kg/s", "MassFlowRate")},
+            "out": {"steel": _quantity(0, "kg/s", "MassFlowRate"), "CO2": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {
+                "ef": _quantity(1.6 + 0.1 * i, "dimensionless"),
+                "yield": _quantity(0.6, "dimensionless"),
+                "cost": _quantity(40000 + 1000 * i, "INR/t"),
+            },
+            "eqn": {"steel": "ore * yield", "CO2": "coal * ef"},
+        })
+        specs.append({
+            "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+            "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {"penetration": _quantity(0.1 * i, "dimensionless")},
+            "eqn": {"emitted": "CO2 * (1 - penetration)"},
+        })
+        specs.append({
+            "inp": {"coal": _quantity(0, "kg/s", "MassFlowRate")},
+            "out": {"Electricity": {**_quantity(0, "MW", "EnergyFlowRate"), "CO2_intensity": _quantity(0.9, "kg/kWh")}},
+            "par": {"efficiency": _quantity(0.35 + 0.01 * i, "dimensionless")},
+        })
+
+    return specs
+
+
+def project(plants: int, nodes: int, variants: int) -> list[list[dict]]:
+    """
+    Node technologies of each plant; one node in twenty has a plant-specific parameter.
+    """
+
+    rng = random.Random(0)
+    specs = catalogue(variants)
+
+    graphs = []
+    for _ in range(plants):
+        techs = []
+        for _ in range(nodes):
+            tech = rng.choice(specs)
+            if rng.random() < 0.05:
+                tech = json.loads(json.dumps(tech))
+                for quantity in tech["par"].values():
+                    quantity["value"] = round(quantity["value"] * rng.uniform(0.9, 1.1), 3)
+            techs.append(tech)
+        graphs.append(techs)
+
+    return graphs
+
+
+async def load(controller: GraphController, graphs: list[list[dict]]) -> None:
+
+    for techs in graphs:
+        guid = uuid.uuid4().hex
+        await controller.create_graph(guid)
+        for tech in techs:
+            response = await controller.create_node(guid, json.dumps({}))
+            nuid = response["response"]["nuid"]
+            await controller.update_node_data(guid, json.dumps({"tech": {"default": tech}}), nuid)
+
+
+def measure(build: typing.Callable[[dict], Technology], graphs: list[list[dict]]) -> tuple[list, float, int]:
+    """
+    Build every node technology of a project, returning them with the time taken and the memory retained.
+    """
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    techs = [build(tech) for graph in graphs for tech in graph]
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return techs, elapsed, memory
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--plants", type=int, default=1000)
+    parser.add_argument("--nodes", type=int, default=6)
+    parser.add_argument("--variants", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    graphs = project(args.plants, args.nodes, args.variants)
+
+    # A project loaded through the controller
+    controller = GraphController()
+    asyncio.run(load(controller, graphs))
+    techs = [
+        tech
+        for graph in controller.database.values()
+        for node in graph.nodes.values()
+        for tech in node.tech.values()
+    ]
+    unique = len({id(tech) for tech in techs})
+    print(f"project: {args.plants} plants, {len(techs)} node technologies, {unique} unique "
+          f"(dedup {len(techs) / unique:.1f}x)")
+
+    controller.database.clear()
+    del techs
+
+    interned, elapsed, memory = measure(Technology.intern, graphs)
+    print(f"interned: {elapsed:6.2f} s  {memory / 2**20:7.1f} MiB")
+    del interned
+
+    copies, elapsed, baseline = measure(Technology.from_dict, graphs)
+    print(f"copies:   {elapsed:6.2f} s  {baseline / 2**20:7.1f} MiB")
+    print(f"saved:    {(baseline - memory) / 2**20:.1f} MiB ({1 - memory / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# Filename: core/graph/arrays.py
+# Module name: core.graph
+# Description: Integer-indexed (COO/CSR) adjacency export of a graph, with igraph conversion for analytics
+
+"""
+Array form of a graph for analytics.
+
+`GraphArrays` numbers the nodes of a graph `0..N-1` (in insertion order) and stores its edges as:
+
+- COO: `source[e]`, `target[e]` (int32) and `euids[e]`
+- CSR: the targets of node `i` are `indices[indptr[i]:indptr[i + 1]]`, and `edges[indptr[i]:indptr[i + 1]]` are the
+  positions of those edges in the COO arrays
+
+Node and edge attribute columns (`node_column`, `edge_column`) are built from node metadata and edge payloads on
+first use. The controller caches one `GraphArrays` per graph and drops it on every mutation.
+
+`to_igraph` converts the index arrays into an `igraph.Graph` in one call, so that topological sorts, cycle detection
+and connectivity checks run in igraph's C core instead of walking the graph's dictionaries in Python.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import typing
+
+# Third-party
+import igraph
+import numpy as np
+
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+
+
+def _column(values: list) -> np.ndarray:
+    """
+    A float column if all values are numbers (or missing), an object column otherwise.
+    """
+
+    if all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values):
+        return np.array(values, dtype=float)
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class GraphArrays:
+    """
+    COO/CSR snapshot of a graph's topology.
+    """
+
+    def __init__(self, graph: GraphController.Graph):
+
+        self._graph = graph
+        self._nodes: dict[str, np.ndarray] = {}
+        self._edges: dict[str, np.ndarray] = {}
+        self._igraph: typing.Optional[igraph.Graph] = None
+
+        self.nuids: list[str] = list(graph.nodes)
+        self.position: dict[str, int] = {nuid: i for i, nuid in enumerate(self.nuids)}
+
+        # Edges hold indices into a node index: the graph's own, but edges built against another index (e.g. copied
+        # from another graph) are remapped through theirs
+        count = len(graph.edges)
+        source = np.empty(count, dtype=np.int64)
+        target = np.empty(count, dtype=np.int64)
+        owner = np.zeros(count, dtype=np.int64)
+        indexes, remaps = {}, []
+
+        for e, edge in enumerate(graph.edges.values()):
+            source[e] = edge.source
+            target[e] = edge.target
+
+            key = id(edge.nodes)
+            if key not in indexes:
+                indexes[key] = len(remaps)
+                remaps.append(np.array([self.position.get(uid, -1) for uid in edge.nodes.uids], dtype=np.int64))
+            owner[e] = indexes[key]
+
+        for code, remap in enumerate(remaps):
+            mask = owner == code
+            source[mask] = remap[source[mask]]
+            target[mask] = remap[target[mask]]
+
+        # Edges to nodes that are not in the graph are left out
+        valid = (source >= 0) & (target >= 0)
+        self.source = source[valid].astype(np.int32)
+        self.target = target[valid].astype(np.int32)
+        self.euids = np.array(list(graph.edges), dtype=object)[valid]
+
+        # CSR, by source node
+        order = np.argsort(self.source, kind="stable")
+        counts = np.bincount(self.source, minlength=len(self.nuids))
+        self.indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.indices = self.target[order]
+        self.edges = order
+
+    def __len__(self) -> int:
+        return len(self.nuids)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of nodes and edges."""
+        return len(self.nuids), len(self.source)
+
+    def successors(self, nuid: str) -> list[str]:
+        i = self.position[nuid]
+        return [self.nuids[j] for j in self.indices[self.indptr[i] : self.indptr[i + 1]].tolist()]
+
+    # Section: Attribute columns
+    # --------------------------
+
+    def node_column(self, key: str) -> np.ndarray:
+        """
+        Metadata values of all nodes, as a float column (NaN where missing) or an object column (None where missing).
+        """
+
+        if key not in self._nodes:
+            self._nodes[key] = _column([self._graph.nodes[nuid].meta.get(key) for nuid in self.nuids])
+
+        return self._nodes[key]
+
+    def edge_column(self, key: str) -> np.ndarray:
+        """
+        Payload values of all edges, as a float or object column.
+        """
+
+        if key not in self._edges:
+            edges = self._graph.edges
+            self._edges[key] = _column([(edges[euid].payload or {}).get(key) for euid in self.euids])
+
+        return self._edges[key]
+
+    # Section: Analytics
+    # ------------------
+
+    def to_igraph(self) -> igraph.Graph:
+        """
+        The graph as a directed `igraph.Graph` (vertex attribute `name`: node UID, edge attribute `uid`: edge UID).
+        Vertex and edge IDs are the node and edge positions of the arrays.
+        """
+
+        if self._igraph is None:
+            graph = igraph.Graph(
+                n=len(self.nuids),
+                edges=list(zip(self.source.tolist(), self.target.tolist())),
+                directed=True,
+            )
+            graph.vs["name"] = self.nuids
+            graph.es["uid"] = self.euids.tolist()
+            self._igraph = graph
+
+        return self._igraph
+
+    def is_acyclic(self) -> bool:
+        return self.to_igraph().is_dag()
+
+    def topological_order(self) -> list[str]:
+        """
+        Node UIDs in topological order.
+
+        :raise ValueError: If the graph has a cycle.
+        """
+
+        graph = self.to_igraph()
+        if not graph.is_dag():
+            raise ValueError("Graph has a cycle")
+
+        return [self.nuids[i] for i in graph.topological_sorting()]
+
+    def feedback_edges(self) -> list[str]:
+        """
+        UIDs of a small (not necessarily minimal) set of edges whose removal leaves the graph acyclic (empty for
+        acyclic graphs).
+        """
+
+        graph = self.to_igraph()
+        if graph.is_dag():
+            return []
+
+        # Eades' heuristic, linear in the number of edges (exact methods are NP-hard)
+        return [self.euids[e] for e in graph.feedback_arc_set(method="eades")]
+
+    def components(self) -> list[list[str]]:
+        """
+        Weakly connected components, as lists of node UIDs, largest first.
+        """
+
+        clusters = self.to_igraph().connected_components(mode="weak")
+        return sorted(([self.nuids[i] for i in cluster] for cluster in clusters), key=len, reverse=True)
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 
 # Standard
+import asyncio
 import logging
+import pathlib
 import typing
 import uuid
 import json
@@ -17,11 +19,24 @@ from dataclasses import field
 from dataclasses import dataclass
 
 
+# Third-party
+import pint
+
+
 # Climact Module(s): core.graph
 from core.graph.node import Node, Technology
-from core.graph.edge import Edge
+from core.graph.edge import Edge, NodeIndex
+from core.graph.evaluator import Evaluator
+from core.graph.search import SearchIndex
+from core.graph.query import Columns, execute
+from core.graph.arrays import GraphArrays
+from core.graph.template import Template
+from core.graph.validator import Validator
 from core.graph.decorators import guid_validator, json_parser
 
+# Climact Module(s): core.models
+from core.models import Plant, PlantImporter
+
 
 class GraphController:
     """
@@ -31,12 +46,35 @@ class GraphController:
     _server = None
     _logger = logging.getLogger("GraphController")
 
+    # Directory that `import_plants` reads from: relative paths are resolved against it, and paths outside it refused
+    data_dir: pathlib.Path = pathlib.Path("data")
+
     @dataclass
     class Graph:
         nodes: typing.Dict[str, Node] = field(default_factory=dict)
         edges: typing.Dict[str, Edge] = field(default_factory=dict)
         conns: typing.Dict[typing.Tuple[str, str], bool] = field(default_factory=dict)
 
+        # Node UID <-> index mapping for edges, which store indices instead of UIDs
+        ids: NodeIndex = field(default_factory=NodeIndex)
+
+        # Adjacency (node UID -> edge UIDs) and evaluated outputs (node UID -> stream -> value)
+        links_in: typing.Dict[str, typing.Set[str]] = field(default_factory=dict)
+        links_out: typing.Dict[str, typing.Set[str]] = field(default_factory=dict)
+        cache: typing.Dict[str, typing.Dict[str, typing.Any]] = field(default_factory=dict)
+
+        # Full-text index over node labels, metadata, streams and parameters
+        index: SearchIndex = field(default_factory=SearchIndex)
+
+        # Columnar quantities for attribute queries, rebuilt on the first query after a change
+        columns: typing.Optional[Columns] = None
+
+        # COO/CSR adjacency export, rebuilt on first use after a change
+        arrays: typing.Optional[GraphArrays] = None
+
+        # Results of the last validation, and the nodes changed since
+        validator: Validator = field(default_factory=Validator)
+
     def __new__(cls):
         if cls._server is None:
             cls._server = super().__new__(cls)
@@ -52,6 +90,14 @@ class GraphController:
         # Global graph database
         self.database: typing.Dict[str, GraphController.Graph] = {}
 
+        # Graph templates (e.g. production pathways), by name
+        self.templates: typing.Dict[str, Template] = {}
+
+        # Search index over the nodes of all graphs, keyed by (guid, nuid), for searches across graphs. Nodes are
+        # deferred into it and indexed on the first such search, so graphs that are only searched one at a time (or
+        # not at all) cost little.
+        self.index = SearchIndex()
+
         self._initialized = True
 
     def _verify_stream_matching(
@@ -113,6 +159,11 @@ class GraphController:
 
         # Store node reference
         self.database[guid].nodes[_nuid] = _node
+        self.database[guid].index.add(_node)
+        self.index.defer(_node, (guid, _nuid))
+        self.database[guid].columns = None
+        self.database[guid].arrays = None
+        self.database[guid].validator.mark(_node.nuid, topology=True)
 
         # Log after creation
         self._logger.info(f"Created node with UID {_nuid}")
@@ -125,6 +176,199 @@ class GraphController:
             },
         }
 
+    async def create_plant_graphs(self, plants: typing.Iterable[Plant]) -> dict:
+        """
+        Create one graph per plant, each with a single node carrying the plant's record as metadata. Nodes are built
+        directly, without the JSON round-trip and per-node logging of `create_graph` and `create_node`, and indexed
+        when their graph is first searched.
+
+        :param plants: Plant records, e.g. the chunks of `core.models.PlantImporter`
+        :return: The GUID and node UID of each plant's graph, by plant ID
+        """
+
+        graphs = {}
+        for plant in plants:
+            meta = plant.to_dict()
+            meta["label"] = meta.pop("name")
+            meta["plant"] = meta.pop("id")
+
+            _guid = uuid.uuid4().hex
+            _nuid = uuid.uuid4().hex
+            _node = Node(nuid=_nuid, meta=meta)
+
+            graph = GraphController.Graph()
+            graph.nodes[_nuid] = _node
+            graph.index.defer(_node)
+            self.index.defer(_node, (_guid, _nuid))
+
+            self.database[_guid] = graph
+            graphs[plant.id] = {"guid": _guid, "nuid": _nuid}
+
+        self._logger.info(f"Created {len(graphs)} plant graph(s)")
+
+        return {
+            "status": "OK",
+            "response": {
+                "count": len(graphs),
+                "graphs": graphs,
+            },
+        }
+
+    async def import_plants(self, path: str) -> dict:
+        """
+        Import a plant table (see `core.models.PlantImporter`) and create one graph per plant with
+        `create_plant_graphs`. The file is read a chunk at a time in a worker thread, so that the event loop keeps
+        serving other requests between chunks.
+
+        :param path: Path of a CSV or Excel file inside `data_dir`, or relative to it
+        :return: The number of rows read and skipped, and the GUID and node UID of each plant's graph, by plant ID
+        """
+
+        root = self.data_dir.resolve()
+        file = (root / path).resolve()
+        if not file.is_relative_to(root):
+            self._logger.warning(f"Refused to import {path}: outside of {root}")
+            return {
+                "status": "FAILED",
+                "reason": f"Could not import {path}: not inside the data directory",
+            }
+
+        loop = asyncio.get_running_loop()
+        importer = PlantImporter()
+        chunks = importer.chunks(file)
+        graphs = {}
+
+        try:
+            while (chunk := await loop.run_in_executor(None, next, chunks, None)) is not None:
+                response = await self.create_plant_graphs(chunk)
+                graphs.update(response["response"]["graphs"])
+
+        except (OSError, ValueError, ImportError) as e:
+            return {
+                "status": "FAILED",
+                "reason": f"Could not import {path}: {e}",
+            }
+
+        finally:
+            chunks.close()
+
+        return {
+            "status": "OK",
+            "response": {
+                "count": len(graphs),
+                "rows": importer.stats.rows,
+                "skipped": importer.stats.skipped,
+                "graphs": graphs,
+            },
+        }
+
+    @json_parser
+    async def create_template(self, name: str, data: dict) -> dict:
+        """
+        Define a graph template (see `core.graph.template`).
+
+        :param name: Template name, e.g. a production pathway
+        :param data: `{"nodes": {...}, "edges": [[source, target], ...]}`
+        """
+
+        if name in self.templates:
+            self._logger.warning(f"Template {name} already exists.")
+            return {
+                "status": "FAILED",
+                "reason": f"Template {name} already exists.",
+            }
+
+        try:
+            template = Template.from_dict(name, data, GraphController.Graph())
+
+        except (pint.errors.PintError, ValueError, KeyError, TypeError) as e:
+            self._logger.warning(f"Invalid template {name}: {e}")
+            return {
+                "status": "FAILED",
+                "reason": f"Invalid template: {e}",
+            }
+
+        self.templates[name] = template
+        self._logger.info(
+            f"Created template {name} with {len(template.graph.nodes)} node(s) and {len(template.graph.edges)} edge(s)"
+        )
+
+        return {
+            "status": "OK",
+            "response": {
+                "name": name,
+                "nodes": list(template.graph.nodes),
+                "edges": {
+                    euid: {"source_uid": edge.source_uid, "target_uid": edge.target_uid}
+                    for euid, edge in template.graph.edges.items()
+                },
+            },
+        }
+
+    @json_parser
+    async def instantiate_template(self, name: str, data: dict) -> dict:
+        """
+        Create one graph per instance of a template. Instances share the template's technologies and keep only their
+        parameter overrides.
+
+        :param name: Template name
+        :param data: `{"instances": [{"guid": ..., "meta": {...}, "parameters": {...}}, ...]}`, or a single instance
+        :return: The GUIDs of the created graphs, in order, and the node UIDs of each by template-local name
+        """
+
+        template = self.templates.get(name)
+        if template is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Template {name} does not exist.",
+            }
+
+        instances = data.get("instances", [data])
+
+        # Resolve every instance before creating any graph
+        resolved = []
+        for position, instance in enumerate(instances):
+            guid = instance.get("guid") or uuid.uuid4().hex
+            if guid in self.database:
+                return {
+                    "status": "FAILED",
+                    "reason": f"Graph with GUID {guid} already exists.",
+                }
+
+            try:
+                resolved.append((guid, instance.get("meta"), template.overrides(instance.get("parameters"))))
+
+            except ValueError as e:
+                return {
+                    "status": "FAILED",
+                    "reason": f"Instance {position}: {e}",
+                }
+
+        recomputed = 0
+        nodes = []
+        for guid, meta, overrides in resolved:
+            graph = GraphController.Graph()
+            uids, roots = template.instantiate(graph, meta, overrides)
+            if roots:
+                recomputed += Evaluator(graph).recompute(roots)
+
+            self.database[guid] = graph
+            nodes.append(uids)
+            for nuid, node in graph.nodes.items():
+                self.index.defer(node, (guid, nuid))
+
+        self._logger.info(f"Instantiated template {name} {len(resolved)} time(s)")
+
+        return {
+            "status": "OK",
+            "response": {
+                "name": name,
+                "graphs": [guid for guid, _, _ in resolved],
+                "nodes": nodes,
+                "recomputed": recomputed,
+            },
+        }
+
     @guid_validator
     @json_parser
     async def create_edge(self, guid: str, data: dict) -> dict:
@@ -162,15 +406,23 @@ class GraphController:
 
         # Create a new edge instance
         _euid = uuid.uuid4().hex
-        _edge = Edge(
-            uid=_euid,
-            source_uid=suid,
-            target_uid=tuid,
+        _edge = Edge.between(
+            _euid,
+            suid,
+            tuid,
+            self.database[guid].ids,
         )
 
         # Store reference and update dictionaries
         self.database[guid].edges[_euid] = _edge
         self.database[guid].conns[(suid, tuid)] = True
+        self.database[guid].links_out.setdefault(suid, set()).add(_euid)
+        self.database[guid].links_in.setdefault(tuid, set()).add(_euid)
+        self.database[guid].arrays = None
+        self.database[guid].validator.mark(suid, tuid, topology=True)
+
+        # The target's inputs may now be fed by the source
+        Evaluator(self.database[guid]).recompute([tuid])
 
         # Log after creation
         self._logger.info(f"Created edge with UID {_euid}")
@@ -200,6 +452,90 @@ class GraphController:
             "response": graph_node.to_dict() if hasattr(graph_node, "to_dict") else {},
         }
 
+    @guid_validator
+    async def send_graph_data(self, guid: str) -> dict:
+
+        graph = self.database[guid]
+        return {
+            "status": "OK",
+            "response": {
+                "guid": guid,
+                "nodes": {nuid: node.to_dict() for nuid, node in graph.nodes.items()},
+                "edges": {
+                    euid: {
+                        "source_uid": edge.source_uid,
+                        "target_uid": edge.target_uid,
+                    }
+                    for euid, edge in graph.edges.items()
+                },
+            },
+        }
+
+    def graph_arrays(self, guid: str) -> GraphArrays:
+        """
+        The COO/CSR form of a graph (see `core.graph.arrays`), cached until the graph changes.
+
+        :raise KeyError: If the graph does not exist.
+        """
+
+        graph = self.database[guid]
+        if graph.arrays is None:
+            graph.arrays = GraphArrays(graph)
+
+        return graph.arrays
+
+    @guid_validator
+    async def send_graph_arrays(self, guid: str) -> dict:
+
+        arrays = self.graph_arrays(guid)
+        return {
+            "status": "OK",
+            "response": {
+                "guid": guid,
+                "nodes": arrays.nuids,
+                "edges": arrays.euids.tolist(),
+                "source": arrays.source.tolist(),
+                "target": arrays.target.tolist(),
+                "indptr": arrays.indptr.tolist(),
+                "indices": arrays.indices.tolist(),
+            },
+        }
+
+    @guid_validator
+    @json_parser
+    async def analyze(self, guid: str, data: dict) -> dict:
+        """
+        Topological order, cycles and connected components of a graph, computed by igraph over its array form.
+
+        :param guid: Graph GUID
+        :param data: `{"checks": [...]}`, a subset of "order", "cycles" and "components" (default: all)
+        """
+
+        checks = data.get("checks", ["order", "cycles", "components"])
+        unknown = set(checks) - {"order", "cycles", "components"}
+        if unknown:
+            return {
+                "status": "FAILED",
+                "reason": f"Unknown check(s): {', '.join(sorted(unknown))}",
+            }
+
+        arrays = self.graph_arrays(guid)
+        response = {"guid": guid, "acyclic": arrays.is_acyclic()}
+
+        if "order" in checks:
+            response["order"] = arrays.topological_order() if response["acyclic"] else None
+
+        if "cycles" in checks:
+            response["feedback_edges"] = arrays.feedback_edges()
+
+        if "components" in checks:
+            response["components"] = arrays.components()
+
+        return {
+            "status": "OK",
+            "response": response,
+        }
+
     @guid_validator
     async def send_edge_data(self, guid: str, euid: str) -> dict:
 
@@ -240,23 +576,195 @@ class GraphController:
                 "reason": f"Node [UID={nuid}] not found.",
             }
 
+        # Rebuild tech from JSON (identical technologies are shared between nodes, and replaced rather than edited).
+        # Every technology is parsed before the node is touched, so that invalid data leaves it unchanged.
+        if "tech" in data:
+            try:
+                techs = {
+                    tech_name: Technology.intern(tech_data)
+                    for tech_name, tech_data in data["tech"].items()
+                }
+
+            except (pint.errors.PintError, ValueError, KeyError, TypeError) as e:
+                self._logger.warning(f"Invalid technology for node [UID={nuid}]: {e}")
+                return {
+                    "status": "FAILED",
+                    "reason": f"Invalid technology: {e}",
+                }
+
+            _node.tech.clear()
+            _node.tech.update(techs)
+
         # Update meta
         if "meta" in data:
             _node.meta.update(data["meta"])
 
-        # Rebuild tech from JSON
+        # Re-index the node's labels, streams and parameters
+        self.database[guid].index.add(_node)
+        self.index.defer(_node, (guid, nuid))
+        self.database[guid].columns = None
+        self.database[guid].arrays = None
+        self.database[guid].validator.mark(_node.nuid)
+
+        # Recompute the edited node and the part of the graph downstream of it
+        recomputed = 0
         if "tech" in data:
-            _node.tech.clear()
-            for tech_name, tech_data in data["tech"].items():
-                _node.tech[tech_name] = Technology.from_dict(tech_data)
+            recomputed = Evaluator(self.database[guid]).recompute([nuid])
 
-        self._logger.info(f"Updated node [UID={nuid}]: {list(_node.tech.keys())}")
+        self._logger.info(
+            f"Updated node [UID={nuid}]: {list(_node.tech.keys())}, recomputed {recomputed} node(s)"
+        )
 
         return {
             "status": "OK",
             "response": {
                 "nuid": nuid,
                 "updated_fields": list(data.keys()),
+                "recomputed": recomputed,
+            },
+        }
+
+    @json_parser
+    async def search(self, guid: str | None, data: dict) -> dict:
+        """
+        Search node labels, metadata, stream and parameter names in one graph (or, if `guid` is None, all graphs).
+        A search across graphs is a single lookup in the controller's own index, not one per graph.
+
+        :param guid: Graph GUID, or None
+        :param data: `{"text": ..., "prefix": bool, "fuzzy": bool, "limit": int | None}` (see `SearchIndex.search`)
+        """
+
+        text = data.get("text", "")
+        if not isinstance(text, str) or not text.strip():
+            return {
+                "status": "FAILED",
+                "reason": "Missing 'text' field.",
+            }
+
+        if guid is not None and guid not in self.database:
+            return {
+                "status": "FAILED",
+                "reason": f"Graph [UID={guid}] does not exist.",
+            }
+
+        limit = data.get("limit", 50)
+        try:
+            limit = None if limit is None else int(limit)
+            if limit is not None and limit < 0:
+                raise ValueError(limit)
+
+        except (TypeError, ValueError):
+            return {
+                "status": "FAILED",
+                "reason": f"Invalid 'limit': {data['limit']!r} (expected a non-negative integer or null)",
+            }
+
+        options = {"prefix": data.get("prefix", True), "fuzzy": data.get("fuzzy", True), "limit": limit}
+        if guid is not None:
+            found = self.database[guid].index.search(text, **options)
+            results = [((guid, nuid), score, fields) for nuid, score, fields in found]
+        else:
+            results = self.index.search(text, **options)
+
+        matches = []
+        for (_guid, nuid), score, fields in results:
+
+            # Graphs and nodes may have been dropped from the database without going through the controller
+            graph = self.database.get(_guid)
+            node = graph.nodes.get(nuid) if graph is not None else None
+            if node is None:
+                self.index.remove((_guid, nuid))
+                continue
+
+            matches.append(
+                {
+                    "guid": _guid,
+                    "nuid": nuid,
+                    "label": node.meta.get("label", ""),
+                    "score": score,
+                    "fields": fields,
+                }
+            )
+
+        return {
+            "status": "OK",
+            "response": {
+                "text": text,
+                "matches": matches,
+            },
+        }
+
+    @guid_validator
+    @json_parser
+    async def query(self, guid: str, data: dict) -> dict:
+        """
+        UIDs of the nodes matching an attribute query (see `core.graph.query`), e.g.
+        `out.Electricity*.CO2_intensity > 0.5 kg/kWh`.
+
+        :param guid: Graph GUID
+        :param data: `{"query": ..., "limit": int}`
+        """
+
+        text = data.get("query", "")
+        if not isinstance(text, str) or not text.strip():
+            return {
+                "status": "FAILED",
+                "reason": "Missing 'query' field.",
+            }
+
+        graph = self.database[guid]
+        if graph.columns is None:
+            graph.columns = Columns(graph)
+
+        try:
+            matches = execute(graph.columns, text)
+
+        except ValueError as e:
+            self._logger.warning(f"Invalid query {text!r}: {e}")
+            return {
+                "status": "FAILED",
+                "reason": f"Invalid query: {e}",
+            }
+
+        limit = data.get("limit")
+        return {
+            "status": "OK",
+            "response": {
+                "query": text,
+                "count": len(matches),
+                "matches": matches[:limit] if limit is not None else matches,
+            },
+        }
+
+    @guid_validator
+    @json_parser
+    async def validate(self, guid: str, data: dict) -> dict:
+        """
+        Validate a whole graph before a solve (see `core.graph.validator`): dangling streams, dimension mismatches
+        across edges, cycles and disconnected components. Only the nodes changed since the last validation are
+        re-checked, unless `full` is set.
+
+        :param guid: Graph GUID
+        :param data: `{"full": bool}`
+        """
+
+        graph = self.database[guid]
+        result = graph.validator.validate(
+            graph,
+            lambda: self.graph_arrays(guid),
+            full=bool(data.get("full", False)),
+        )
+
+        self._logger.info(
+            f"Validated graph [UID={guid}]: {len(result['issues'])} issue(s), "
+            f"checked {result['checked']['nodes']} node(s) and {result['checked']['edges']} edge(s)"
+        )
+
+        return {
+            "status": "OK",
+            "response": {
+                "guid": guid,
+                **result,
             },
         }
 
@@ -270,6 +778,10 @@ def executable() -> typing.Callable:
         "guid": "graph-uuid",
         "data": {...action-specific data...}
     }
+
+    The GUID is optional for "search", which then spans all graphs, and unused by "create_template",
+    "instantiate_template" (`{"name": ..., ...}`) and "import_plants" (`{"path": ...}`, inside
+    `GraphController.data_dir`), which create their own graphs.
     """
     controller = GraphController()
 
@@ -283,6 +795,35 @@ def executable() -> typing.Callable:
             }
 
         guid = data.get("guid")
+
+        # Search may span all graphs
+        if action == "search":
+            return await controller.search(guid, json.dumps(data.get("data", {})))
+
+        # Templates are not bound to a graph, and their instances create their own
+        if action in ("create_template", "instantiate_template"):
+            template = data.get("data", {})
+            name = template.pop("name", None) if isinstance(template, dict) else None
+            if not name:
+                return {
+                    "status": "FAILED",
+                    "reason": "Missing 'name' field.",
+                }
+
+            method = getattr(controller, action)
+            return await method(name, json.dumps(template))
+
+        # Imports create their own graphs
+        if action == "import_plants":
+            path = data.get("data", {}).get("path")
+            if not path:
+                return {
+                    "status": "FAILED",
+                    "reason": "Missing 'path' field.",
+                }
+
+            return await controller.import_plants(path)
+
         if not guid:
             return {
                 "status": "FAILED",
@@ -301,6 +842,21 @@ def executable() -> typing.Callable:
             edge_data = data.get("data", {})
             return await controller.create_edge(guid, json.dumps(edge_data))
 
+        elif action == "query":
+            return await controller.query(guid, json.dumps(data.get("data", {})))
+
+        elif action == "get_graph":
+            return await controller.send_graph_data(guid)
+
+        elif action == "get_arrays":
+            return await controller.send_graph_arrays(guid)
+
+        elif action == "analyze":
+            return await controller.analyze(guid, json.dumps(data.get("data", {})))
+
+        elif action == "validate":
+            return await controller.validate(guid, json.dumps(data.get("data", {})))
+
         elif action == "get_node":
             nuid = data.get("nuid")
             if not nuid:
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 # Standard
+import typing
 from typing import Type, Dict
 
 # Dataclass
@@ -12,13 +13,76 @@ from dataclasses import field
 from dataclasses import dataclass
 
 
-@dataclass
+class NodeIndex:
+    """
+    Mapping between a graph's node UIDs and small integer indices, so that edges store two integers instead of two
+    UID strings. Indices are assigned on first use and never reused.
+    """
+
+    __slots__ = ("_index", "_uids")
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self._uids: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._uids)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._index
+
+    def index(self, uid: str) -> int:
+        """
+        Index of a node UID, assigning the next index to new UIDs.
+        """
+
+        position = self._index.get(uid)
+        if position is None:
+            position = self._index[uid] = len(self._uids)
+            self._uids.append(uid)
+
+        return position
+
+    def uid(self, index: int) -> str:
+        return self._uids[index]
+
+    @property
+    def uids(self) -> list[str]:
+        """Node UIDs, by index."""
+        return self._uids
+
+
+@dataclass(slots=True)
 class Edge:
+    """
+    A directed connection between two nodes, stored as indices into the graph's `NodeIndex`. The node UIDs are
+    available as `source_uid` and `target_uid`.
+    """
 
     uid: str
-    source_uid: str
-    target_uid: str
-    payload: Dict[str, str] = field(default_factory=dict)
+    source: int
+    target: int
+    nodes: NodeIndex = field(repr=False)
+    payload: typing.Optional[Dict[str, str]] = None
+
+    @classmethod
+    def between(
+        cls: Type[Edge],
+        uid: str,
+        source_uid: str,
+        target_uid: str,
+        nodes: NodeIndex,
+        payload: typing.Optional[Dict[str, str]] = None,
+    ) -> Edge:
+        return cls(uid, nodes.index(source_uid), nodes.index(target_uid), nodes, payload or None)
+
+    @property
+    def source_uid(self) -> str:
+        return self.nodes.uid(self.source)
+
+    @property
+    def target_uid(self) -> str:
+        return self.nodes.uid(self.target)
 
     # Hash based on uid
     def __hash__(self) -> int:
@@ -30,16 +94,26 @@ class Edge:
 
         return self.uid == other.uid
 
+    def to_dict(self) -> dict:
+
+        return {
+            "uid": self.uid,
+            "source_uid": self.source_uid,
+            "target_uid": self.target_uid,
+            "payload": dict(self.payload or {}),
+        }
+
     @classmethod
-    def from_dict(cls: Type[Edge], data: dict) -> Edge:
+    def from_dict(cls: Type[Edge], data: dict, nodes: NodeIndex) -> Edge:
 
         source = data.get("source_uid")
         target = data.get("target_uid")
         payload = data.get("payload", {})
 
-        return cls(
+        return cls.between(
             data.get("uid", ""),
             source,
             target,
+            nodes,
             payload=payload,
         )
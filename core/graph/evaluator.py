@@ -0,0 +1,296 @@
+# Filename: core/graph/evaluator.py
+# Module Name: core.graph.evaluator
+# Description: Incremental, dependency-tracked evaluation of node equations.
+
+from __future__ import annotations
+
+
+# Standard
+import ast
+import functools
+import logging
+import typing
+
+
+# Third-party
+import numpy as np
+
+
+# Climact Module(s): core.streams
+from core.streams.quantity import Quantity
+
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+
+
+# Functions that may be used inside `Technology.eqn` expressions
+NAMESPACE = {
+    "__builtins__": {},
+    "abs": np.abs,
+    "exp": np.exp,
+    "log": np.log,
+    "sqrt": np.sqrt,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+
+
+# Syntax allowed in equations: arithmetic over names and constants, and calls to the functions above
+_ALLOWED = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.operator, ast.unaryop)
+
+
+def _check(tree: ast.Expression, source: str) -> None:
+    """
+    Reject everything but arithmetic, so that an equation cannot reach attributes (e.g. `().__class__`), subscripts,
+    lambdas or comprehensions.
+
+    :raise ValueError: If the equation uses any other syntax.
+    """
+
+    for node in ast.walk(tree):
+
+        if isinstance(node, ast.Call):
+            if not (
+                isinstance(node.func, ast.Name)
+                and node.func.id in NAMESPACE
+                and node.func.id != "__builtins__"
+                and not node.keywords
+            ):
+                raise ValueError(f"Invalid call in equation '{source}'")
+
+        elif not isinstance(node, _ALLOWED):
+            raise ValueError(
+                f"Invalid syntax in equation '{source}': {type(node).__name__}"
+            )
+
+        elif isinstance(node, ast.Name) and node.id.startswith("__"):
+            raise ValueError(f"Invalid name in equation '{source}': {node.id}")
+
+
+class Expression:
+    """
+    A compiled `Technology.eqn` entry. The dictionary key names the output stream, and the value is a Python
+    expression over the technology's input streams and parameters, e.g. `{"CO2": "coal * ef * (1 - ccus)"}`.
+
+    Only arithmetic over names and constants, and calls to the functions in `NAMESPACE`, are allowed.
+    """
+
+    __slots__ = ("source", "code", "names")
+
+    def __init__(self, source: str):
+        """
+        :raise ValueError: If the equation is not valid Python, or uses syntax other than arithmetic.
+        """
+
+        try:
+            tree = ast.parse(source, mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid equation '{source}': {e.msg}") from e
+
+        _check(tree, source)
+
+        self.source = source
+        self.code = compile(tree, "<eqn>", "eval")
+        self.names = frozenset(
+            node.id
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Name) and node.id not in NAMESPACE
+        )
+
+    def __call__(self, symbols: dict[str, typing.Any]) -> typing.Any:
+        return eval(self.code, NAMESPACE, symbols)
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_expression(source: str) -> Expression:
+    """
+    Compile an equation string once and share the result between all nodes that use it.
+    """
+
+    return Expression(source)
+
+
+class Evaluator:
+    """
+    Forward evaluation of a graph's node equations with stream-level dependency tracking.
+
+    Evaluated outputs are cached per node in `Graph.cache`. After a node is edited, only the nodes downstream of it
+    that receive a changed stream are recomputed.
+    """
+
+    _logger = logging.getLogger("Evaluator")
+
+    def __init__(self, graph: "GraphController.Graph"):
+        self._graph = graph
+
+    def _resolve_inputs(self, nuid: str) -> dict[str, typing.Any]:
+        """
+        Resolve a node's input streams: upstream outputs override the node's own defaults.
+
+        :param nuid: UID of the node
+        :return: Dictionary of stream names to pint quantities.
+        """
+
+        graph = self._graph
+        node = graph.nodes[nuid]
+
+        symbols = {
+            key: value.quantity
+            for tech in node.tech.values()
+            for key, value in tech.inp.items()
+            if isinstance(value, Quantity)
+        }
+
+        upstream = {}
+        for euid in graph.links_in.get(nuid, ()):
+            edge = graph.edges[euid]
+            for key, value in graph.cache.get(edge.source_uid, {}).items():
+                if key in symbols:
+                    upstream[key] = value if key not in upstream else upstream[key] + value
+
+        symbols.update(upstream)
+        return symbols
+
+    def _evaluate_node(self, nuid: str) -> set[str]:
+        """
+        Evaluate all equations of a node and update the cache.
+
+        :param nuid: UID of the node
+        :return: Set of output streams whose value changed.
+        """
+
+        node = self._graph.nodes[nuid]
+        inputs = self._resolve_inputs(nuid)
+        result = {}
+
+        for tech in node.tech.values():
+
+            symbols = dict(inputs)
+            symbols.update(
+                {
+                    key: value.quantity
+                    for key, value in tech.par.items()
+                    if isinstance(value, Quantity)
+                }
+            )
+
+            for key, source in tech.eqn.items():
+                try:
+                    value = compile_expression(source)(symbols)
+                    if isinstance(declared := tech.out.get(key), Quantity):
+                        value = value.to(declared.units)
+
+                except Exception as e:
+                    self._logger.warning(
+                        f"Equation '{key} = {source}' failed for node [UID={nuid}]: {e}"
+                    )
+                    continue
+
+                result[key] = value if key not in result else result[key] + value
+
+        previous = self._graph.cache.get(nuid, {})
+        changed = {
+            key
+            for key in result.keys() | previous.keys()
+            if not _same(result.get(key), previous.get(key))
+        }
+
+        self._graph.cache[nuid] = result
+        return changed
+
+    def _downstream(self, roots: typing.Iterable[str]) -> list[str]:
+        """
+        Return the nodes reachable from the given roots in topological order (cycles are visited once).
+        """
+
+        graph = self._graph
+        reached = set()
+        pending = list(roots)
+
+        while pending:
+            nuid = pending.pop()
+            if nuid in reached or nuid not in graph.nodes:
+                continue
+
+            reached.add(nuid)
+            pending.extend(
+                graph.edges[euid].target_uid for euid in graph.links_out.get(nuid, ())
+            )
+
+        # Kahn's algorithm over the reached subgraph
+        degree = dict.fromkeys(reached, 0)
+        for nuid in reached:
+            for euid in graph.links_out.get(nuid, ()):
+                target = graph.edges[euid].target_uid
+                if target in degree:
+                    degree[target] += 1
+
+        ordered = [nuid for nuid, count in degree.items() if count == 0]
+        for nuid in ordered:
+            for euid in graph.links_out.get(nuid, ()):
+                target = graph.edges[euid].target_uid
+                degree[target] -= 1
+                if degree[target] == 0:
+                    ordered.append(target)
+
+        # Nodes on a cycle never reach zero in-degree, append them in arbitrary order
+        ordered.extend(nuid for nuid, count in degree.items() if count > 0)
+        return ordered
+
+    def recompute(self, roots: typing.Iterable[str]) -> int:
+        """
+        Recompute the given nodes and every downstream node that receives a changed stream.
+
+        :param roots: UIDs of the nodes whose definition changed
+        :return: The number of nodes that were recomputed.
+        """
+
+        graph = self._graph
+        roots = set(roots)
+        dirty = set(roots)
+        count = 0
+
+        for nuid in self._downstream(roots):
+
+            if nuid not in dirty:
+                continue
+
+            changed = self._evaluate_node(nuid)
+            count += 1
+
+            if not changed:
+                continue
+
+            for euid in graph.links_out.get(nuid, ()):
+                target = graph.nodes.get(graph.edges[euid].target_uid)
+                if target is not None and changed & target.get_inp_streams():
+                    dirty.add(target.nuid)
+
+        return count
+
+    def evaluate(self) -> int:
+        """
+        Evaluate every node in the graph.
+
+        :return: The number of nodes that were evaluated.
+        """
+
+        self._graph.cache.clear()
+        for nuid in self._downstream(self._graph.nodes.keys()):
+            self._evaluate_node(nuid)
+
+        return len(self._graph.nodes)
+
+
+def _same(a: typing.Any, b: typing.Any) -> bool:
+    """Compare two (possibly array-valued) pint quantities."""
+
+    if a is None or b is None:
+        return a is b
+
+    try:
+        return bool(np.array_equal(a.magnitude, b.to(a.units).magnitude))
+
+    except Exception:
+        return False
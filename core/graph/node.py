@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 # Standard Library
+import hashlib
 import logging
+import types
 import typing
 import json
+import weakref
+
 # Dataclass
 from dataclasses import field
 from dataclasses import dataclass
@@ -16,7 +20,11 @@ from dataclasses import dataclass
 from core.streams.quantity import Quantity
 
 
-@dataclass
+# Shared technologies by content digest (see `Technology.intern`), dropped when no node holds them
+_INTERNED: weakref.WeakValueDictionary[str, Technology] = weakref.WeakValueDictionary()
+
+
+@dataclass(slots=True, weakref_slot=True)
 class Technology:
     inp: dict[str, Quantity] = field(default_factory=dict)
     out: dict[str, Quantity] = field(default_factory=dict)
@@ -50,12 +58,40 @@ class Technology:
         eqn = data.get("eqn", {})
 
         return cls(
-            inp={key: value for key, value in inp.items()},
-            out={key: value for key, value in out.items()},
-            par={key: value for key, value in par.items()},
+            inp={key: _as_quantity(value) for key, value in inp.items()},
+            out={key: _as_quantity(value) for key, value in out.items()},
+            par={key: _as_quantity(value) for key, value in par.items()},
             eqn={key: value for key, value in eqn.items()},
         )
 
+    @classmethod
+    def intern(cls, data: dict[str, typing.Any]) -> Technology:
+        """
+        A shared technology for the given dictionary: nodes with identical technologies (e.g. the same blast furnace
+        on 900 plants) hold the same instance. Its dictionaries are read-only, so a node edits its technology by
+        replacing it (copy-on-write, see `thaw`).
+        """
+
+        digest = hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+        tech = _INTERNED.get(digest)
+
+        if tech is None:
+            tech = cls.from_dict(data)
+            tech.inp = types.MappingProxyType(tech.inp)
+            tech.out = types.MappingProxyType(tech.out)
+            tech.par = types.MappingProxyType(tech.par)
+            tech.eqn = types.MappingProxyType(tech.eqn)
+            _INTERNED[digest] = tech
+
+        return tech
+
+    def thaw(self) -> Technology:
+        """
+        An editable copy of the technology, sharing its quantities.
+        """
+
+        return Technology(inp=dict(self.inp), out=dict(self.out), par=dict(self.par), eqn=dict(self.eqn))
+
     def from_json(self, jstr: str) -> Technology:
 
         try:
@@ -66,8 +102,17 @@ class Technology:
             return self.from_dict({})
 
 
+def _as_quantity(value: typing.Any) -> typing.Any:
+    """Deserialize a Quantity dictionary (as produced by `Quantity.to_dict`), pass anything else through."""
+
+    if isinstance(value, dict) and "type" in value:
+        return Quantity.from_dict(value)
+
+    return value
+
+
 # Dataclass
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
 
     nuid: str
@@ -93,9 +138,9 @@ class Node:
     @classmethod
     def from_dict(cls: typing.Type[Node], data: dict[str, typing.Any]) -> Node:
 
-        # Deserialize tech dictionary
+        # Deserialize tech dictionary, sharing identical technologies between nodes
         technology = {
-            key: Technology.from_dict(value)
+            key: Technology.intern(value)
             for key, value in data.get("tech", {}).items()
         }
 
@@ -142,7 +187,7 @@ class Node:
 
         try:
             dictionary = json.loads(jstr)
-            self.tech[branch] = Technology.from_dict(dictionary)
+            self.tech[branch] = Technology.intern(dictionary)
 
         except json.JSONDecodeError as e:
             logging.warning(f"Invalid JSON for set_branch: {e}")
@@ -0,0 +1,494 @@
+# Filename: core/graph/query.py
+# Module Name: core.graph.query
+# Description: Unit-aware attribute queries, evaluated over columnar arrays of a graph's quantities.
+
+"""
+Attribute queries over the nodes of a graph, e.g.
+
+    out.Electricity*.CO2_intensity > 0.5 kg/kWh and meta.state == "Odisha"
+
+Grammar (keywords are case-insensitive):
+
+    query      := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" or_expr ")" | predicate
+    predicate  := path op value
+    path       := ("inp" | "out" | "par") "." stream ["." attribute]  |  "meta" "." key  |  "label"
+    op         := ">" | ">=" | "<" | "<=" | "==" | "!="
+    value      := number [units] | "string"
+
+Stream names are glob patterns (`*` matches any stream), quoted if they contain spaces. Without an attribute, a
+stream path compares the stream's own value. A node matches a stream predicate if any matching stream (or, for
+time profiles, any year) satisfies it.
+
+Queries are compiled once (`compile_query`): thresholds are converted to base units, so evaluating a predicate is a
+single vectorized comparison over a column of base-unit magnitudes (`Columns`). Rows whose dimensionality differs
+from the threshold's never match. A threshold without units compares magnitudes as stored.
+"""
+
+from __future__ import annotations
+
+# Standard
+import abc
+import fnmatch
+import functools
+import operator
+import re
+import typing
+
+# Third-party
+import numpy as np
+
+# Climact Module(s): core.streams
+from core.streams.quantity import Quantity, ureg
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+    from core.graph.search import SearchIndex
+
+
+DIRECTIONS = ("inp", "out", "par")
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"[^"]*")
+      | (?P<op>>=|<=|==|!=|>|<)
+      | (?P<paren>[()])
+      | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<word>(?:[^\s()"<>=!.]+|"[^"]*")(?:\.(?:[^\s()"<>=!.]+|"[^"]*"))*)
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not"}
+
+
+# Section: Columns
+# ----------------
+
+
+class Column:
+    """
+    All values of one attribute (or of the streams themselves) in one direction, one row per value.
+
+    Attributes:
+        rows: Node position (in `Columns.nuids`) of each row.
+        names: Stream name code of each row (into `streams`).
+        streams: Distinct stream names.
+        base: Magnitudes in base units.
+        raw: Magnitudes as stored.
+        dims: Dimensionality code of each row (into `dimensionalities`).
+        dimensionalities: Distinct dimensionalities.
+    """
+
+    __slots__ = ("rows", "names", "streams", "base", "raw", "dims", "dimensionalities")
+
+    def __init__(self, entries: list[tuple[int, str, Quantity]]):
+
+        rows, names, raw, base, dims = [], [], [], [], []
+        stream_codes: dict[str, int] = {}
+        dims_codes: dict[typing.Any, int] = {}
+        conversions: dict[str, tuple[float, float]] = {}
+
+        for position, stream, quantity in entries:
+
+            units = str(quantity.units)
+            if units not in conversions:
+                conversions[units] = _linear_conversion(units)
+
+            scale, offset = conversions[units]
+            magnitude = np.ravel(np.asarray(quantity.value, dtype=float))
+
+            dimensionality = quantity.dimensionality()
+            code = dims_codes.setdefault(dimensionality, len(dims_codes))
+            name = stream_codes.setdefault(stream, len(stream_codes))
+
+            # Profile-backed quantities contribute one row per year
+            count = magnitude.size
+            rows.append(np.full(count, position, dtype=np.int64))
+            names.append(np.full(count, name, dtype=np.int64))
+            dims.append(np.full(count, code, dtype=np.int64))
+            raw.append(magnitude)
+            base.append(magnitude * scale + offset)
+
+        def _concat(arrays, dtype):
+            return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+        self.rows = _concat(rows, np.int64)
+        self.names = _concat(names, np.int64)
+        self.dims = _concat(dims, np.int64)
+        self.raw = _concat(raw, float)
+        self.base = _concat(base, float)
+        self.streams = np.array(list(stream_codes), dtype=object)
+        self.dimensionalities = list(dims_codes)
+
+
+@functools.lru_cache(maxsize=1024)
+def _linear_conversion(units: str) -> tuple[float, float]:
+    """
+    Conversion of magnitudes in `units` to base units, as `(scale, offset)`. Offset units (e.g. degC) have an offset.
+    """
+
+    zero = ureg.Quantity(0.0, units).to_base_units().magnitude
+    one = ureg.Quantity(1.0, units).to_base_units().magnitude
+    return float(one - zero), float(zero)
+
+
+class Columns:
+    """
+    Columnar view of the quantities and metadata of a graph's nodes, built one column at a time on first use.
+    """
+
+    def __init__(self, graph: GraphController.Graph):
+
+        self._graph = graph
+        self._columns: dict[tuple[str, str], Column] = {}
+        self._meta: dict[str, np.ndarray] = {}
+
+        self.nuids = np.array(list(graph.nodes), dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.nuids)
+
+    @property
+    def index(self) -> SearchIndex | None:
+        return getattr(self._graph, "index", None)
+
+    def column(self, direction: str, attribute: str) -> Column:
+        """
+        The column of an attribute in a direction; an empty `attribute` selects the streams' own values.
+        """
+
+        key = (direction, attribute)
+        if key not in self._columns:
+
+            entries = []
+            for position, node in enumerate(self._graph.nodes.values()):
+                for tech in node.tech.values():
+                    for stream, quantity in getattr(tech, direction).items():
+
+                        value = getattr(quantity, attribute, None) if attribute else quantity
+                        if isinstance(value, Quantity):
+                            entries.append((position, stream, value))
+
+            self._columns[key] = Column(entries)
+
+        return self._columns[key]
+
+    def meta(self, key: str) -> np.ndarray:
+        """
+        Metadata values of all nodes (None where missing), as an object array.
+        """
+
+        if key not in self._meta:
+            values = np.empty(len(self.nuids), dtype=object)
+            values[:] = [node.meta.get(key) for node in self._graph.nodes.values()]
+            self._meta[key] = values
+
+        return self._meta[key]
+
+
+# Section: Predicates
+# -------------------
+
+
+class Predicate(abc.ABC):
+    """Base class of compiled query nodes: `evaluate` returns one boolean per node."""
+
+    @abc.abstractmethod
+    def evaluate(self, columns: Columns) -> np.ndarray:
+        """One boolean per node of the columns."""
+
+
+class And(Predicate):
+
+    def __init__(self, *terms: Predicate):
+        self.terms = terms
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+
+        mask = np.ones(len(columns), dtype=bool)
+        for term in self.terms:
+            mask &= term.evaluate(columns)
+            if not mask.any():
+                break
+
+        return mask
+
+
+class Or(Predicate):
+
+    def __init__(self, *terms: Predicate):
+        self.terms = terms
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+
+        mask = np.zeros(len(columns), dtype=bool)
+        for term in self.terms:
+            mask |= term.evaluate(columns)
+
+        return mask
+
+
+class Not(Predicate):
+
+    def __init__(self, term: Predicate):
+        self.term = term
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+        return ~self.term.evaluate(columns)
+
+
+class Compare(Predicate):
+    """
+    Compare a stream value or attribute with a threshold, converted to base units at compile time.
+    """
+
+    def __init__(self, direction: str, stream: str, attribute: str, op: str, value: float, units: str):
+
+        self.direction = direction
+        self.stream = stream
+        self.attribute = attribute
+        self.op = OPERATORS[op]
+
+        if units:
+            threshold = ureg.Quantity(value, units)
+            self.dimensionality = threshold.dimensionality
+            self.threshold = float(threshold.to_base_units().magnitude)
+        else:
+            self.dimensionality = None
+            self.threshold = float(value)
+
+    def _indexed(self, columns: Columns) -> bool:
+        """
+        Whether the search index (if any) has the literal stream and attribute names; if not, nothing can match.
+        """
+
+        index = columns.index
+        if index is None:
+            return True
+
+        from core.graph.search import tokenize
+
+        if self.attribute and not index.nodes(self.attribute, "attr"):
+            return False
+
+        if not any(char in self.stream for char in "*?["):
+            return all(index.nodes(token, self.direction) for token in tokenize(self.stream))
+
+        return True
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+
+        mask = np.zeros(len(columns), dtype=bool)
+        if not self._indexed(columns):
+            return mask
+
+        column = columns.column(self.direction, self.attribute)
+        if not column.rows.size:
+            return mask
+
+        # Rows of matching streams
+        if self.stream == "*":
+            selected = np.ones(column.rows.size, dtype=bool)
+        else:
+            codes = [code for code, name in enumerate(column.streams) if fnmatch.fnmatchcase(name, self.stream)]
+            selected = np.isin(column.names, codes)
+
+        # Rows of the threshold's dimensionality
+        if self.dimensionality is not None:
+            codes = [code for code, dims in enumerate(column.dimensionalities) if dims == self.dimensionality]
+            selected &= np.isin(column.dims, codes)
+            values = column.base
+        else:
+            values = column.raw
+
+        selected &= self.op(values, self.threshold)
+        mask[column.rows[selected]] = True
+        return mask
+
+
+class MetaCompare(Predicate):
+    """
+    Compare a metadata field with a string or a number.
+    """
+
+    def __init__(self, key: str, op: str, value: typing.Any):
+
+        self.key = key
+        self.op = OPERATORS[op]
+        self.value = value
+
+        if isinstance(value, str) and op not in ("==", "!="):
+            raise ValueError(f"Strings can only be compared with == or != (got {op})")
+
+    def evaluate(self, columns: Columns) -> np.ndarray:
+
+        values = columns.meta(self.key)
+
+        if isinstance(self.value, str):
+            return np.fromiter((self.op(value, self.value) for value in values), dtype=bool, count=len(values))
+
+        numeric = np.array(
+            [value if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan for value in values],
+            dtype=float,
+        )
+        with np.errstate(invalid="ignore"):
+            return self.op(numeric, self.value) & ~np.isnan(numeric)
+
+
+# Section: Parser
+# ---------------
+
+
+class _Parser:
+
+    def __init__(self, text: str):
+
+        self._text = text
+        self._tokens: list[tuple[str, str]] = []
+
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"Unexpected character at {position}: {text[position:]!r}")
+
+            kind = match.lastgroup
+            token = match.group(kind)
+            if kind == "word" and token.lower() in _KEYWORDS:
+                kind, token = "keyword", token.lower()
+
+            self._tokens.append((kind, token))
+            position = match.end()
+
+        self._position = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _take(self, kind: str | None = None, token: str | None = None) -> tuple[str, str]:
+
+        current = self._peek()
+        if current is None or (kind and current[0] != kind) or (token and current[1] != token):
+            found = current[1] if current else "end of query"
+            raise ValueError(f"Expected {token or kind} in {self._text!r}, found {found!r}")
+
+        self._position += 1
+        return current
+
+    def _at(self, kind: str, token: str | None = None) -> bool:
+        current = self._peek()
+        return current is not None and current[0] == kind and (token is None or current[1] == token)
+
+    def parse(self) -> Predicate:
+
+        if not self._tokens:
+            raise ValueError("Empty query")
+
+        predicate = self._or()
+        if self._peek() is not None:
+            raise ValueError(f"Unexpected {self._peek()[1]!r} in {self._text!r}")
+
+        return predicate
+
+    def _or(self) -> Predicate:
+
+        terms = [self._and()]
+        while self._at("keyword", "or"):
+            self._take()
+            terms.append(self._and())
+
+        return terms[0] if len(terms) == 1 else Or(*terms)
+
+    def _and(self) -> Predicate:
+
+        terms = [self._not()]
+        while self._at("keyword", "and"):
+            self._take()
+            terms.append(self._not())
+
+        return terms[0] if len(terms) == 1 else And(*terms)
+
+    def _not(self) -> Predicate:
+
+        if self._at("keyword", "not"):
+            self._take()
+            return Not(self._not())
+
+        if self._at("paren", "("):
+            self._take()
+            predicate = self._or()
+            self._take("paren", ")")
+            return predicate
+
+        return self._predicate()
+
+    def _predicate(self) -> Predicate:
+
+        path = _split_path(self._take("word")[1])
+        op = self._take("op")[1]
+
+        # Value: a string, or a number followed by optional units
+        if self._at("string"):
+            value = self._take()[1][1:-1]
+            units = ""
+        else:
+            value = float(self._take("number")[1])
+            parts = []
+            while self._at("word") or self._at("number"):
+                parts.append(self._take()[1])
+            units = " ".join(parts)
+
+        head = path[0].lower()
+        if head == "label" and len(path) == 1:
+            return MetaCompare("label", op, value)
+
+        if head == "meta" and len(path) == 2:
+            return MetaCompare(path[1], op, value)
+
+        if head in DIRECTIONS and len(path) in (2, 3):
+            if isinstance(value, str):
+                raise ValueError(f"Stream values must be compared with numbers: {'.'.join(path)}")
+
+            try:
+                return Compare(head, path[1], path[2] if len(path) == 3 else "", op, value, units)
+            except Exception as error:
+                raise ValueError(f"Invalid units {units!r}: {error}") from error
+
+        raise ValueError(f"Invalid path {'.'.join(path)!r}: expected inp|out|par.<stream>[.<attribute>] or meta.<key>")
+
+
+def _split_path(word: str) -> list[str]:
+    """Split a dotted path, keeping quoted parts whole."""
+    return [part.strip('"') for part in re.findall(r'"[^"]*"|[^.]+', word)]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_query(text: str) -> Predicate:
+    """
+    Compile a query once; raises ValueError if it is malformed.
+    """
+
+    return _Parser(text).parse()
+
+
+def execute(columns: Columns, text: str) -> list[str]:
+    """
+    UIDs of the nodes matching a query.
+    """
+
+    mask = compile_query(text).evaluate(columns)
+    return columns.nuids[mask].tolist()
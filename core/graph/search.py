@@ -0,0 +1,272 @@
+# Filename: core/graph/search.py
+# Module name: core.graph
+# Description: In-memory inverted index over node labels, metadata, streams and parameters
+
+"""
+Full-text search over the nodes of a graph.
+
+`SearchIndex` maps tokens to the nodes (and fields) they occur in. It is updated per node (`add`, `remove`), so the
+controller keeps it current on every create and update instead of rebuilding it. Nodes are keyed by their UID, or by
+any other key given on `add`: the controller also keeps one index over all graphs, keyed by `(guid, nuid)`, so that
+a search across thousands of plant graphs is a single lookup. Indexed fields:
+
+- `label`: the node's label (`meta["label"]`)
+- `meta`: other string metadata
+- `tech`: technology names
+- `inp`, `out`: consumed and produced stream names
+- `par`: parameter names
+- `attr`: attribute names of streams and parameters (e.g. `CO2_emissions` on a Fuel stream)
+
+Queries are whitespace-separated terms, all of which must match. A term may be scoped to a field (`inp:fuel`), and
+matches a token exactly, by prefix, or within one edit (fuzzy). For example, `inp:fuel attr:co2_emissions` finds the
+nodes that consume a fuel stream with a CO2 emissions attribute.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import bisect
+import re
+import typing
+
+# Climact Module(s): core.graph, core.streams
+from core.graph.node import Node
+from core.streams.quantity import Quantity
+
+
+FIELDS = ("label", "meta", "tech", "inp", "out", "par", "attr")
+
+# Scores of exact, prefix and fuzzy matches
+EXACT, PREFIX, FUZZY = 3.0, 2.0, 1.0
+
+_WORD = re.compile(r"\w+")
+_PART = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> set[str]:
+    """
+    Lower-case tokens of a text: each word, and the parts of words joined by underscores (`co2_emissions` gives
+    `co2_emissions`, `co2` and `emissions`).
+    """
+
+    text = text.lower()
+    return set(_WORD.findall(text)) | set(_PART.findall(text))
+
+
+def _deletes(token: str) -> set[str]:
+    """Variants of a token with one character deleted."""
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+class SearchIndex:
+    """
+    Inverted index over the nodes of one graph (keyed by node UID), or of several (keyed by `(guid, nuid)`).
+    """
+
+    def __init__(self, min_fuzzy: int = 4):
+        """
+        :param min_fuzzy: Minimum length of query terms that are matched fuzzily
+        """
+
+        self._min_fuzzy = min_fuzzy
+
+        # Token -> node key -> fields the token occurs in
+        self._postings: dict[str, dict[typing.Hashable, set[str]]] = {}
+
+        # Node key -> its (token, field) pairs, for removal
+        self._entries: dict[typing.Hashable, set[tuple[str, str]]] = {}
+
+        # Sorted tokens (prefix search) and one-deletion variants (fuzzy search)
+        self._tokens: list[str] = []
+        self._variants: dict[str, set[str]] = {}
+
+        # Nodes to index on the next query, by key (see `defer`)
+        self._pending: dict[typing.Hashable, Node] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pending)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._entries or key in self._pending
+
+    # Section: Updates
+    # ----------------
+
+    @staticmethod
+    def fields(node: Node) -> typing.Iterator[tuple[str, str]]:
+        """
+        The indexed `(field, text)` pairs of a node.
+        """
+
+        for key, value in node.meta.items():
+            if isinstance(value, str):
+                yield ("label" if key == "label" else "meta"), value
+
+        for name, tech in node.tech.items():
+            yield "tech", name
+
+            for field, streams in (("inp", tech.inp), ("out", tech.out), ("par", tech.par)):
+                for stream, quantity in streams.items():
+                    yield field, stream
+
+                    for attr, value in getattr(quantity, "__dict__", {}).items():
+                        if isinstance(value, Quantity):
+                            yield "attr", attr
+
+    def add(self, node: Node, key: typing.Hashable = None) -> None:
+        """
+        Index a node, replacing its previous entries.
+
+        :param node: The node
+        :param key: The node's key in the index (default: its UID)
+        """
+
+        key = node.nuid if key is None else key
+        self.remove(key)
+
+        entries = {(token, field) for field, text in self.fields(node) for token in tokenize(text)}
+        for token, field in entries:
+
+            if token not in self._postings:
+                self._postings[token] = {}
+                bisect.insort(self._tokens, token)
+                for variant in _deletes(token) | {token}:
+                    self._variants.setdefault(variant, set()).add(token)
+
+            self._postings[token].setdefault(key, set()).add(field)
+
+        self._entries[key] = entries
+
+    def defer(self, node: Node, key: typing.Hashable = None) -> None:
+        """
+        Index a node on the next query instead of now, for bulk creation of graphs that may never be searched.
+        """
+
+        self._pending[node.nuid if key is None else key] = node
+
+    def _flush(self) -> None:
+        while self._pending:
+            key, node = next(iter(self._pending.items()))
+            self.add(node, key)
+
+    def remove(self, key: typing.Hashable) -> None:
+        """
+        Remove a node from the index.
+        """
+
+        self._pending.pop(key, None)
+        for token, _ in self._entries.pop(key, ()):
+
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+
+            posting.pop(key, None)
+            if posting:
+                continue
+
+            # Last occurrence of the token
+            del self._postings[token]
+            del self._tokens[bisect.bisect_left(self._tokens, token)]
+            for variant in _deletes(token) | {token}:
+                tokens = self._variants.get(variant)
+                if tokens is not None:
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._variants[variant]
+
+    # Section: Queries
+    # ----------------
+
+    def _matches(self, term: str, prefix: bool, fuzzy: bool) -> dict[str, float]:
+        """
+        Tokens matching a query term, with their score.
+        """
+
+        matches: dict[str, float] = {}
+
+        if fuzzy and len(term) >= self._min_fuzzy:
+            candidates = set(self._variants.get(term, ()))
+            for variant in _deletes(term):
+                candidates |= self._variants.get(variant, set())
+
+            matches.update((token, FUZZY) for token in candidates)
+
+        if prefix:
+            start = bisect.bisect_left(self._tokens, term)
+            for token in self._tokens[start:]:
+                if not token.startswith(term):
+                    break
+
+                matches[token] = PREFIX
+
+        if term in self._postings:
+            matches[term] = EXACT
+
+        return matches
+
+    def search(
+        self,
+        text: str,
+        prefix: bool = True,
+        fuzzy: bool = True,
+        limit: int | None = None,
+    ) -> list[tuple[str, float, list[str]]]:
+        """
+        Find the nodes matching all terms of a query.
+
+        :param text: Whitespace-separated terms, optionally scoped to a field (`field:term`)
+        :param prefix: Match terms as prefixes of tokens
+        :param fuzzy: Match terms within one edit of tokens
+        :param limit: Maximum number of results
+        :return: `(key, score, fields)` tuples, best first, where `fields` are the fields that matched.
+        """
+
+        self._flush()
+
+        results: dict[str, float] | None = None
+        matched: dict[str, set[str]] = {}
+
+        for word in text.split():
+
+            field, _, term = word.rpartition(":")
+            field = field.lower()
+            if field and field not in FIELDS:
+                field, term = "", word
+
+            scores: dict[str, float] = {}
+            for part in tokenize(term) if "_" not in term else {term.lower()}:
+                for token, score in self._matches(part, prefix, fuzzy).items():
+                    for nuid, fields in self._postings[token].items():
+                        if field and field not in fields:
+                            continue
+
+                        if score > scores.get(nuid, 0.0):
+                            scores[nuid] = score
+
+                        matched.setdefault(nuid, set()).update([field] if field else fields)
+
+            # All terms must match
+            if results is None:
+                results = scores
+            else:
+                results = {nuid: score + scores[nuid] for nuid, score in results.items() if nuid in scores}
+
+            if not results:
+                return []
+
+        ranked = sorted((results or {}).items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        return [(nuid, score, sorted(matched[nuid])) for nuid, score in ranked]
+
+    def nodes(self, token: str, field: str | None = None) -> set[str]:
+        """
+        UIDs of the nodes containing an exact token (optionally, in a given field).
+        """
+
+        self._flush()
+
+        posting = self._postings.get(token.lower(), {})
+        return {nuid for nuid, fields in posting.items() if field is None or field in fields}
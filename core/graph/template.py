@@ -0,0 +1,202 @@
+# Filename: core/graph/template.py
+# Module name: core.graph
+# Description: Reusable graph templates (e.g. a BF-BOF pathway) instantiated once per plant
+
+"""
+Templates of production pathways, instantiated into per-plant graphs.
+
+A template is defined once, as nodes (keyed by a template-local name) and edges between them:
+
+    {
+        "nodes": {
+            "blast_furnace": {"meta": {"label": "Blast Furnace"}, "tech": {"default": {...}}},
+            "ccus": {"meta": {"label": "CCUS"}, "tech": {"default": {...}}}
+        },
+        "edges": [["blast_furnace", "ccus"]]
+    }
+
+Edges are checked for matching streams, and the template's equations are evaluated, once, when the template is
+created. Each instance gets fresh node and edge UIDs, like any other graph, and keeps the template-local name of each
+node in its metadata (`meta["template_node"]`). Instances share the template's (interned, read-only) `Technology`
+objects and evaluated outputs; an instance only holds its own nodes, edges and adjacency. Technologies with
+overridden parameters are interned too, so instances with the same overrides share them as well.
+
+Parameter overrides are keyed by `<node>.<parameter>` (all technologies of the node) or `<node>.<tech>.<parameter>`,
+and given as a quantity dictionary or as a magnitude in the template parameter's units. Keys that do not start with
+a template node are not template parameters and are ignored, so a plant's free-form parameters can be passed as-is.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import copy
+import typing
+import uuid
+
+# Climact Module(s): core.graph, core.streams
+from core.graph.node import Node, Technology
+from core.graph.edge import Edge
+from core.graph.evaluator import Evaluator
+from core.streams.quantity import Quantity
+
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+
+
+# Node -> technology name -> technology with overridden parameters
+Overrides = typing.Dict[str, typing.Dict[str, Technology]]
+
+
+class Template:
+    """
+    A graph template and its evaluated prototype.
+    """
+
+    def __init__(self, name: str, graph: "GraphController.Graph"):
+        """
+        :param name: Template name, e.g. the pathway ("BF-BOF")
+        :param graph: Evaluated prototype graph, whose node UIDs are the template's node names
+        """
+
+        self.name = name
+        self.graph = graph
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict[str, typing.Any], graph: "GraphController.Graph") -> Template:
+        """
+        Build and evaluate a template.
+
+        :param name: Template name
+        :param data: `{"nodes": {name: {"meta": ..., "tech": ...}}, "edges": [[source, target], ...]}`
+        :param graph: An empty graph to hold the prototype
+        :raise ValueError: If an edge refers to an unknown node or its nodes share no stream.
+        """
+
+        for key, value in data.get("nodes", {}).items():
+            graph.nodes[key] = Node(
+                nuid=key,
+                meta=dict(value.get("meta", {})),
+                tech={tech: Technology.intern(item) for tech, item in value.get("tech", {}).items()},
+            )
+
+        for source, target in data.get("edges", []):
+            if source not in graph.nodes or target not in graph.nodes:
+                raise ValueError(f"Edge {source} -> {target} refers to an unknown node")
+
+            if source == target or (source, target) in graph.conns:
+                raise ValueError(f"Edge {source} -> {target} is a self-loop or a duplicate")
+
+            if not graph.nodes[source].get_out_streams() & graph.nodes[target].get_inp_streams():
+                raise ValueError(f"Edge {source} -> {target} has no matching stream")
+
+            euid = f"{source}:{target}"
+            graph.edges[euid] = Edge.between(euid, source, target, graph.ids)
+            graph.conns[(source, target)] = True
+            graph.links_out.setdefault(source, set()).add(euid)
+            graph.links_in.setdefault(target, set()).add(euid)
+
+        Evaluator(graph).evaluate()
+        return cls(name, graph)
+
+    def overrides(self, parameters: typing.Optional[dict[str, typing.Any]]) -> Overrides:
+        """
+        Resolve parameter overrides into (interned) copies of the affected technologies.
+
+        :raise ValueError: If a parameter of a template node does not exist or has incompatible units.
+        """
+
+        result: Overrides = {}
+        for key, value in (parameters or {}).items():
+
+            parts = key.split(".")
+            node = self.graph.nodes.get(parts[0])
+            if node is None or len(parts) not in (2, 3):
+                continue
+
+            names = [parts[1]] if len(parts) == 3 else list(node.tech)
+            matched = False
+
+            for name in names:
+                tech = result.get(node.nuid, {}).get(name) or node.tech.get(name)
+                if tech is None or parts[-1] not in tech.par:
+                    continue
+
+                edited = tech.thaw()
+                edited.par[parts[-1]] = _override(tech.par[parts[-1]], value, key)
+                result.setdefault(node.nuid, {})[name] = Technology.intern(edited.to_dict())
+                matched = True
+
+            if not matched:
+                raise ValueError(f"Template '{self.name}' has no parameter '{key}'")
+
+        return result
+
+    def instantiate(
+        self,
+        graph: "GraphController.Graph",
+        meta: typing.Optional[dict[str, typing.Any]] = None,
+        overrides: typing.Optional[Overrides] = None,
+    ) -> tuple[dict[str, str], list[str]]:
+        """
+        Populate an empty graph with an instance of the template, with a new UID for every node and edge.
+
+        :param graph: The graph to populate
+        :param meta: Metadata added to every node (e.g. the plant's ID)
+        :param overrides: Resolved parameter overrides (see `overrides`)
+        :return: The instance's node UIDs by template-local name, and the UIDs of the nodes with overridden
+            parameters, which must be recomputed.
+        """
+
+        overrides = overrides or {}
+        uids = {key: uuid.uuid4().hex for key in self.graph.nodes}
+
+        for key, prototype in self.graph.nodes.items():
+
+            tech = dict(prototype.tech)
+            tech.update(overrides.get(key, {}))
+
+            nuid = uids[key]
+            node = Node(nuid=nuid, meta={**prototype.meta, **(meta or {}), "template_node": key}, tech=tech)
+            graph.nodes[nuid] = node
+            graph.index.defer(node)
+
+        for edge in self.graph.edges.values():
+            source, target = uids[edge.source_uid], uids[edge.target_uid]
+            euid = uuid.uuid4().hex
+
+            graph.edges[euid] = Edge.between(euid, source, target, graph.ids, dict(edge.payload or {}))
+            graph.conns[(source, target)] = True
+            graph.links_out.setdefault(source, set()).add(euid)
+            graph.links_in.setdefault(target, set()).add(euid)
+
+        # Evaluated outputs are replaced (not modified) on recomputation, so they can be shared
+        graph.cache.update((uids[key], outputs) for key, outputs in self.graph.cache.items())
+
+        return uids, [uids[key] for key in overrides]
+
+
+def _override(default: typing.Any, value: typing.Any, key: str) -> typing.Any:
+    """
+    A parameter value from a quantity dictionary, or from a magnitude in the units of the template's value.
+    """
+
+    if isinstance(value, dict) and "type" in value:
+        try:
+            quantity = Quantity.from_dict(value)
+        except Exception as e:
+            raise ValueError(f"Invalid value for parameter '{key}': {e}") from e
+
+        if isinstance(default, Quantity) and quantity.dimensionality() != default.dimensionality():
+            raise ValueError(f"Parameter '{key}' must have the dimensions of {default.units}")
+        return quantity
+
+    if isinstance(default, Quantity):
+        quantity = copy.copy(default)
+        try:
+            quantity.value = value
+        except Exception as e:
+            raise ValueError(f"Invalid value for parameter '{key}': {e}") from e
+        return quantity
+
+    return value
@@ -0,0 +1,235 @@
+# Filename: core/graph/validator.py
+# Module name: core.graph
+# Description: Whole-graph validation (dangling streams, unit mismatches, cycles, components), updated incrementally
+
+"""
+Validation of a graph before it is solved.
+
+Issues found by `Validator.validate`:
+
+- `unmatched_input` (warning): an input stream that no upstream node produces
+- `unconsumed_output` (warning): an output stream that no downstream node consumes
+- `dimension_mismatch` (error): an edge carrying a stream whose quantities have different dimensions on either end,
+  e.g. `MassFlowRate` out of the source and `EnergyFlowRate` into the target
+- `cycle` (warning): the graph is not acyclic; lists a set of edges whose removal would make it so
+- `disconnected` (warning): the graph has more than one (weakly) connected component
+
+The first validation checks every node and edge, in time linear in the size of the graph. The controller then marks
+the nodes it changes (`mark`), and the next validation only re-checks those nodes, their neighbours and their edges,
+keeping the other results. Cycles and components are taken from the graph's `GraphArrays`, and recomputed only when
+a node or an edge was added (`mark(..., topology=True)`), so editing a node's data does not export the graph again.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import typing
+
+# Climact Module(s): core.graph, core.streams
+from core.graph.arrays import GraphArrays
+from core.streams.quantity import Quantity
+
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+
+
+Issue = dict[str, typing.Any]
+
+
+def _key(issue: Issue) -> tuple:
+    return issue["kind"], issue.get("nuid"), issue.get("euid"), issue.get("stream")
+
+
+class Validator:
+    """
+    Validation results of one graph, kept between validations.
+    """
+
+    def __init__(self):
+
+        self._nodes: dict[str, list[Issue]] = {}
+        self._edges: dict[str, list[Issue]] = {}
+        self._graph: list[Issue] = []
+
+        # Nodes changed since the last validation (None before the first one), and whether nodes or edges were added
+        self._dirty: typing.Optional[set[str]] = None
+        self._topology = True
+
+    def mark(self, *nuids: str, topology: bool = False) -> None:
+        """
+        Mark nodes as changed (new, edited, or with a new edge).
+
+        :param nuids: UIDs of the changed nodes
+        :param topology: Whether nodes or edges were added
+        """
+
+        if self._dirty is not None:
+            self._dirty.update(nuids)
+
+        self._topology = self._topology or topology
+
+    # Section: Checks
+    # ---------------
+
+    @staticmethod
+    def _check_node(graph: GraphController.Graph, nuid: str) -> list[Issue]:
+
+        node = graph.nodes[nuid]
+        supplied, consumed = set(), set()
+
+        for euid in graph.links_in.get(nuid, ()):
+            source = graph.nodes.get(graph.edges[euid].source_uid)
+            if source is not None:
+                supplied |= source.get_out_streams()
+
+        for euid in graph.links_out.get(nuid, ()):
+            target = graph.nodes.get(graph.edges[euid].target_uid)
+            if target is not None:
+                consumed |= target.get_inp_streams()
+
+        issues = [
+            {"kind": "unmatched_input", "severity": "warning", "nuid": nuid, "stream": stream}
+            for stream in sorted(node.get_inp_streams() - supplied)
+        ]
+        issues.extend(
+            {"kind": "unconsumed_output", "severity": "warning", "nuid": nuid, "stream": stream}
+            for stream in sorted(node.get_out_streams() - consumed)
+        )
+        return issues
+
+    @staticmethod
+    def _check_edge(graph: GraphController.Graph, euid: str) -> list[Issue]:
+
+        edge = graph.edges[euid]
+        source = graph.nodes.get(edge.source_uid)
+        target = graph.nodes.get(edge.target_uid)
+        if source is None or target is None:
+            return []
+
+        issues = []
+        for stream in sorted(source.get_out_streams() & target.get_inp_streams()):
+
+            produced = [tech.out[stream] for tech in source.tech.values() if isinstance(tech.out.get(stream), Quantity)]
+            received = [tech.inp[stream] for tech in target.tech.values() if isinstance(tech.inp.get(stream), Quantity)]
+
+            mismatch = next(
+                ((a, b) for a in produced for b in received if a.dimensionality() != b.dimensionality()),
+                None,
+            )
+            if mismatch is not None:
+                issues.append(
+                    {
+                        "kind": "dimension_mismatch",
+                        "severity": "error",
+                        "euid": euid,
+                        "stream": stream,
+                        "source_units": str(mismatch[0].units),
+                        "target_units": str(mismatch[1].units),
+                    }
+                )
+
+        return issues
+
+    @staticmethod
+    def _check_graph(arrays: GraphArrays) -> list[Issue]:
+
+        issues = []
+        if not arrays.is_acyclic():
+            issues.append({"kind": "cycle", "severity": "warning", "edges": arrays.feedback_edges()})
+
+        components = arrays.components()
+        if len(components) > 1:
+            issues.append({"kind": "disconnected", "severity": "warning", "components": components})
+
+        return issues
+
+    # Section: Validation
+    # -------------------
+
+    def validate(
+        self,
+        graph: GraphController.Graph,
+        arrays: typing.Callable[[], GraphArrays],
+        full: bool = False,
+    ) -> dict[str, typing.Any]:
+        """
+        Validate a graph, re-checking only what changed since the last validation (unless `full`).
+
+        :param graph: The graph
+        :param arrays: Returns the graph's current array form (called only if cycles and components are re-checked)
+        :param full: Re-check every node and edge
+        :return: `{"valid", "issues", "added", "resolved", "checked"}`, where `valid` means no errors, and `added` and
+            `resolved` are the issues that appeared and disappeared since the last validation.
+        """
+
+        full = full or self._dirty is None
+        topology = full or self._topology
+        if full:
+            nodes, edges = set(graph.nodes), set(graph.edges)
+
+        else:
+            # A node's dangling streams depend on its neighbours, an edge's units on its two ends
+            nodes, edges = set(), set()
+            for nuid in self._dirty:
+                nodes.add(nuid)
+                for euid in graph.links_in.get(nuid, ()):
+                    edges.add(euid)
+                    nodes.add(graph.edges[euid].source_uid)
+                for euid in graph.links_out.get(nuid, ()):
+                    edges.add(euid)
+                    nodes.add(graph.edges[euid].target_uid)
+
+        # Issues of the parts that are re-checked, to report what changed
+        before = [*(self._graph if topology else ())]
+        if full:
+            before = self.issues()
+            self._nodes.clear()
+            self._edges.clear()
+        else:
+            before.extend(issue for nuid in nodes for issue in self._nodes.get(nuid, ()))
+            before.extend(issue for euid in edges for issue in self._edges.get(euid, ()))
+
+        after = []
+        for nuid in nodes:
+            if nuid in graph.nodes:
+                self._nodes[nuid] = self._check_node(graph, nuid)
+                after.extend(self._nodes[nuid])
+            else:
+                self._nodes.pop(nuid, None)
+
+        for euid in edges:
+            if euid in graph.edges:
+                self._edges[euid] = self._check_edge(graph, euid)
+                after.extend(self._edges[euid])
+            else:
+                self._edges.pop(euid, None)
+
+        if topology:
+            self._graph = self._check_graph(arrays())
+            after.extend(self._graph)
+
+        self._dirty = set()
+        self._topology = False
+
+        issues = self.issues()
+        before = {_key(issue): issue for issue in before}
+        after = {_key(issue): issue for issue in after}
+        return {
+            "valid": not any(issue["severity"] == "error" for issue in issues),
+            "issues": issues,
+            "added": [issue for key, issue in after.items() if key not in before or before[key] != issue],
+            "resolved": [issue for key, issue in before.items() if key not in after],
+            "checked": {"nodes": len(nodes), "edges": len(edges), "full": full},
+        }
+
+    def issues(self) -> list[Issue]:
+        """
+        The issues found by the last validation (graph-wide issues first).
+        """
+
+        return [
+            *self._graph,
+            *(issue for issues in self._nodes.values() for issue in issues),
+            *(issue for issues in self._edges.values() for issue in issues),
+        ]
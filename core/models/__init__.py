@@ -0,0 +1,11 @@
+# Filename: __init__.py
+# Module name: core.models
+# Description: Data models for plant fleets
+
+from __future__ import annotations
+
+# Climact Module(s): core.models
+from core.models.plant import Plant
+from core.models.importer import PlantImporter
+
+__all__ = ["Plant", "PlantImporter"]
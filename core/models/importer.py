@@ -0,0 +1,345 @@
+# Filename: core/models/importer.py
+# Module name: core.models
+# Description: Streaming reader for plant tables (CSV or Excel) with per-column unit conversion
+
+"""
+Reads plant tables in chunks of rows and yields `Plant` records.
+
+Columns are matched to `Plant` fields by name (case-insensitive, with common aliases such as `latitude` or
+`capacity`). A header may state the column's units in brackets, e.g. `Capacity [kt/day]` or `Capacity (Mt/yr)`;
+unit columns are checked against the field's units once, when the header is read, and each chunk is converted with
+one vectorized operation per column. Columns that are not `Plant` fields become plant parameters: numeric columns
+with units are stored as quantities (`{"type": "Quantity", "value": ..., "units": ...}`), others as numbers or text.
+
+Rows without a valid latitude or longitude are skipped and counted in `PlantImporter.Stats`.
+
+Excel files (`.xlsx`, `.xlsm`) are read with `openpyxl` in read-only mode, which must be installed.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import csv
+import itertools
+import logging
+import math
+import pathlib
+import re
+import time
+import typing
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+# Third-party
+import numpy as np
+
+# Climact Module(s): core.models, core.streams
+from core.models.plant import Plant
+from core.streams.quantity import ureg
+
+
+# Field -> accepted column names
+ALIASES: dict[str, tuple[str, ...]] = {
+    "id": ("id", "plant_id", "uid"),
+    "name": ("name", "plant", "plant_name"),
+    "state": ("state", "region", "province"),
+    "lat": ("lat", "latitude"),
+    "lon": ("lon", "lng", "long", "longitude"),
+    "capacity_mtpa": ("capacity_mtpa", "capacity", "capacity_mt"),
+    "pathway": ("pathway", "route", "process"),
+    "year_commissioned": ("year_commissioned", "commissioned", "year"),
+}
+
+# Units of the numeric fields (columns without units in their header are assumed to be in these)
+UNITS: dict[str, str] = {
+    "lat": "degree",
+    "lon": "degree",
+    "capacity_mtpa": "Mt/yr",
+}
+
+_NUMERIC = ("lat", "lon", "capacity_mtpa", "year_commissioned")
+_HEADER = re.compile(r"^(.*?)\s*[\[(]\s*([^\])]*?)\s*[\])]\s*$")
+
+
+def _conversion(source: str, target: str) -> tuple[float, float]:
+    """
+    Conversion of magnitudes from `source` to `target` units, as `(scale, offset)`.
+
+    :raise ValueError: If the units are undefined or of different dimensions.
+    """
+
+    try:
+        dimensions = ureg.parse_units(source).dimensionality, ureg.parse_units(target).dimensionality
+    except Exception as e:
+        raise ValueError(f"Invalid units '{source}': {e}") from e
+
+    if dimensions[0] != dimensions[1]:
+        raise ValueError(f"'{source}' cannot be converted to '{target}'")
+
+    zero = ureg.Quantity(0.0, source).to(target).magnitude
+    one = ureg.Quantity(1.0, source).to(target).magnitude
+    return float(one - zero), float(zero)
+
+
+def _floats(values: typing.Sequence) -> np.ndarray:
+    """
+    A column of cells as floats, with blank or malformed cells as NaN.
+    """
+
+    array = np.asarray(values)
+    if array.dtype.kind in "US":
+        array = np.where(np.char.str_len(np.char.strip(array)) == 0, "nan", array)
+
+    try:
+        return array.astype(float)
+
+    # Malformed cells: parse the column cell by cell
+    except (TypeError, ValueError):
+        pass
+
+    def _float(value) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+    return np.fromiter((_float(value) for value in values), dtype=float, count=len(values))
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+class PlantImporter:
+    """
+    Streaming importer of plant tables.
+    """
+
+    _logger = logging.getLogger("PlantImporter")
+
+    @dataclass(frozen=True)
+    class Options:
+        chunk_size: int = 10_000
+        delimiter: str = ","
+        sheet: typing.Optional[str] = None
+        units: typing.Dict[str, str] = field(default_factory=dict)  # Column -> units, overriding the header
+
+    @dataclass
+    class Column:
+        index: int
+        name: str
+        field: typing.Optional[str]  # `Plant` field, or None for a parameter
+        units: typing.Optional[str] = None
+        scale: float = 1.0
+        offset: float = 0.0
+
+    @dataclass
+    class Stats:
+        rows: int = 0
+        plants: int = 0
+        skipped: int = 0
+        elapsed: float = 0.0
+
+        @property
+        def rate(self) -> float:
+            return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __init__(self, options: typing.Optional[PlantImporter.Options] = None):
+
+        self.options = options or PlantImporter.Options()
+        self.columns: list[PlantImporter.Column] = []
+        self.stats = PlantImporter.Stats()
+
+    # Section: Columns
+    # ----------------
+
+    def _header(self, header: typing.Sequence) -> list[PlantImporter.Column]:
+        """
+        Match the header cells to `Plant` fields and work out each column's unit conversion.
+
+        :raise ValueError: If a unit column cannot be converted to its field's units, or a required field is missing.
+        """
+
+        lookup = {alias: name for name, aliases in ALIASES.items() for alias in aliases}
+
+        columns, seen = [], set()
+        for index, cell in enumerate(header):
+
+            text = _text(cell)
+            match = _HEADER.match(text)
+            label, units = (match.group(1), match.group(2) or None) if match else (text, None)
+            units = self.options.units.get(text, self.options.units.get(label, units))
+
+            key = re.sub(r"\W+", "_", label.lower()).strip("_")
+            name = lookup.get(key)
+            if name in seen:
+                name = None
+
+            column = PlantImporter.Column(index, label or f"column_{index}", name, units)
+
+            # Checked once per column, not once per cell
+            if name in UNITS:
+                column.scale, column.offset = _conversion(units or UNITS[name], UNITS[name])
+                column.units = UNITS[name]
+
+            elif name is not None and units:
+                raise ValueError(f"Column '{text}' ({name}) does not take units")
+
+            elif name is None and units:
+                _conversion(units, units)
+
+            seen.add(name)
+            columns.append(column)
+
+        missing = {"lat", "lon"} - seen
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(sorted(missing))}")
+
+        return columns
+
+    # Section: Readers
+    # ----------------
+
+    def _rows(self, path: pathlib.Path) -> typing.Iterator[typing.Sequence]:
+        """
+        The rows of a table, header first.
+        """
+
+        if path.suffix.lower() in (".xlsx", ".xlsm"):
+            try:
+                import openpyxl
+            except ImportError as e:
+                raise ImportError("Reading Excel files requires openpyxl") from e
+
+            workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+            try:
+                sheet = workbook[self.options.sheet] if self.options.sheet else workbook.active
+                yield from sheet.iter_rows(values_only=True)
+            finally:
+                workbook.close()
+
+        else:
+            with open(path, newline="", encoding="utf-8-sig") as stream:
+                yield from csv.reader(stream, delimiter=self.options.delimiter)
+
+    def chunks(self, path: str | pathlib.Path) -> typing.Iterator[list[Plant]]:
+        """
+        Read a plant table, yielding lists of at most `chunk_size` plants.
+
+        :param path: CSV or Excel file
+        :raise ValueError: If the header is missing or invalid.
+        """
+
+        path = pathlib.Path(path)
+        rows = self._rows(path)
+        start = time.perf_counter()
+
+        self.stats = PlantImporter.Stats()
+        self.columns = self._header(next(rows, None) or ())
+
+        while True:
+            batch = list(itertools.islice(rows, self.options.chunk_size))
+            if not batch:
+                break
+
+            plants = self._convert(batch)
+            self.stats.rows += len(batch)
+            self.stats.plants += len(plants)
+            self.stats.skipped += len(batch) - len(plants)
+            self.stats.elapsed = time.perf_counter() - start
+
+            if plants:
+                yield plants
+
+        self._logger.info(
+            f"Read {self.stats.plants} plant(s) from {path.name} ({self.stats.skipped} skipped) "
+            f"in {self.stats.elapsed:.2f} s"
+        )
+
+    def read(self, path: str | pathlib.Path) -> list[Plant]:
+        """
+        Read all plants of a table.
+        """
+
+        return [plant for chunk in self.chunks(path) for plant in chunk]
+
+    # Section: Conversion
+    # -------------------
+
+    def _convert(self, batch: list[typing.Sequence]) -> list[Plant]:
+        """
+        Convert a chunk of rows to plants, one column at a time.
+        """
+
+        width = len(self.columns)
+        if any(len(row) != width for row in batch):
+            batch = [(tuple(row) + ("",) * width)[:width] for row in batch]
+
+        cells = list(zip(*batch))
+        values: dict[str, list] = {}
+        params: list[tuple[str, list]] = []
+
+        valid = np.ones(len(batch), dtype=bool)
+        for column in self.columns:
+
+            data = cells[column.index]
+
+            if column.field in _NUMERIC or (column.field is None and column.units):
+                array = _floats(data)
+                if column.scale != 1.0 or column.offset != 0.0:
+                    array = array * column.scale + column.offset
+
+                if column.field in ("lat", "lon"):
+                    limit = 90.0 if column.field == "lat" else 180.0
+                    valid &= np.isfinite(array) & (np.abs(array) <= limit)
+
+                if column.field == "year_commissioned":
+                    values[column.field] = [None if math.isnan(v) else int(v) for v in array.tolist()]
+                elif column.field is not None:
+                    values[column.field] = array.tolist()
+                else:
+                    params.append((column.name, [
+                        None if math.isnan(v) else {"type": "Quantity", "value": v, "units": column.units}
+                        for v in array.tolist()
+                    ]))
+
+            elif column.field is not None:
+                values[column.field] = [_text(value) for value in data]
+
+            else:
+                array = _floats(data)
+                params.append((column.name, [
+                    number if math.isfinite(number) else (_text(value) or None)
+                    for number, value in zip(array.tolist(), data)
+                ]))
+
+        offset = self.stats.rows
+        ids = values.get("id") or [str(offset + i) for i in range(len(batch))]
+        names = values.get("name") or ids
+        empty = [""] * len(batch)
+        capacity = values.get("capacity_mtpa") or [0.0] * len(batch)
+        years = values.get("year_commissioned") or [None] * len(batch)
+
+        plants = []
+        for i in np.flatnonzero(valid).tolist():
+            plants.append(
+                Plant(
+                    id=ids[i] or str(offset + i),
+                    name=names[i] or ids[i],
+                    state=values.get("state", empty)[i],
+                    lat=values["lat"][i],
+                    lon=values["lon"][i],
+                    capacity_mtpa=0.0 if math.isnan(capacity[i]) else capacity[i],
+                    pathway=values.get("pathway", empty)[i],
+                    year_commissioned=years[i],
+                    parameters={name: column[i] for name, column in params if column[i] is not None},
+                )
+            )
+
+        return plants
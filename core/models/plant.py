@@ -0,0 +1,70 @@
+# Filename: core/models/plant.py
+# Module name: core.models
+# Description: Plant records (location, capacity and production pathway) shown on the map
+
+from __future__ import annotations
+
+# Standard Library
+import typing
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+
+@dataclass
+class Plant:
+    """
+    A production plant.
+
+    Attributes:
+        id: Unique identifier.
+        name: Display name.
+        state: State (or region) the plant is located in.
+        lat: Latitude, in degrees.
+        lon: Longitude, in degrees.
+        capacity_mtpa: Production capacity, in million tonnes per annum.
+        pathway: Production pathway, e.g. "BF-BOF", "DRI-EAF" or "Hybrid".
+        year_commissioned: Year the plant was commissioned, if known.
+        parameters: Free-form, pathway-specific parameters.
+    """
+
+    id: str
+    name: str
+    state: str
+    lat: float
+    lon: float
+    capacity_mtpa: float = 0.0
+    pathway: str = ""
+    year_commissioned: int | None = None
+    parameters: dict[str, typing.Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "lat": self.lat,
+            "lon": self.lon,
+            "capacity_mtpa": self.capacity_mtpa,
+            "pathway": self.pathway,
+            "year_commissioned": self.year_commissioned,
+            "parameters": dict(self.parameters),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, typing.Any]) -> Plant:
+
+        year = data.get("year_commissioned")
+        return cls(
+            id=str(data["id"]),
+            name=str(data.get("name", data["id"])),
+            state=str(data.get("state", "")),
+            lat=float(data["lat"]),
+            lon=float(data["lon"]),
+            capacity_mtpa=float(data.get("capacity_mtpa") or 0.0),
+            pathway=str(data.get("pathway", "")),
+            year_commissioned=int(year) if year not in (None, "") else None,
+            parameters=dict(data.get("parameters") or {}),
+        )
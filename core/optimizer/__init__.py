@@ -0,0 +1,19 @@
+# Filename: __init__.py
+# Module name: core.optimizer
+# Description: Linear-programming backend for graph optimization
+
+from __future__ import annotations
+
+# Climact Module(s): core.optimizer
+from core.optimizer.model import CompiledModel, LinearModel, build_model
+from core.optimizer.solver import solve_model
+from core.optimizer.controller import OptimizerController, executable
+
+__all__ = [
+    "CompiledModel",
+    "LinearModel",
+    "OptimizerController",
+    "build_model",
+    "solve_model",
+    "executable",
+]
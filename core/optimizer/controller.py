@@ -0,0 +1,610 @@
+# Filename: core/optimizer/controller.py
+# Module Name: core.optimizer.controller
+# Description: Optimizer controller that builds and solves linear programs over graphs.
+
+from __future__ import annotations
+
+
+# Standard
+import asyncio
+import functools
+import logging
+import multiprocessing
+import pathlib
+import typing
+import uuid
+import json
+import time
+
+
+# Concurrency
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+
+# Third-party
+import numpy as np
+
+
+# Climact Module(s): core.graph, core.optimizer
+from core.graph.node import Node
+from core.graph.controller import GraphController
+from core.optimizer.model import LinearModel, build_model
+from core.optimizer.solver import solve_model, unpack_solution
+from core.optimizer import sweep as sweeps
+
+
+class OptimizerController:
+    """
+    Builds sparse LP/MILP models from the graphs held by the GraphController and solves them with HiGHS (Singleton).
+
+    Short solves can be awaited directly with `solve`. Long-running solves are submitted as jobs, which clients poll.
+    In both cases the model is built in a thread, from a snapshot of the graph taken on the event loop, and solved in
+    a process pool, so that the loop stays free for graph editing. Each job records a list of progress events that
+    clients read incrementally with `status`.
+
+    A solve that is already running cannot be interrupted: cancelling a job discards its result, but its worker stays
+    busy until the solve ends. Solves are therefore always given a time limit (`time_limit`, unless the request sets
+    one).
+    """
+
+    _instance = None
+    _logger = logging.getLogger("OptimizerController")
+
+    # Interval between progress events while a job is running (seconds)
+    heartbeat: float = 1.0
+
+    # Default number of scenarios sent to a worker at a time
+    chunk: int = 64
+
+    # Default solver time limit of submitted jobs (seconds), which bounds how long a cancelled job holds its worker
+    time_limit: float = 3600.0
+
+    # Directory that sweeps write to: relative output paths are resolved against it, and paths outside it refused
+    output_dir: pathlib.Path = pathlib.Path("output")
+
+    @dataclass
+    class Job:
+        juid: str
+        guid: str
+        state: str = "queued"
+        events: typing.List[dict] = field(default_factory=list)
+        result: typing.Optional[dict] = None
+        future: typing.Optional[Future] = None
+        task: typing.Optional[asyncio.Task] = None
+
+        def emit(self, event: str, **kwargs) -> None:
+            self.events.append({"event": event, "time": time.time(), **kwargs})
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+
+        # Only initialize once
+        if self._initialized:
+            return
+
+        self._graphs = GraphController()
+        self._jobs: typing.Dict[str, OptimizerController.Job] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+        self._initialized = True
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use. Workers are spawned, not forked, as the server runs in a thread."""
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        return self._pool
+
+    @staticmethod
+    def _snapshot(graph: GraphController.Graph) -> GraphController.Graph:
+        """
+        The nodes and edges of a graph, copied so that a model can be built from them while the graph is edited.
+        Nodes are re-created with their own technology dictionaries; technologies themselves are shared read-only.
+        """
+
+        return GraphController.Graph(
+            nodes={
+                nuid: Node(nuid, node.meta, dict(node.tech))
+                for nuid, node in graph.nodes.items()
+            },
+            edges=dict(graph.edges),
+            ids=graph.ids,
+        )
+
+    async def _build(self, guid: str, data: dict) -> tuple[LinearModel | None, float, dict | None]:
+        """
+        Build a model for a graph, in a thread so that the event loop is not blocked.
+
+        :return: The model and its build time, or `None` and a FAILED response.
+        """
+
+        graph = self._graphs.database.get(guid)
+        if graph is None:
+            return None, 0.0, {
+                "status": "FAILED",
+                "reason": f"Graph [UID={guid}] does not exist.",
+            }
+
+        snapshot = self._snapshot(graph)
+        try:
+            build_start = time.perf_counter()
+            model = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    build_model,
+                    snapshot,
+                    objective=data.get("objective"),
+                    bounds=data.get("bounds"),
+                    integers=data.get("integers", ()),
+                    year=data.get("year"),
+                ),
+            )
+            return model, time.perf_counter() - build_start, None
+
+        except (KeyError, ValueError, NameError, TypeError, SyntaxError) as e:
+            self._logger.warning(f"Model build failed for graph [UID={guid}]: {e}")
+            return None, 0.0, {
+                "status": "FAILED",
+                "reason": f"Model build failed: {e}",
+            }
+
+    @staticmethod
+    def _response(
+        model: LinearModel, result: dict, build_time: float, solve_time: float
+    ) -> dict:
+
+        timing = {"build": build_time, "solve": solve_time}
+        if not result["success"]:
+            return {
+                "status": "FAILED",
+                "reason": result["message"],
+                "timing": timing,
+            }
+
+        return {
+            "status": "OK",
+            "response": {
+                "objective": result["objective"],
+                "message": result["message"],
+                "flows": unpack_solution(model, result["x"]),
+                "size": model.size(),
+                "timing": timing,
+            },
+        }
+
+    async def solve(self, guid: str, data: dict) -> dict:
+        """
+        Build and solve a model for a graph and wait for the solution, which is computed in the process pool.
+
+        :param guid: Graph GUID
+        :param data: Model options: `objective`, `bounds`, `integers` and `year` (see `CompiledModel`), plus an
+            optional `time_limit` in seconds (default `time_limit`)
+        :return: Response with the solution, model size, and build and solve times.
+        """
+
+        model, build_time, failure = await self._build(guid, data)
+        if failure:
+            return failure
+
+        solve_start = time.perf_counter()
+        result = await asyncio.wrap_future(
+            self._executor().submit(solve_model, model, data.get("time_limit", self.time_limit))
+        )
+        solve_time = time.perf_counter() - solve_start
+
+        self._logger.info(
+            f"Solved graph [UID={guid}] {model.size()}: build {build_time:.3f}s, solve {solve_time:.3f}s"
+        )
+
+        return self._response(model, result, build_time, solve_time)
+
+    async def submit(self, guid: str, data: dict) -> dict:
+        """
+        Build a model and queue it for solution in the process pool.
+
+        :param guid: Graph GUID
+        :param data: Model options (see `solve`), plus an optional `time_limit` in seconds (default `time_limit`)
+        :return: Response with the job's UID.
+        """
+
+        model, build_time, failure = await self._build(guid, data)
+        if failure:
+            return failure
+
+        job = OptimizerController.Job(juid=uuid.uuid4().hex, guid=guid)
+        job.emit("built", size=model.size(), seconds=build_time)
+
+        job.future = self._executor().submit(
+            solve_model, model, data.get("time_limit", self.time_limit)
+        )
+        job.task = asyncio.get_running_loop().create_task(
+            self._watch(job, model, build_time)
+        )
+        job.emit("queued")
+
+        self._jobs[job.juid] = job
+        self._logger.info(f"Submitted job [UID={job.juid}] for graph [UID={guid}]")
+
+        return {
+            "status": "OK",
+            "response": {
+                "job": job.juid,
+                "state": job.state,
+            },
+        }
+
+    async def _watch(self, job: Job, model: LinearModel, build_time: float) -> None:
+        """Await a job's future without blocking the loop, recording progress events as it runs."""
+
+        solve_start = time.perf_counter()
+        waiter = asyncio.wrap_future(job.future)
+
+        try:
+            while True:
+                done, _ = await asyncio.wait({waiter}, timeout=self.heartbeat)
+                if done:
+                    break
+
+                if job.state == "queued" and job.future.running():
+                    job.state = "running"
+                    job.emit("running")
+
+                job.emit("progress", elapsed=time.perf_counter() - solve_start)
+
+            result = waiter.result()
+
+        except asyncio.CancelledError:
+            if job.state != "cancelled":
+                job.state = "cancelled"
+                job.emit("cancelled")
+            return
+
+        except Exception as e:
+            job.state = "failed"
+            job.result = {"status": "FAILED", "reason": f"Solver error: {e}"}
+            job.emit("failed", reason=str(e))
+            return
+
+        # A running job cannot be interrupted (its worker was busy until the time limit), its result is discarded
+        if job.state == "cancelling":
+            job.state = "cancelled"
+            job.emit("cancelled")
+            return
+
+        job.result = self._response(
+            model, result, build_time, time.perf_counter() - solve_start
+        )
+        job.state = "done" if job.result["status"] == "OK" else "failed"
+        job.emit(job.state)
+
+    async def sweep(self, guid: str, data: dict) -> dict:
+        """
+        Evaluate or optimize a graph over many parameter scenarios, in parallel across CPU cores.
+
+        Every worker process rebuilds the graph (and, for optimization, compiles its model) once, then receives
+        chunks of parameter vectors only. Results are written to a columnar output directory as chunks complete
+        (see `sweep.ColumnWriter`), and progress is reported through the job's events.
+
+        :param guid: Graph GUID
+        :param data: Sweep options:
+            `parameters`: `{"nuid.tech.par": [values]}` for a grid, or `{"nuid.tech.par": [lower, upper]}` for LHS
+            `sample`: `"grid"` (default) or `"lhs"`, with `samples` and an optional `seed`
+            `relative`: Treat values as multipliers of the base parameter values (or profiles)
+            `mode`: `"evaluate"` (default) or `"optimize"`, with the model options of `solve`
+            `output`: Output directory, inside `output_dir` or relative to it
+            `chunk`, `workers`: Scenarios per task and number of worker processes
+        :return: Response with the job's UID and the number of scenarios.
+        """
+
+        graph = self._graphs.database.get(guid)
+        if graph is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Graph [UID={guid}] does not exist.",
+            }
+
+        mode = data.get("mode", "evaluate")
+        parameters = data.get("parameters", {})
+        if mode not in ("evaluate", "optimize") or not parameters or not data.get("output"):
+            return {
+                "status": "FAILED",
+                "reason": "Sweep requires 'parameters', 'output' and a mode of 'evaluate' or 'optimize'.",
+            }
+
+        root = self.output_dir.resolve()
+        output = (root / data["output"]).resolve()
+        if not output.is_relative_to(root):
+            self._logger.warning(f"Refused to write sweep to {data['output']}: outside of {root}")
+            return {
+                "status": "FAILED",
+                "reason": f"Could not write to {data['output']}: not inside the output directory",
+            }
+
+        try:
+            keys = [sweeps.parse_key(key) for key in parameters]
+            for nuid, tech_name, name in keys:
+                if name not in graph.nodes[nuid].tech[tech_name].par:
+                    raise KeyError(f"{nuid}.{tech_name}.{name}")
+
+            if data.get("sample", "grid") == "lhs":
+                values = sweeps.latin_hypercube(
+                    parameters, int(data.get("samples", 0)), data.get("seed")
+                )
+            else:
+                values = sweeps.grid(parameters)
+
+        except (KeyError, ValueError, TypeError) as e:
+            return {
+                "status": "FAILED",
+                "reason": f"Invalid sweep parameters: {e}",
+            }
+
+        options = {
+            key: data[key]
+            for key in ("objective", "bounds", "integers", "year", "time_limit", "relative")
+            if key in data
+        }
+        nodes = {nuid: node.to_dict() for nuid, node in graph.nodes.items()}
+        edges = [(e.uid, e.source_uid, e.target_uid) for e in graph.edges.values()]
+
+        writer = sweeps.ColumnWriter(output, len(values))
+        writer.write(0, dict(zip(parameters, values.T)), group="parameters")
+
+        pool = ProcessPoolExecutor(
+            max_workers=data.get("workers"),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=sweeps.init_worker,
+            initargs=(mode, keys, nodes, edges, options),
+        )
+
+        job = OptimizerController.Job(juid=uuid.uuid4().hex, guid=guid)
+        job.emit("queued", scenarios=len(values))
+        job.task = asyncio.get_running_loop().create_task(
+            self._sweep(job, pool, writer, values, int(data.get("chunk", self.chunk)))
+        )
+
+        self._jobs[job.juid] = job
+        self._logger.info(
+            f"Submitted sweep [UID={job.juid}] of {len(values)} scenarios for graph [UID={guid}]"
+        )
+
+        return {
+            "status": "OK",
+            "response": {
+                "job": job.juid,
+                "state": job.state,
+                "scenarios": len(values),
+            },
+        }
+
+    async def _sweep(
+        self,
+        job: Job,
+        pool: ProcessPoolExecutor,
+        writer: sweeps.ColumnWriter,
+        values: np.ndarray,
+        chunk: int,
+    ) -> None:
+        """Dispatch a sweep's chunks to its pool and write their results as they complete."""
+
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        completed = 0
+
+        tasks = [
+            loop.run_in_executor(pool, sweeps.run_chunk, start, values[start : start + chunk])
+            for start in range(0, len(values), chunk)
+        ]
+
+        try:
+            job.state = "running"
+            job.emit("running", chunks=len(tasks))
+
+            for task in asyncio.as_completed(tasks):
+                start, columns = await task
+                writer.write(start, columns)
+
+                completed += min(chunk, len(values) - start)
+                job.emit(
+                    "progress",
+                    completed=completed,
+                    total=len(values),
+                    elapsed=time.perf_counter() - start_time,
+                )
+
+        except asyncio.CancelledError:
+            job.state = "cancelled"
+            job.emit("cancelled", completed=completed)
+            return
+
+        except Exception as e:
+            job.state = "failed"
+            job.result = {"status": "FAILED", "reason": f"Sweep error: {e}"}
+            job.emit("failed", reason=str(e))
+            return
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            pool.shutdown(wait=False, cancel_futures=True)
+            manifest = writer.close()
+
+        job.result = {
+            "status": "OK",
+            "response": {
+                "output": str(writer.path),
+                "scenarios": len(values),
+                "columns": len(manifest["files"]),
+                "timing": {"sweep": time.perf_counter() - start_time},
+            },
+        }
+        job.state = "done"
+        job.emit("done")
+
+    async def status(self, juid: str, since: int = 0) -> dict:
+        """
+        Return a job's state and the progress events recorded after the first `since` events.
+        """
+
+        if (job := self._jobs.get(juid)) is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Job [UID={juid}] not found.",
+            }
+
+        return {
+            "status": "OK",
+            "response": {
+                "job": juid,
+                "state": job.state,
+                "events": job.events[since:],
+                "next": len(job.events),
+            },
+        }
+
+    async def cancel(self, juid: str) -> dict:
+        """
+        Cancel a job. Queued jobs are removed from the pool; running jobs have their result discarded, but keep their
+        worker until the solve ends or reaches its time limit. Sweeps stop dispatching chunks and keep the results
+        written so far.
+        """
+
+        if (job := self._jobs.get(juid)) is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Job [UID={juid}] not found.",
+            }
+
+        if job.state not in ("queued", "running"):
+            return {
+                "status": "FAILED",
+                "reason": f"Job [UID={juid}] is already {job.state}.",
+            }
+
+        if job.future is None:
+            job.task.cancel()
+            job.state = "cancelling"
+            job.emit("cancelling")
+
+        elif job.future.cancel():
+            job.state = "cancelled"
+            job.emit("cancelled")
+        else:
+            job.state = "cancelling"
+            job.emit("cancelling")
+
+        return {
+            "status": "OK",
+            "response": {
+                "job": juid,
+                "state": job.state,
+            },
+        }
+
+    async def result(self, juid: str) -> dict:
+        """
+        Return a finished job's solution, in the same format as `solve`.
+        """
+
+        if (job := self._jobs.get(juid)) is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Job [UID={juid}] not found.",
+            }
+
+        if job.result is None:
+            return {
+                "status": "FAILED",
+                "reason": f"Job [UID={juid}] is {job.state}.",
+            }
+
+        return job.result
+
+    def shutdown(self) -> None:
+        """Stop the process pool, cancelling jobs that have not started."""
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def executable() -> typing.Callable:
+    """
+    Returns an async callable that routes optimizer commands to the controller.
+
+    Expected payload format (JSON):
+    {
+        "guid": "graph-uuid",               (solve, submit, sweep)
+        "job": "job-uuid",                  (status, cancel, result)
+        "data": {...action-specific data...}
+    }
+    """
+    controller = OptimizerController()
+
+    async def execute(action: str, payload: str) -> dict:
+        try:
+            data = json.loads(payload) if payload else {}
+        except json.JSONDecodeError as e:
+            return {
+                "status": "FAILED",
+                "reason": f"Invalid JSON payload: {e}",
+            }
+
+        # Job actions
+        if action in ("status", "cancel", "result"):
+            juid = data.get("job")
+            if not juid:
+                return {
+                    "status": "FAILED",
+                    "reason": "Missing 'job' field in payload.",
+                }
+
+            if action == "status":
+                return await controller.status(juid, int(data.get("since", 0)))
+
+            elif action == "cancel":
+                return await controller.cancel(juid)
+
+            else:
+                return await controller.result(juid)
+
+        guid = data.get("guid")
+        if not guid:
+            return {
+                "status": "FAILED",
+                "reason": "Missing 'guid' field in payload.",
+            }
+
+        if action == "solve":
+            return await controller.solve(guid, data.get("data", {}))
+
+        elif action == "submit":
+            return await controller.submit(guid, data.get("data", {}))
+
+        elif action == "sweep":
+            return await controller.sweep(guid, data.get("data", {}))
+
+        else:
+            _logger = logging.getLogger("core.optimizer")
+            _logger.warning(f"Unknown optimizer action: {action}")
+            return {
+                "status": "FAILED",
+                "reason": f"Unknown action: {action}",
+            }
+
+    return execute
@@ -0,0 +1,499 @@
+# Filename: core/optimizer/model.py
+# Module Name: core.optimizer.model
+# Description: Vectorized assembly of sparse linear programs from graph equations.
+
+from __future__ import annotations
+
+
+# Standard
+import ast
+import functools
+import typing
+
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+
+# Third-party
+import numpy as np
+from scipy import sparse
+
+
+# Climact Module(s): core.graph, core.streams
+from core.graph.evaluator import compile_expression
+from core.streams.quantity import Quantity, ureg
+
+
+if typing.TYPE_CHECKING:
+    from core.graph.controller import GraphController
+
+
+@dataclass
+class LinearModel:
+    """
+    A sparse linear program `min c @ x  s.t.  A_eq @ x = b_eq, lb <= x <= ub`.
+
+    Attributes:
+        keys: One `(nuid, direction, stream)` or `(euid, "edge", stream)` tuple per variable.
+        cost: Objective coefficients.
+        a_eq: Sparse equality-constraint matrix (CSR).
+        b_eq: Equality-constraint right-hand side.
+        lb: Lower bounds.
+        ub: Upper bounds.
+        integrality: 1 for integer variables, 0 for continuous ones.
+    """
+
+    keys: list[tuple[str, str, str]] = field(default_factory=list)
+    cost: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    a_eq: sparse.csr_matrix = field(default_factory=lambda: sparse.csr_matrix((0, 0)))
+    b_eq: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    lb: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    ub: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    integrality: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    @property
+    def is_mixed_integer(self) -> bool:
+        return bool(self.integrality.any())
+
+    def size(self) -> dict[str, int]:
+        return {
+            "rows": int(self.a_eq.shape[0]),
+            "cols": int(self.a_eq.shape[1]),
+            "nnz": int(self.a_eq.nnz),
+        }
+
+
+@functools.lru_cache(maxsize=4096)
+def _check_linear(source: str, variables: frozenset[str]) -> None:
+    """
+    Check that an expression is linear in `variables` from its syntax: variables may be added, subtracted, negated,
+    and multiplied or divided by terms without variables, but not passed to functions (e.g. `abs`, `maximum`),
+    multiplied together, raised to a power or used as divisors. Numeric probes alone cannot tell `abs(x)` from `x`.
+
+    :raise ValueError: If the expression is not linear in `variables`.
+    """
+
+    def depends(node: ast.AST) -> bool:
+
+        if isinstance(node, ast.Expression):
+            return depends(node.body)
+
+        if isinstance(node, ast.Name):
+            return node.id in variables
+
+        if isinstance(node, ast.Constant):
+            return False
+
+        if isinstance(node, ast.UnaryOp):
+            inner = depends(node.operand)
+            if inner and not isinstance(node.op, (ast.UAdd, ast.USub)):
+                raise ValueError(node)
+            return inner
+
+        if isinstance(node, ast.BinOp):
+            left, right = depends(node.left), depends(node.right)
+            if isinstance(node.op, (ast.Add, ast.Sub)):
+                return left or right
+            if isinstance(node.op, ast.Mult) and not (left and right):
+                return left or right
+            if isinstance(node.op, ast.Div) and not right:
+                return left
+            if left or right:
+                raise ValueError(node)
+            return False
+
+        if isinstance(node, ast.Call):
+            if any(depends(arg) for arg in node.args):
+                raise ValueError(node)
+            return False
+
+        # Syntax that `compile_expression` rejects anyway
+        raise ValueError(node)
+
+    try:
+        depends(ast.parse(source, mode="eval"))
+    except ValueError:
+        raise ValueError(f"Equation '{source}' is not linear in {sorted(variables)}") from None
+
+
+def _linearize(
+    source: str,
+    variables: list[str],
+    parameters: dict[str, np.ndarray],
+    size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extract the coefficients of an expression that is linear in `variables`, for a whole group of nodes at once.
+
+    The expression is first checked to be linear from its syntax (see `_check_linear`). Each variable is then probed
+    with a unit vector, plus one all-zero probe (the constant term) and one all-two probe (a numeric check of the
+    coefficients). Parameters are `(G, 1)` arrays, so a single evaluation covers all `G` nodes of the group.
+
+    :param source: The equation's expression string
+    :param variables: Names of the symbols that are decision variables
+    :param parameters: Parameter magnitudes, one `(G, 1)` array per name
+    :param size: The number of nodes `G` in the group
+    :return: A `(G, k)` coefficient array and a `(G,)` constant array.
+    """
+
+    _check_linear(source, frozenset(variables))
+
+    k = len(variables)
+    probes = np.zeros((k + 2, k))
+    probes[np.arange(k), np.arange(k)] = 1.0
+    probes[k + 1, :] = 2.0
+
+    symbols = dict(parameters)
+    symbols.update({name: probes[:, i][np.newaxis, :] for i, name in enumerate(variables)})
+
+    values = np.broadcast_to(
+        np.asarray(compile_expression(source)(symbols), dtype=float), (size, k + 2)
+    )
+
+    constant = values[:, k]
+    coefficients = values[:, :k] - constant[:, np.newaxis]
+
+    if not np.allclose(values[:, k + 1], constant + 2.0 * coefficients.sum(axis=1)):
+        raise ValueError(f"Equation '{source}' is not linear in {variables}")
+
+    return coefficients, constant
+
+
+@dataclass
+class _Group:
+    """Equations sharing one expression and one set of variables, linearized together."""
+
+    source: str
+    variables: list[str]
+    parameters: dict[str, np.ndarray]
+    rows: np.ndarray
+    span: slice
+    constant: np.ndarray
+
+
+@functools.lru_cache(maxsize=1024)
+def _scale(units: str) -> float:
+    """The magnitude in base units of one unit (e.g. 1 t/h = 0.2778 kg/s), ignoring offsets."""
+
+    zero = ureg.Quantity(0.0, units).to_base_units().magnitude
+    one = ureg.Quantity(1.0, units).to_base_units().magnitude
+    return float(one - zero)
+
+
+def _magnitude(value: Quantity, year: int | None) -> float:
+    """A parameter's scalar magnitude; the model is single-period, so profiles are read at one year."""
+
+    if value.profile is not None and year is not None:
+        return value.profile.at(year)
+
+    if np.ndim(value.value) > 0:
+        raise ValueError(
+            f"Parameter {value} varies over time; pass a 'year' to build a single-period model"
+        )
+
+    return float(value.value)
+
+
+class CompiledModel:
+    """
+    The structure of a linear program, compiled once from a graph.
+
+    Variables are the node input and output streams, plus one flow variable per stream carried by each edge.
+    Rows are (a) one equation per node output defined in `Technology.eqn`, and (b) one flow balance per connected
+    input and output stream.
+
+    Node variables, bounds and objective weights are magnitudes in the units the technology declares for the stream
+    (base units if it declares none), so that equations apply as written. Edge flows are in base units: each flow
+    balance scales its node variable to base units, so a `t/h` output feeds a `kg/s` input at the right rate. Edges
+    between streams of different dimensions are rejected.
+
+    `instantiate` returns a LinearModel for a set of parameter overrides; only the equation groups that reference an
+    overridden parameter are re-linearized, everything else (indices, bounds, objective) is shared.
+    """
+
+    def __init__(
+        self,
+        graph: "GraphController.Graph",
+        objective: dict[str, float] | None = None,
+        bounds: dict[str, dict[str, list]] | None = None,
+        integers: typing.Iterable[str] = (),
+        year: int | None = None,
+    ):
+        """
+        :param graph: The graph to translate
+        :param objective: Weight per stream name, applied to the streams that cross the system boundary
+        :param bounds: `{nuid: {stream: [lower, upper]}}` bounds; flows default to `[0, inf)`
+        :param integers: `"nuid.stream"` keys of variables that must take integer values
+        :param year: Year at which profile-backed parameters are read; required if any parameter has a profile
+        """
+
+        objective = objective or {}
+        bounds = bounds or {}
+
+        # Enumerate node variables, and the quantities that declare their units
+        index: dict[tuple[str, str, str], int] = {}
+        declared: dict[tuple[str, str, str], Quantity] = {}
+        for nuid, node in graph.nodes.items():
+            for tech in node.tech.values():
+                for direction, streams in (("inp", tech.inp), ("out", tech.out)):
+                    for stream, value in streams.items():
+                        index.setdefault((nuid, direction, stream), len(index))
+                        if isinstance(value, Quantity):
+                            declared.setdefault((nuid, direction, stream), value)
+                for stream in tech.eqn:
+                    index.setdefault((nuid, "out", stream), len(index))
+
+        # Enumerate edge-flow variables, one per carried stream
+        edge_src, edge_dst, edge_var = [], [], []
+        for euid, edge in graph.edges.items():
+            source = graph.nodes.get(edge.source_uid)
+            target = graph.nodes.get(edge.target_uid)
+            if source is None or target is None:
+                continue
+
+            for stream in sorted(source.get_out_streams() & target.get_inp_streams()):
+                produced = declared.get((edge.source_uid, "out", stream))
+                received = declared.get((edge.target_uid, "inp", stream))
+                if (
+                    produced is not None
+                    and received is not None
+                    and produced.dimensionality() != received.dimensionality()
+                ):
+                    raise ValueError(
+                        f"Stream '{stream}' on edge [UID={euid}] has units {produced.units} at the source and "
+                        f"{received.units} at the target"
+                    )
+
+                edge_var.append(index.setdefault((euid, "edge", stream), len(index)))
+                edge_src.append(index[(edge.source_uid, "out", stream)])
+                edge_dst.append(index[(edge.target_uid, "inp", stream)])
+
+        n = len(index)
+        rows, cols, vals, rhs = [], [], [], []
+
+        # Magnitude in base units of one unit of each variable
+        scale = np.ones(n)
+        for key, value in declared.items():
+            scale[index[key]] = _scale(str(value.units))
+
+        # (a) Technology equations, grouped by expression so that each group is linearized in one pass
+        grouped: dict[tuple[str, tuple[str, ...]], list] = {}
+        for nuid, node in graph.nodes.items():
+            for name, tech in node.tech.items():
+                names = set(tech.inp) | set(tech.out) | set(tech.eqn)
+                for stream, source in tech.eqn.items():
+                    expression = compile_expression(source)
+                    variables = tuple(sorted(expression.names & names))
+                    grouped.setdefault((source, variables), []).append(
+                        (nuid, name, stream, tech)
+                    )
+
+        # One row per node output that has at least one equation
+        out_rows: dict[tuple[str, str], int] = {}
+        for members in grouped.values():
+            for nuid, _, stream, _ in members:
+                out_rows.setdefault((nuid, stream), len(out_rows))
+
+        rows.append(np.fromiter(out_rows.values(), dtype=np.int64))
+        cols.append(
+            np.fromiter((index[(nuid, "out", s)] for nuid, s in out_rows), dtype=np.int64)
+        )
+        vals.append(np.ones(len(out_rows)))
+        constants = np.zeros(len(out_rows))
+        offset = len(out_rows)
+        cursor = len(out_rows)
+
+        # Parameter slots: (nuid, tech, par) -> [(group, member)] for overrides
+        self._groups: list[_Group] = []
+        self._slots: dict[tuple[str, str, str], list[tuple[int, int]]] = {}
+
+        for (source, variables), members in grouped.items():
+
+            missing = compile_expression(source).names - set(variables)
+            parameters = {}
+            for name in missing:
+                magnitudes = []
+                for position, (nuid, tech_name, _, tech) in enumerate(members):
+                    value = tech.par.get(name)
+                    if not isinstance(value, Quantity):
+                        raise ValueError(
+                            f"Symbol '{name}' in '{source}' is not defined for node [UID={nuid}]"
+                        )
+                    magnitudes.append(_magnitude(value, year))
+                    self._slots.setdefault((nuid, tech_name, name), []).append(
+                        (len(self._groups), position)
+                    )
+
+                parameters[name] = np.asarray(magnitudes, dtype=float)[:, np.newaxis]
+
+            coefficients, constant = _linearize(
+                source, list(variables), parameters, len(members)
+            )
+
+            member_rows = np.fromiter(
+                (out_rows[(nuid, stream)] for nuid, _, stream, _ in members),
+                dtype=np.int64,
+            )
+            member_cols = np.array(
+                [
+                    [
+                        index[(nuid, "inp", name)]
+                        if name in tech.inp
+                        else index[(nuid, "out", name)]
+                        for name in variables
+                    ]
+                    for nuid, _, _, tech in members
+                ],
+                dtype=np.int64,
+            ).reshape(len(members), len(variables))
+
+            rows.append(np.repeat(member_rows, len(variables)))
+            cols.append(member_cols.ravel())
+            vals.append(-coefficients.ravel())
+            np.add.at(constants, member_rows, constant)
+
+            self._groups.append(
+                _Group(
+                    source=source,
+                    variables=list(variables),
+                    parameters=parameters,
+                    rows=member_rows,
+                    span=slice(cursor, cursor + coefficients.size),
+                    constant=constant,
+                )
+            )
+            cursor += coefficients.size
+
+        # (b) Flow balances: every connected stream, in base units, equals the sum of its edge flows
+        edge_src = np.asarray(edge_src, dtype=np.int64)
+        edge_dst = np.asarray(edge_dst, dtype=np.int64)
+        edge_var = np.asarray(edge_var, dtype=np.int64)
+
+        for endpoint in (edge_src, edge_dst):
+            balanced, row_of = np.unique(endpoint, return_inverse=True)
+            row_of = row_of + offset
+
+            rows.extend([np.arange(len(balanced)) + offset, row_of])
+            cols.extend([balanced, edge_var])
+            vals.extend([scale[balanced], -np.ones(len(edge_var))])
+            rhs.append(np.zeros(len(balanced)))
+            offset += len(balanced)
+
+        # Objective: boundary streams (unconnected inputs and outputs) carry the stream's weight
+        connected = np.zeros(n, dtype=bool)
+        connected[edge_src] = True
+        connected[edge_dst] = True
+
+        keys = list(index.keys())
+        cost = np.zeros(n)
+        lb = np.zeros(n)
+        ub = np.full(n, np.inf)
+        integrality = np.zeros(n)
+
+        for i, (uid, direction, stream) in enumerate(keys):
+            if direction != "edge" and not connected[i]:
+                cost[i] = objective.get(stream, 0.0)
+
+        for nuid, streams in bounds.items():
+            for stream, (lower, upper) in streams.items():
+                for direction in ("inp", "out"):
+                    if (i := index.get((nuid, direction, stream))) is not None:
+                        lb[i] = -np.inf if lower is None else lower
+                        ub[i] = np.inf if upper is None else upper
+
+        for key in integers:
+            nuid, _, stream = key.partition(".")
+            for direction in ("inp", "out"):
+                if (i := index.get((nuid, direction, stream))) is not None:
+                    integrality[i] = 1
+
+        self.keys = keys
+        self.cost = cost
+        self.lb = lb
+        self.ub = ub
+        self.integrality = integrality
+        self.shape = (offset, n)
+
+        self._rows = np.concatenate(rows)
+        self._cols = np.concatenate(cols)
+        self._vals = np.concatenate(vals)
+        self._constants = constants
+        self._balances = np.concatenate(rhs) if rhs else np.zeros(0)
+
+    def parameter(self, key: tuple[str, str, str]) -> float:
+        """The compiled magnitude of a `(nuid, tech, par)` parameter, or NaN if no equation uses it."""
+
+        if key not in self._slots:
+            return float("nan")
+
+        group, position = self._slots[key][0]
+        return float(self._groups[group].parameters[key[2]][position, 0])
+
+    @property
+    def slots(self) -> typing.KeysView[tuple[str, str, str]]:
+        """The `(nuid, tech, par)` parameters that appear in the model's equations."""
+        return self._slots.keys()
+
+    def instantiate(
+        self, overrides: dict[tuple[str, str, str], float] | None = None
+    ) -> LinearModel:
+        """
+        Create a LinearModel, optionally replacing parameter magnitudes.
+
+        :param overrides: New magnitudes keyed by `(nuid, tech, par)`
+        :return: The assembled LinearModel.
+        """
+
+        vals = self._vals
+        constants = self._constants
+
+        if overrides:
+            vals = vals.copy()
+            constants = constants.copy()
+
+            changed: dict[int, dict[str, np.ndarray]] = {}
+            for (nuid, tech_name, name), value in overrides.items():
+                for group, position in self._slots.get((nuid, tech_name, name), ()):
+                    parameters = changed.setdefault(
+                        group, dict(self._groups[group].parameters)
+                    )
+                    parameters[name] = parameters[name].copy()
+                    parameters[name][position, 0] = value
+
+            for group, parameters in changed.items():
+                entry = self._groups[group]
+                coefficients, constant = _linearize(
+                    entry.source, entry.variables, parameters, len(entry.rows)
+                )
+                vals[entry.span] = -coefficients.ravel()
+                np.add.at(constants, entry.rows, constant - entry.constant)
+
+        a_eq = sparse.csr_matrix((vals, (self._rows, self._cols)), shape=self.shape)
+
+        return LinearModel(
+            keys=self.keys,
+            cost=self.cost,
+            a_eq=a_eq,
+            b_eq=np.concatenate([constants, self._balances]),
+            lb=self.lb,
+            ub=self.ub,
+            integrality=self.integrality,
+        )
+
+
+def build_model(
+    graph: "GraphController.Graph",
+    objective: dict[str, float] | None = None,
+    bounds: dict[str, dict[str, list]] | None = None,
+    integers: typing.Iterable[str] = (),
+    year: int | None = None,
+) -> LinearModel:
+    """
+    Assemble a sparse linear program from a graph (see `CompiledModel`).
+
+    :return: The assembled LinearModel.
+    """
+
+    return CompiledModel(graph, objective, bounds, integers, year).instantiate()
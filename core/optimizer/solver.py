@@ -0,0 +1,74 @@
+# Filename: core/optimizer/solver.py
+# Module Name: core.optimizer.solver
+# Description: HiGHS-backed solution of assembled linear models.
+
+from __future__ import annotations
+
+
+# Standard
+import typing
+
+
+# Third-party
+import numpy as np
+from scipy import optimize
+
+
+# Climact Module(s): core.optimizer
+from core.optimizer.model import LinearModel
+
+
+def solve_model(
+    model: LinearModel, time_limit: float | None = None
+) -> dict[str, typing.Any]:
+    """
+    Solve a LinearModel with HiGHS: `scipy.optimize.milp` if any variable is integer, `linprog` otherwise.
+
+    This function is module-level (picklable) so that it can be run in a process pool.
+
+    :param model: The assembled model
+    :param time_limit: Optional wall-clock limit for the solver (seconds)
+    :return: Dictionary with the solver status, message, objective value and solution vector.
+    """
+
+    options = {} if time_limit is None else {"time_limit": time_limit}
+
+    if model.is_mixed_integer:
+        result = optimize.milp(
+            model.cost,
+            constraints=optimize.LinearConstraint(model.a_eq, model.b_eq, model.b_eq),
+            integrality=model.integrality,
+            bounds=optimize.Bounds(model.lb, model.ub),
+            options=options,
+        )
+
+    else:
+        result = optimize.linprog(
+            model.cost,
+            A_eq=model.a_eq,
+            b_eq=model.b_eq,
+            bounds=np.column_stack([model.lb, model.ub]),
+            method="highs",
+            options=options,
+        )
+
+    return {
+        "success": bool(result.success),
+        "message": str(result.message),
+        "objective": float(result.fun) if result.success else None,
+        "x": result.x if result.success else None,
+    }
+
+
+def unpack_solution(model: LinearModel, x: np.ndarray) -> dict[str, dict[str, dict]]:
+    """
+    Map a solution vector back onto nodes and edges.
+
+    :return: `{uid: {direction: {stream: value}}}` where direction is "inp", "out" or "edge".
+    """
+
+    flows: dict[str, dict[str, dict]] = {}
+    for (uid, direction, stream), value in zip(model.keys, x.tolist()):
+        flows.setdefault(uid, {}).setdefault(direction, {})[stream] = value
+
+    return flows
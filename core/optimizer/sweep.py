@@ -0,0 +1,264 @@
+# Filename: core/optimizer/sweep.py
+# Module Name: core.optimizer.sweep
+# Description: Parameter sampling, worker functions and columnar output for scenario sweeps.
+
+from __future__ import annotations
+
+
+# Standard
+import dataclasses
+import itertools
+import json
+import typing
+
+
+# Third-party
+import numpy as np
+from numpy.lib import format as npy
+
+
+# Pathlib
+from pathlib import Path
+
+
+# Climact Module(s): core.graph, core.optimizer
+from core.graph.controller import GraphController
+from core.graph.evaluator import Evaluator
+from core.graph.node import Node
+from core.graph.edge import Edge
+from core.optimizer.model import CompiledModel
+from core.optimizer.solver import solve_model
+from core.streams.profile import YEARS
+
+
+# Per-process state, created once by `init_worker` and shared by every chunk the process runs
+_WORKER: dict[str, typing.Any] = {}
+
+
+def parse_key(key: str) -> tuple[str, str, str]:
+    """Split a `"nuid.tech.par"` override key."""
+
+    parts = key.split(".", 2)
+    if len(parts) != 3:
+        raise ValueError(f"Override key '{key}' must have the form 'nuid.tech.par'")
+
+    return parts[0], parts[1], parts[2]
+
+
+def grid(parameters: dict[str, list[float]]) -> np.ndarray:
+    """
+    Cartesian product of per-parameter values.
+
+    :param parameters: Values for each override key
+    :return: An `(S, P)` array with one row per scenario.
+    """
+
+    rows = list(itertools.product(*parameters.values()))
+    return np.asarray(rows, dtype=float).reshape(len(rows), len(parameters))
+
+
+def latin_hypercube(
+    parameters: dict[str, list[float]], samples: int, seed: int | None = None
+) -> np.ndarray:
+    """
+    Latin-hypercube sample: each parameter's `[lower, upper]` range is split into `samples` strata, and every
+    stratum is used exactly once per parameter.
+
+    :param parameters: `[lower, upper]` for each override key
+    :param samples: Number of scenarios
+    :param seed: Seed for reproducible samples
+    :return: An `(S, P)` array with one row per scenario.
+    """
+
+    rng = np.random.default_rng(seed)
+    bounds = np.asarray(list(parameters.values()), dtype=float).reshape(-1, 2)
+
+    strata = np.argsort(rng.random((samples, len(bounds))), axis=0)
+    unit = (strata + rng.random((samples, len(bounds)))) / samples
+    return bounds[:, 0] + unit * (bounds[:, 1] - bounds[:, 0])
+
+
+class ColumnWriter:
+    """
+    Columnar sweep output: a directory with one `.npy` file per column and a `columns.json` manifest.
+
+    Columns are pre-allocated for all scenarios and memory-mapped, so chunks can be written in any order as they
+    complete. Read a column back with `np.load(path / file, mmap_mode="r")`.
+    """
+
+    def __init__(self, path: str | Path, rows: int):
+
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        self._rows = rows
+        self._files: dict[str, str] = {}
+        self._columns: dict[str, np.memmap] = {}
+        self._groups: dict[str, list[str]] = {}
+
+    def write(self, start: int, columns: dict[str, np.ndarray], group: str = "results") -> None:
+        """
+        Write the rows `[start, start + len(chunk))` of the given columns, creating new columns as needed.
+        """
+
+        for name, values in columns.items():
+
+            if name not in self._columns:
+                file = f"c{len(self._files):05d}.npy"
+                column = npy.open_memmap(
+                    self._path / file, mode="w+", dtype=np.float64, shape=(self._rows,)
+                )
+                column[:] = np.nan
+
+                self._files[name] = file
+                self._columns[name] = column
+                self._groups.setdefault(group, []).append(name)
+
+            self._columns[name][start : start + len(values)] = values
+
+    def close(self) -> dict[str, typing.Any]:
+        """Flush all columns and write the manifest."""
+
+        for column in self._columns.values():
+            column.flush()
+
+        manifest = {
+            "rows": self._rows,
+            "files": self._files,
+            **self._groups,
+        }
+        (self._path / "columns.json").write_text(json.dumps(manifest, indent=4))
+        self._columns.clear()
+        return manifest
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+
+def init_worker(
+    mode: str,
+    keys: list[tuple[str, str, str]],
+    nodes: dict[str, dict],
+    edges: list[tuple[str, str, str]],
+    options: dict[str, typing.Any],
+) -> None:
+    """
+    Process-pool initializer: rebuild the graph once per process and, for optimization sweeps, compile its model.
+    """
+
+    graph = GraphController.Graph()
+    for nuid, data in nodes.items():
+        graph.nodes[nuid] = Node.from_dict(data)
+
+    for euid, suid, tuid in edges:
+        graph.edges[euid] = Edge.between(euid, suid, tuid, graph.ids)
+        graph.links_out.setdefault(suid, set()).add(euid)
+        graph.links_in.setdefault(tuid, set()).add(euid)
+
+    _WORKER.clear()
+    _WORKER.update(mode=mode, keys=keys, graph=graph, options=options)
+
+    if mode == "optimize":
+        _WORKER["model"] = CompiledModel(
+            graph,
+            objective=options.get("objective"),
+            bounds=options.get("bounds"),
+            integers=options.get("integers", ()),
+            year=options.get("year"),
+        )
+
+
+def run_chunk(start: int, values: np.ndarray) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Evaluate or optimize a chunk of scenarios in a worker process.
+
+    :param start: Index of the chunk's first scenario
+    :param values: `(S, P)` override magnitudes for the chunk
+    :return: The start index and the chunk's result columns.
+    """
+
+    if _WORKER["mode"] == "optimize":
+        return start, _optimize_chunk(values)
+
+    return start, _evaluate_chunk(values)
+
+
+def _evaluate_chunk(values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Evaluate all scenarios of a chunk in a single vectorized pass: overridden parameters become arrays over the
+    scenario axis, and every downstream quantity broadcasts along it.
+    """
+
+    graph: GraphController.Graph = _WORKER["graph"]
+    relative = _WORKER["options"].get("relative", False)
+    nodes = dict(graph.nodes)
+
+    for (nuid, tech_name, name), column in zip(_WORKER["keys"], values.T):
+        node = nodes[nuid]
+        tech = node.tech[tech_name]
+        base = tech.par[name]
+
+        # Scenarios along the first axis, years (for profile-backed parameters) along the second
+        magnitude = column[:, np.newaxis]
+        if relative:
+            magnitude = magnitude * np.atleast_1d(base.value)
+
+        techs = dict(node.tech)
+        techs[tech_name] = dataclasses.replace(
+            tech, par={**tech.par, name: type(base)(magnitude, str(base.units))}
+        )
+        nodes[nuid] = Node(nuid=nuid, meta=node.meta, tech=techs)
+
+    scenario = dataclasses.replace(graph, nodes=nodes, cache={})
+    Evaluator(scenario).evaluate()
+
+    columns = {}
+    for nuid, outputs in scenario.cache.items():
+        for stream, value in outputs.items():
+
+            magnitude = np.asarray(value.magnitude, dtype=float)
+            if magnitude.ndim < 2:
+                magnitude = magnitude.reshape(1, -1)
+
+            magnitude = np.broadcast_to(magnitude, (len(values), magnitude.shape[1]))
+            if magnitude.shape[1] == 1:
+                columns[f"{nuid}.{stream}"] = magnitude[:, 0]
+                continue
+
+            # Time-varying outputs are written as one column per year
+            years = YEARS if magnitude.shape[1] == len(YEARS) else range(magnitude.shape[1])
+            for position, year in enumerate(years):
+                columns[f"{nuid}.{stream}@{year}"] = magnitude[:, position]
+
+    return columns
+
+
+def _optimize_chunk(values: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Solve each scenario of a chunk with the worker's compiled model, varying only the parameter vector.
+    """
+
+    model: CompiledModel = _WORKER["model"]
+    keys = _WORKER["keys"]
+    time_limit = _WORKER["options"].get("time_limit")
+
+    if _WORKER["options"].get("relative", False):
+        values = values * np.array([model.parameter(key) for key in keys])
+
+    reported = [i for i, key in enumerate(model.keys) if key[1] != "edge"]
+    objective = np.full(len(values), np.nan)
+    solution = np.full((len(values), len(reported)), np.nan)
+
+    for row, scenario in enumerate(values):
+        result = solve_model(model.instantiate(dict(zip(keys, scenario))), time_limit)
+        if result["success"]:
+            objective[row] = result["objective"]
+            solution[row] = result["x"][reported]
+
+    columns = {"objective": objective}
+    for column, i in enumerate(reported):
+        uid, direction, stream = model.keys[i]
+        columns[f"{uid}.{direction}.{stream}"] = solution[:, column]
+
+    return columns
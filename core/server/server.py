@@ -12,6 +12,8 @@ from dataclasses import dataclass
 # Local imports
 from core.server.parser import CommandParser
 from core.graph import executable as graph_executable
+from core.optimizer import OptimizerController
+from core.optimizer import executable as optimizer_executable
 
 # Configure logging
 logging.basicConfig(
@@ -67,7 +69,7 @@ class ClimactServer:
         self._controllers = {
             "server": self,
             "graph": graph_executable(),
-            "optimizer": None,
+            "optimizer": optimizer_executable(),
         }
 
     # Initialize command parser
@@ -145,6 +147,9 @@ class ClimactServer:
             self._server.close()
             await self._server.wait_closed()
 
+        # Stop optimization workers
+        OptimizerController().shutdown()
+
         self._status = ServerState.STOPPED
         self._logger.info("Server stopped")
 
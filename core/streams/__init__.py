@@ -7,6 +7,9 @@ from __future__ import annotations
 # Base class and registry
 from core.streams.quantity import Quantity, ureg
 
+# Time profiles
+from core.streams.profile import YEARS, Profile, Fixed, Linear, Stepped, PROFILE_REGISTRY
+
 # SI base units
 from core.streams.physical import (
     Mass,
@@ -164,6 +167,13 @@ __all__ = [
     "Quantity",
     "ureg",
     "CLASS_REGISTRY",
+    # Profiles
+    "YEARS",
+    "Profile",
+    "Fixed",
+    "Linear",
+    "Stepped",
+    "PROFILE_REGISTRY",
     # Fundamental
     "Mass",
     "Length",
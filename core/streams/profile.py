@@ -0,0 +1,160 @@
+#  Filename: core/streams/profile.py
+#  Module name: core.streams.profile
+#  Description: Time profiles (Fixed, Linear, Stepped) tabulated over the model's year grid
+
+from __future__ import annotations
+
+# Standard
+import abc
+import inspect
+import typing
+import numpy as np
+
+
+__all__ = ["YEARS", "Profile", "Fixed", "Linear", "Stepped", "PROFILE_REGISTRY"]
+
+
+# Planning horizon: one value per year, inclusive
+YEARS = np.arange(2024, 2051)
+
+
+class Profile(abc.ABC):
+    """
+    Base class for time profiles. A profile is tabulated over a year grid once, on construction; its `values`
+    array is read-only and shared by every evaluation, so graph evaluation over the horizon is a single
+    vectorized pass over the time axis.
+    """
+
+    kind: str = "Profile"
+
+    def __init__(self, years: np.ndarray | None = None):
+
+        self._years = YEARS if years is None else np.asarray(years)
+        self._values = np.asarray(self._tabulate(self._years), dtype=float)
+        self._values.flags.writeable = False
+
+    @abc.abstractmethod
+    def _tabulate(self, years: np.ndarray) -> np.ndarray:
+        """The profile's values over a year grid."""
+
+    def __repr__(self) -> str:
+        return f"<{self.kind}>: {self.to_dict()}"
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, Profile) and self.to_dict() == other.to_dict()
+
+    @property
+    def years(self) -> np.ndarray:
+        return self._years
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def at(self, year: int) -> float:
+        """Return the profile's value in a year of its grid."""
+
+        index = np.searchsorted(self._years, year)
+        if index == len(self._years) or self._years[index] != year:
+            raise ValueError(f"Year {year} is not on the profile's grid")
+
+        return float(self._values[index])
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {"kind": self.kind}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Profile:
+        """
+        Factory method to reconstruct a profile from the given dictionary.
+
+        :raise ValueError: If the kind is unknown, or the dictionary does not hold the kind's arguments.
+        """
+
+        kind = data.get("kind", "Fixed")
+        target_class = PROFILE_REGISTRY.get(kind)
+        if target_class is None:
+            raise ValueError(f"Unknown profile kind '{kind}' (expected one of {', '.join(PROFILE_REGISTRY)})")
+
+        kwargs = {key: value for key, value in data.items() if key != "kind"}
+        parameters = inspect.signature(target_class).parameters
+        unexpected = sorted(set(kwargs) - set(parameters))
+        missing = [name for name, p in parameters.items() if p.default is p.empty and name not in kwargs]
+        if unexpected or missing:
+            raise ValueError(
+                f"Invalid {kind} profile: missing {missing or 'nothing'}, unexpected {unexpected or 'nothing'}"
+            )
+
+        try:
+            return target_class(**kwargs)
+        except TypeError as e:
+            raise ValueError(f"Invalid {kind} profile: {e}") from e
+
+
+class Fixed(Profile):
+    """Constant value over the horizon."""
+
+    kind = "Fixed"
+
+    def __init__(self, value: float, years: np.ndarray | None = None):
+        self.value = float(value)
+        super().__init__(years)
+
+    def _tabulate(self, years: np.ndarray) -> np.ndarray:
+        return np.full(len(years), self.value)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {"kind": self.kind, "value": self.value}
+
+
+class Linear(Profile):
+    """
+    Piecewise-linear interpolation between `(year, value)` points, held constant before the first point and after
+    the last one. Example: `Linear([2024, 2050], [80, 120])`.
+    """
+
+    kind = "Linear"
+
+    def __init__(
+        self,
+        points: typing.Sequence[int],
+        values: typing.Sequence[float],
+        years: np.ndarray | None = None,
+    ):
+        self.points = [int(p) for p in points]
+        self.values_at = [float(v) for v in values]
+
+        if len(self.points) != len(self.values_at) or not self.points:
+            raise ValueError("A profile needs one value per point")
+
+        if any(b <= a for a, b in zip(self.points, self.points[1:])):
+            raise ValueError("Profile points must be strictly increasing")
+
+        super().__init__(years)
+
+    def _tabulate(self, years: np.ndarray) -> np.ndarray:
+        return np.interp(years, self.points, self.values_at)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {"kind": self.kind, "points": self.points, "values": self.values_at}
+
+
+class Stepped(Linear):
+    """
+    Piecewise-constant profile: each value holds from its point until the next one, and the first value also
+    applies before the first point. Example: `Stepped([2024, 2030, 2040], [1.8, 1.6, 1.2])`.
+    """
+
+    kind = "Stepped"
+
+    def _tabulate(self, years: np.ndarray) -> np.ndarray:
+        index = np.searchsorted(self.points, years, side="right") - 1
+        return np.asarray(self.values_at)[np.clip(index, 0, None)]
+
+
+# Registry for deserialization
+PROFILE_REGISTRY: dict[str, typing.Type[Profile]] = {
+    "Fixed": Fixed,
+    "Linear": Linear,
+    "Stepped": Stepped,
+}
@@ -10,6 +10,10 @@ import typing
 import numpy as np
 
 
+# core.streams
+from core.streams.profile import Profile
+
+
 __all__ = ["Quantity", "ureg"]
 
 
@@ -21,6 +25,9 @@ ureg.define("INR = [currency]")
 class Quantity:
     """
     Base class for all resource streams. Uses the registry pattern for dimensionality-based dispatch.
+
+    A quantity may be backed by a time profile, e.g. `CostPerMass(Linear([2024, 2050], [80, 120]), "INR/kg")`:
+    its magnitude is then the profile's array over the year grid (see `core.streams.profile`).
     """
 
     label: str = "Generic"
@@ -41,6 +48,12 @@ class Quantity:
         *args,
     ):
 
+        # Profile-backed quantities hold the profile's precomputed values as their magnitude
+        self.profile: Profile | None = None
+        if args and isinstance(args[0], Profile):
+            self.profile = args[0]
+            args = (self.profile.values, *args[1:])
+
         # Pass args to the pint constructor first
         self._q = ureg.Quantity(*args)  # type: ignore
 
@@ -86,6 +99,7 @@ class Quantity:
 
     @value.setter
     def value(self, value: typing.Union[int, float, np.ndarray]) -> None:
+        self.profile = None
         self._q = ureg.Quantity(value, self._q.units)  # type: ignore
 
     @property
@@ -113,6 +127,13 @@ class Quantity:
             "units": str(self.units),
         }
 
+        if self.profile is not None:
+            result["profile"] = self.profile.to_dict()
+
+        # A stream's category (e.g. "Fuel"), which its units alone do not determine
+        if getattr(self, "category", None) is not None:
+            result["category"] = self.category
+
         for key, item in self.__dict__.items():
             if isinstance(item, Quantity):
                 result[key] = item.to_dict()  # type: ignore
@@ -142,25 +163,28 @@ class Quantity:
 
         units = data.get("units", "")
 
-        # Build kwargs by flattening nested quantities
+        # A profile takes precedence over its tabulated values
+        if isinstance(data.get("profile"), dict):
+            value = Profile.from_dict(data["profile"])
+
+        # Nested quantities (e.g. a stream's attributes) are restored as attributes, other keys are passed as kwargs
         kwargs = {}
+        nested = {}
         for key, val in data.items():
-            if key in ("type", "value", "units", "_q"):
+            if key in ("type", "value", "units", "_q", "profile", "category"):
                 continue
 
-            # Check if this is a nested Quantity dict
             if isinstance(val, dict) and "type" in val:
-
-                # Extract the nested stream's value and units directly as kwargs
-                nested_value = val.get("value", 0)
-                if isinstance(nested_value, list):
-                    nested_value = np.array(nested_value)
-
-                nested_units = val.get("units", "")
-                kwargs[key] = nested_value
-                kwargs[f"{key}_units"] = nested_units
+                nested[key] = Quantity.from_dict(val)
             else:
                 kwargs[key] = val
 
         # Instantiate the correct class
-        return target_class(value, units, **kwargs)
+        instance = target_class(value, units, **kwargs)
+        for key, val in nested.items():
+            setattr(instance, key, val)
+
+        if "category" in data:
+            instance.category = data["category"]
+
+        return instance
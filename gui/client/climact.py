@@ -185,6 +185,24 @@ class ClimactClient:
             self._logger.warning(f"Failed to create edge: {response.get('reason')}")
             return None
 
+    def get_graph(self) -> Optional[dict]:
+        """
+        Get a snapshot of the whole graph from the server.
+
+        Returns:
+            Graph data (`nodes` and `edges` keyed by UID) if successful, None otherwise
+        """
+        payload = {
+            "guid": self._guid,
+        }
+        response = self.send_command("graph", "get_graph", payload)
+
+        if response.get("status") == "OK":
+            return response.get("response")
+        else:
+            self._logger.warning(f"Failed to get graph: {response.get('reason')}")
+            return None
+
     def get_node(self, nuid: str) -> Optional[dict]:
         """
         Get node data from the server.
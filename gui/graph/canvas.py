@@ -55,6 +55,8 @@ class Canvas(QtWidgets.QGraphicsScene):
     @dataclass
     class Geometry:
         bounds: QtCore.QRectF = field(default_factory=QtCore.QRectF)
+        margin: float = 500.0  # Space kept around the items when the scene rect is fitted to them
+        bsp_depth: int = 8  # BSP-index depth in large-scene mode (0 lets Qt choose it)
 
     def __init__(self, parent=None):
         """
@@ -79,6 +81,8 @@ class Canvas(QtWidgets.QGraphicsScene):
         )
 
         # Members
+        self._items: dict[str, NodeRepr | EdgeRepr] = {}  # uid -> item index, see `addItem`/`removeItem`
+        self._large_scene = False
         self._rmb_coordinate = QtCore.QPoint()
         self._menu = self._init_menu()
         self._preview = types.SimpleNamespace(
@@ -222,6 +226,9 @@ class Canvas(QtWidgets.QGraphicsScene):
 
         super().mouseMoveEvent(event)
 
+        # Recompute the edges of dragged nodes once, after all of them have moved
+        EdgeRepr.flush_pending()
+
     def mouseReleaseEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
 
         if self._preview.active:
@@ -243,8 +250,26 @@ class Canvas(QtWidgets.QGraphicsScene):
         if isinstance(item, NodeRepr):
             self._register_item_signals(item)
 
+        # Index nodes and edges by UID (the preview edge is not part of the graph)
+        if isinstance(item, (NodeRepr, EdgeRepr)) and item is not self._preview.vector:
+            self._items[item.uid] = item
+
         super().addItem(item)
 
+    def removeItem(
+        self,
+        item: QtWidgets.QGraphicsItem,
+    ) -> None:
+
+        if isinstance(item, (NodeRepr, EdgeRepr)) and self._items.get(item.uid) is item:
+            del self._items[item.uid]
+
+        # Removed edges no longer follow their nodes
+        if isinstance(item, EdgeRepr):
+            item.detach()
+
+        super().removeItem(item)
+
     def _preview_on(self, vertex: QtWidgets.QGraphicsObject):
 
         if self._preview.active:
@@ -335,6 +360,15 @@ class Canvas(QtWidgets.QGraphicsScene):
 
         self._preview_on(item)
 
+    @QtCore.Slot(NodeRepr)
+    def _on_item_focused(self, item: NodeRepr):
+
+        if not isinstance(item, NodeRepr):
+            return
+
+        data = self._client.get_node(item.uid) if self._graph_guid else None
+        item._on_show_node_data(item.uid, json.dumps(data or {}))
+
     @QtCore.Slot(str, str)
     def _on_notification_received(self, cuid: str, message: str) -> None:
 
@@ -415,17 +449,98 @@ class Canvas(QtWidgets.QGraphicsScene):
         if item:
             self.removeItem(item)
 
+    def load_snapshot(self, graph: dict) -> int:
+        """
+        Populate the canvas with a whole graph in one pass.
+
+        Scene indexing, change notifications and view updates are suspended while items are created, and edges are
+        attached once all nodes exist. Items that already exist on the canvas are skipped.
+
+        Args:
+            graph: Graph data as sent by the server: `{"nodes": {nuid: {...}}, "edges": {euid: {...}}}`
+
+        Returns:
+            The number of items added.
+        """
+
+        nodes = graph.get("nodes", {})
+        edges = graph.get("edges", {})
+
+        index_method = self.itemIndexMethod()
+        index_depth = self.bspTreeDepth()
+        viewports = [view.viewport() for view in self.views()]
+
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.blockSignals(True)
+        for viewport in viewports:
+            viewport.setUpdatesEnabled(False)
+
+        count = 0
+        try:
+            for nuid, data in nodes.items():
+                if nuid in self._items:
+                    continue
+
+                meta = data.get("meta", {})
+                node = NodeRepr(nuid, pos=QtCore.QPointF(meta.get("x", 0), meta.get("y", 0)))
+                self.addItem(node)
+                count += 1
+
+            for euid, data in edges.items():
+                source = self._items.get(data.get("source_uid"))
+                target = self._items.get(data.get("target_uid"))
+                if euid in self._items or not (source and target):
+                    continue
+
+                self.addItem(EdgeRepr(euid, origin=source, target=target))
+                count += 1
+
+        finally:
+            self.setItemIndexMethod(index_method)
+            self.setBspTreeDepth(index_depth)
+            self.blockSignals(False)
+            for viewport in viewports:
+                viewport.setUpdatesEnabled(True)
+                viewport.update()
+
+        if self._large_scene:
+            self._fit_scene_rect()
+
+        self._logger.info(f"Loaded {len(nodes)} nodes and {len(edges)} edges")
+        return count
+
+    def set_large_scene(self, enabled: bool = True) -> None:
+        """
+        Toggle the large-scene mode, for canvases with thousands of nodes and edges.
+
+        Qt picks the BSP-index depth from the item count (15 for 15k items), and every edge is filed in each leaf
+        its bounding rect overlaps, so moving a few hundred nodes then re-files edges across tens of thousands of
+        leaves. In large-scene mode the index uses the shallower `Geometry.bsp_depth`, and the scene rect grows to
+        fit the items instead of staying at the fixed `Geometry.bounds`.
+
+        Args:
+            enabled: Whether to enable (default) or disable the mode.
+        """
+
+        self._large_scene = enabled
+        self.setBspTreeDepth(self._geometry.bsp_depth if enabled else 0)
+        self._fit_scene_rect()
+
+    def _fit_scene_rect(self) -> None:
+
+        bounds = self._geometry.bounds
+        if self._large_scene and self._items:
+            margin = self._geometry.margin
+            bounds = bounds.united(
+                self.itemsBoundingRect().adjusted(-margin, -margin, margin, margin)
+            )
+
+        self.setSceneRect(bounds)
+
     def find_item_by_uid(self, uid: str) -> QtWidgets.QGraphicsItem | None:
         """Find an item in the canvas by its unique identifier."""
 
-        return next(
-            (
-                item
-                for item in self.items()
-                if isinstance(item, (NodeRepr, EdgeRepr)) and item.uid == uid
-            ),
-            None,
-        )
+        return self._items.get(uid)
 
     def load_graph(self, guid: str) -> bool:
         """
@@ -443,9 +558,16 @@ class Canvas(QtWidgets.QGraphicsScene):
             self._logger.error(f"Failed to connect to server for graph {guid}")
             return False
 
+        if snapshot := self._client.get_graph():
+            self.load_snapshot(snapshot)
+
         self._logger.info(f"Loaded graph {guid}")
         return True
 
     @property
     def uid(self) -> str:
         return self._uid
+
+    @property
+    def large_scene(self) -> bool:
+        return self._large_scene
@@ -4,18 +4,36 @@
 
 """Edge item for displaying graph connections."""
 
-from PySide6 import QtCore, QtGui, QtWidgets
-from gui.graph.reusable.image import Image
+from PySide6 import QtCore, QtGui, QtSvg, QtWidgets
+from gui.graph.reusable.image import ImageOpts
 import dataclasses
+import math
+import typing
 import weakref
 
 
 ItemState = QtWidgets.QStyle.StateFlag
 
+# Enum lookups are slow in PySide6, so the values used for every edge are resolved once
+_EDGE_FLAGS = (
+    QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+    | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption
+)
+_STATE_ENABLED = ItemState.State_Enabled
+_STATE_SELECTED = ItemState.State_Selected
+
 
 class EdgeRepr(QtWidgets.QGraphicsObject):
     """Edge item for displaying graph connections."""
 
+    # Edges with a moved endpoint, waiting to be recomputed (see `flush_pending`). Weak, so that a queued edge that
+    # is deleted before the next flush is not kept alive by the queue
+    _pending: typing.ClassVar[weakref.WeakSet["EdgeRepr"]] = weakref.WeakSet()
+
+    # Arrow renderer and default appearance, shared by all edges
+    _renderer: typing.ClassVar[QtSvg.QSvgRenderer | None] = None
+    _default: typing.ClassVar["EdgeRepr.Appearance | None"] = None
+
     @dataclasses.dataclass
     class Appearance:
         """Edge styling options.
@@ -24,47 +42,87 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
             width: Line width in pixels (default: 2).
             slack: The Bézier curve's slack factor (default: 0.4).
             pen: The vector's pen style.
+            lod_threshold: Below this level of detail, the edge is a straight line without its arrow.
         """
 
         width: float = 3.0
         slack: float = 0.4
+        lod_threshold: float = 0.5
         pen: dict[ItemState, QtGui.QPen] = dataclasses.field(default_factory=dict)
 
+        # The arrow drawn at the middle of the curve
+        arrow: str = ":/svg/arrow.svg"
+        arrow_size: QtCore.QSizeF = dataclasses.field(
+            default_factory=lambda: QtCore.QSizeF(ImageOpts["size"])
+        )
+
     def __init__(self, euid: str, origin=None, target=None):
         super().__init__(None)
 
         # Class members:
         self._uid = euid
         self._path = QtGui.QPainterPath()
-        self._arrow = Image(":/svg/arrow.svg", parent=self)
-        self._style = EdgeRepr.Appearance(
-            pen={
-                ItemState.State_Enabled: QtGui.QPen(QtGui.QColor(0xBEBEBE)),
-                ItemState.State_Selected: QtGui.QPen(QtGui.QColor(0xFFCB00)),
-            }
-        )
+        self._line = QtCore.QLineF()
+        self._shape: QtGui.QPainterPath | None = None  # Stroked on first hit test, see `shape`
+        self._rect = QtCore.QRectF()
+        self._style = EdgeRepr.default_appearance()
+
+        # The arrow is painted by the edge itself (see `paint`), at `_arrow_pos`, rotated by `_arrow_angle`
+        self._arrow_pos = QtCore.QPointF()
+        self._arrow_angle = 0.0
+
+        # The hover animation is created on first hover (see `_animation`)
+        self._anim: QtCore.QPropertyAnimation | None = None
 
         self._init_attr()
-        self._init_anim()
         self._init_endpoints(origin, target)
 
         # Toggle flags
-        graphics_item_flag = QtWidgets.QGraphicsItem.GraphicsItemFlag
-        self.setFlag(graphics_item_flag.ItemIsSelectable)
+        self.setFlags(_EDGE_FLAGS)
+
+    @classmethod
+    def default_appearance(cls) -> "EdgeRepr.Appearance":
+        """The appearance shared by all edges, created on first use."""
+
+        if cls._default is None:
+            cls._default = EdgeRepr.Appearance(
+                pen={
+                    _STATE_ENABLED: QtGui.QPen(QtGui.QColor(0xBEBEBE)),
+                    _STATE_SELECTED: QtGui.QPen(QtGui.QColor(0xFFCB00)),
+                }
+            )
+
+        return cls._default
+
+    @property
+    def _arrow_rect(self) -> QtCore.QRectF:
+        size = self._style.arrow_size
+        return QtCore.QRectF(-size.width() / 2, -size.height() / 2, size.width(), size.height())
+
+    @classmethod
+    def _arrow_renderer(cls) -> QtSvg.QSvgRenderer:
+        """One SVG renderer for the arrows of all edges, created on first paint."""
+
+        if cls._renderer is None:
+            cls._renderer = QtSvg.QSvgRenderer(cls.default_appearance().arrow)
+
+        return cls._renderer
 
     def _init_attr(self):
 
         self.setZValue(-10)
-        self.setPos(QtCore.QPointF(0, 0))
         self.setAcceptHoverEvents(True)
-        self.setProperty("linewidth", self._style.width)
+        self._linewidth = self._style.width
 
-    def _init_anim(self):
-        """Initializes hover animation."""
+    def _animation(self) -> QtCore.QPropertyAnimation:
+        """The hover animation, created on first use."""
 
-        self._anim = QtCore.QPropertyAnimation(self, b"thickness")
-        self._anim.setEasingCurve(QtCore.QEasingCurve.Type.OutQuad)
-        self._anim.setDuration(360)
+        if self._anim is None:
+            self._anim = QtCore.QPropertyAnimation(self, b"thickness")
+            self._anim.setEasingCurve(QtCore.QEasingCurve.Type.OutQuad)
+            self._anim.setDuration(360)
+
+        return self._anim
 
     def _init_endpoints(self, origin, target):
         """
@@ -77,22 +135,33 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
         self._origin = weakref.ref(origin) if origin else None
         self._target = weakref.ref(target) if target else None
 
+        # Nodes notify their edges directly when they move (see `NodeRepr.itemChange`), which is much cheaper to
+        # set up than two signal connections per edge
         if self._origin and self._target:
-            self._origin().item_shifted.connect(self._on_endpoint_shifted)
-            self._target().item_shifted.connect(self._on_endpoint_shifted)
-            self.update_path(
-                self._origin().scenePos(),
-                self._target().scenePos(),
-            )
+            origin.connect_edge(self, outgoing=True)
+            target.connect_edge(self, outgoing=False)
+            self._set_path(origin.scenePos(), target.scenePos())
+
+    def detach(self) -> None:
+        """Unregister the edge from its endpoints and the flush queue, e.g. when it is removed from the scene."""
+
+        EdgeRepr._pending.discard(self)
+        for ref in (self._origin, self._target):
+            if ref is not None and (node := ref()) is not None:
+                node.disconnect_edge(self)
 
     def boundingRect(self) -> QtCore.QRectF:
-        return self._path.boundingRect().adjusted(-4, -4, 4, 4)
+        return self._rect
 
-    def shape(self):
-        stroker = QtGui.QPainterPathStroker()
-        current_width = self.property("linewidth") or self._style.width
-        stroker.setWidth(current_width + 12)
-        return stroker.createStroke(self._path)
+    def shape(self) -> QtGui.QPainterPath:
+
+        # Stroking is the costliest part of a path update, and most edges are never hit-tested or painted up close
+        if self._shape is None:
+            stroker = QtGui.QPainterPathStroker()
+            stroker.setWidth(self._style.width + 1.0 + 12)
+            self._shape = stroker.createStroke(self._path)
+
+        return self._shape
 
     def paint(
         self,
@@ -101,29 +170,70 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
         widget: QtWidgets.QWidget = ...,
     ) -> None:
 
+        pen = self._style.pen[_STATE_SELECTED if self.isSelected() else _STATE_ENABLED]
+
+        # Low level of detail: a straight, non-antialiased, cosmetic line (which the painter clips cheaply)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self._style.lod_threshold:
+            pen.setWidthF(0)
+            painter.setPen(pen)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+            painter.drawLine(self._line)
+            return
+
+        # Cull edges whose curve misses the exposed area (an edge's bounding rect is mostly empty). The curve itself
+        # is tested against the exposed area grown by the arrow's reach (which exceeds the line's half-width), so the
+        # path is never stroked for painting; `shape` is only stroked for hit tests.
+        exposed = option.exposedRect
+        if not exposed.contains(self._rect):
+            size = self._style.arrow_size
+            reach = max(size.width(), size.height()) * 0.75
+            if not self._path.intersects(exposed.adjusted(-reach, -reach, reach, reach)):
+                return
+
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
 
-        pen = self._style.pen[
-            ItemState.State_Selected if self.isSelected() else ItemState.State_Enabled
-        ]
-        pen.setWidthF(self.property("linewidth") or self._style.width)
+        pen.setWidthF(self._linewidth or self._style.width)
         painter.setPen(pen)
         painter.drawPath(self._path)
 
+        # Arrow at the middle of the curve, pointing from origin to target
+        if not self._path.isEmpty():
+            painter.save()
+            painter.translate(self._arrow_pos)
+            painter.rotate(self._arrow_angle)
+            self._arrow_renderer().render(painter, self._arrow_rect)
+            painter.restore()
+
     def hoverEnterEvent(self, event, /):
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-        self._anim.stop()
-        self._anim.setStartValue(self._style.width)
-        self._anim.setEndValue(self._style.width + 1.0)
-        self._anim.start()
+        anim = self._animation()
+        anim.stop()
+        anim.setStartValue(self._style.width)
+        anim.setEndValue(self._style.width + 1.0)
+        anim.start()
 
     def hoverLeaveEvent(self, event, /):
         self.unsetCursor()
-        self._anim.stop()
-        self._anim.setStartValue(self._style.width + 1.0)
-        self._anim.setEndValue(self._style.width)
-        self._anim.start()
+        anim = self._animation()
+        anim.stop()
+        anim.setStartValue(self._style.width + 1.0)
+        anim.setEndValue(self._style.width)
+        anim.start()
+
+    @staticmethod
+    def _control(
+        origin: QtCore.QPointF,
+        target: QtCore.QPointF,
+    ) -> tuple[float, float]:
+        """The control point of the quadratic curve from origin to target."""
+
+        ctrl_ptx = origin.x() + (target.x() - origin.x()) * 0.5
+        ctrl_pty = origin.y() + (target.y() - origin.y()) * 0.5
+        ctrl_pty -= 20 if target.x() > origin.x() else -20
+        return ctrl_ptx, ctrl_pty
 
     @staticmethod
     def _compute(
@@ -135,9 +245,7 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
         path.moveTo(origin)
 
         # Calculate control points for a quadratic curve
-        ctrl_ptx = origin.x() + (target.x() - origin.x()) * 0.5
-        ctrl_pty = origin.y() + (target.y() - origin.y()) * 0.5
-        ctrl_pty -= 20 if target.x() > origin.x() else -20
+        ctrl_ptx, ctrl_pty = EdgeRepr._control(origin, target)
         path.quadTo(ctrl_ptx, ctrl_pty, target.x(), target.y())
 
         return path
@@ -153,8 +261,6 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
             origin: Origin point coordinate
             target: Target point coordinate
         """
-        self.prepareGeometryChange()
-
         # If we have stored vertex references, check if coordinates are swapped:
         if self._origin is not None and self._target is not None:
             true_origin_pos = self._origin().scenePos()
@@ -170,37 +276,96 @@ class EdgeRepr(QtWidgets.QGraphicsObject):
             if origin_int == true_target_int and target_int == true_origin_int:
                 origin, target = target, origin  # Swap to correct order
 
-        self._path.clear()
-        self._path = self._compute(origin, target)
+        self._set_path(origin, target)
 
-        # Position arrow at 50% along the path
-        self._arrow.setPos(self._path.pointAtPercent(0.50))
+    def _set_path(self, origin: QtCore.QPointF, target: QtCore.QPointF) -> None:
 
-        # Arrow always points in the origin -> target direction
-        angle = -self._path.angleAtPercent(0.5)
-        self._arrow.setRotation(angle)
+        self.prepareGeometryChange()
+        self._path = self._compute(origin, target)
+        self._line = QtCore.QLineF(origin, target)
+
+        # Position arrow at 50% along the path, always pointing in the origin -> target direction. For a quadratic
+        # curve, that point is (origin + 2 * control + target) / 4 and the tangent there is parallel to the chord
+        ctrl_ptx, ctrl_pty = self._control(origin, target)
+        dx, dy = target.x() - origin.x(), target.y() - origin.y()
+        self._arrow_pos = QtCore.QPointF(
+            (origin.x() + 2 * ctrl_ptx + target.x()) / 4,
+            (origin.y() + 2 * ctrl_pty + target.y()) / 4,
+        )
+        self._arrow_angle = math.degrees(math.atan2(dy, dx))
+
+        self._cache_geometry()
         self.update()
 
+    def _cache_geometry(self) -> None:
+        """
+        Compute the bounding rect once per path change, and drop the hit-test shape (stroked again on first use,
+        see `shape`). Both are sized for the widest (hovered) line, so the thickness animation never changes the
+        item's geometry.
+        """
+
+        self._shape = None
+        self._rect = self._path.boundingRect().adjusted(-4, -4, 4, 4)
+
+        # The arrow may stick out of the curve's bounds; any rotation stays within its circumscribed square
+        if not self._path.isEmpty():
+            size = self._style.arrow_size
+            reach = max(size.width(), size.height()) * 0.75
+            arrow = QtCore.QRectF(self._arrow_pos, self._arrow_pos).adjusted(-reach, -reach, reach, reach)
+            self._rect = self._rect.united(arrow)
+
     def clear(self):
-        self._arrow.setPos(QtCore.QPointF())
+        self.prepareGeometryChange()
+        self._arrow_pos = QtCore.QPointF()
         self._path.clear()
+        self._line = QtCore.QLineF()
+        self._cache_geometry()
 
-    @QtCore.Slot(QtCore.QPointF)
-    def _on_endpoint_shifted(self, pos: QtCore.QPointF) -> None:
+    @classmethod
+    def flush_pending(cls) -> int:
+        """
+        Recompute the paths of all edges whose endpoints moved since the last flush. The canvas flushes after each
+        mouse-move event, so dragging a multi-selection recomputes every affected edge once, not once per moved
+        endpoint; moves made outside mouse events are flushed on the next pass of the event loop.
 
-        if self._origin and self._target:
-            origin = self._origin().scenePos()
-            target = self._target().scenePos()
-            self.update_path(origin, target)
+        :return: The number of edges recomputed.
+        """
+
+        pending, cls._pending = list(cls._pending), weakref.WeakSet()
+        synced = 0
+        for edge in pending:
+            # Edges removed from the scene since they were queued need no update
+            if edge.scene() is None:
+                continue
+
+            edge._sync_endpoints()
+            synced += 1
+
+        return synced
+
+    def _sync_endpoints(self) -> None:
+
+        origin = self._origin() if self._origin else None
+        target = self._target() if self._target else None
+
+        if origin is not None and target is not None:
+            self.update_path(origin.scenePos(), target.scenePos())
+
+    def endpoint_shifted(self) -> None:
+        """Called by the edge's nodes when they move: queue the edge for the next `flush_pending`."""
+
+        if not EdgeRepr._pending:
+            QtCore.QTimer.singleShot(0, EdgeRepr.flush_pending)
+
+        EdgeRepr._pending.add(self)
 
     @QtCore.Property(float)
     def thickness(self) -> float:
-        return self.property("linewidth")
+        return self._linewidth
 
     @thickness.setter
     def thickness(self, value: float) -> None:
-        self.setProperty("linewidth", value)
-        self.prepareGeometryChange()
+        self._linewidth = value
         self.update()
 
     @property
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 # Standard
+import functools
 import json
 import logging
 
@@ -19,9 +20,18 @@ from PySide6 import QtCore
 from PySide6 import QtWidgets
 
 from gui.graph.node.config import NodeConfigWidget
+from gui.graph.reusable.icon import paint_icon
 
 ItemState = QtWidgets.QStyle.StateFlag
 
+# Enum lookups are slow in PySide6, so the values used for every node are resolved once
+_NODE_FLAGS = (
+    QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+    | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+    | QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsScenePositionChanges
+)
+_POSITION_CHANGED = QtWidgets.QGraphicsItem.GraphicsItemChange.ItemScenePositionHasChanged
+
 
 class NodeRepr(QtWidgets.QGraphicsObject):
 
@@ -54,8 +64,11 @@ class NodeRepr(QtWidgets.QGraphicsObject):
         Attributes:
             border: The node's border style.
             background: The node's background style.
+            lod_threshold: Below this level of detail, the node is drawn as a plain rectangle.
         """
 
+        lod_threshold: float = 0.5
+
         border: dict[ItemState, QtGui.QPen] = field(
             default_factory=lambda: {
                 ItemState.State_Enabled: QtGui.QPen(QtGui.QColor(0x232A2E), 1.0),
@@ -93,8 +106,8 @@ class NodeRepr(QtWidgets.QGraphicsObject):
         """Dictionaries to store the node's connections.
 
         Attributes:
-            incoming: The node's incoming connections.
-            outgoing: The node's outgoing connections.
+            incoming: The node's incoming edges (as dictionary keys), notified when the node moves.
+            outgoing: The node's outgoing edges (as dictionary keys), notified when the node moves.
         """
 
         incoming: dict[object, object] = field(default_factory=dict)
@@ -108,52 +121,44 @@ class NodeRepr(QtWidgets.QGraphicsObject):
         **kwargs,
     ) -> None:
 
-        # Instantiate dataclasses before super().__init__()
+        # Instantiate dataclasses before super().__init__(). Geometry and appearance are frozen, so all nodes share
+        # one instance of each (see `_shared`)
         self._uid = nuid
-        self._geometry = NodeRepr.Geometric()
+        self._geometry, self._appearance = NodeRepr._shared()
         self._attributes = NodeRepr.Attrs()
-        self._appearance = NodeRepr.Appearance()
         self._connections = NodeRepr.Connections()
 
         # Initialize super-class with appropriate data
         super().__init__(parent, pos=kwargs.pop("pos", QtCore.QPointF()), z=0)
 
         # Toggle flags
-        graphics_item_flag = QtWidgets.QGraphicsItem.GraphicsItemFlag
-        self.setFlag(graphics_item_flag.ItemIsMovable)
-        self.setFlag(graphics_item_flag.ItemIsSelectable)
-        self.setFlag(graphics_item_flag.ItemSendsScenePositionChanges)
-
-        # UI child elements
-        self._init_image()
-        self._init_label()
-
-        # Config dialog (lazy init)
-        self._configurator = NodeConfigWidget()
-
-    def _init_image(self):
+        self.setFlags(_NODE_FLAGS)
 
-        # QtAwesome Icon
-        from qtawesome import icon as qta_icon
+        # UI child elements: the label is created when the node is first painted at a readable zoom (see `paint`);
+        # None until then, False while its creation is scheduled
+        self._label = None
 
-        self._node_icon = qta_icon(
-            self._attributes.image,
-            color=self._attributes.color,
-            color_active="black",
-        )
+    @staticmethod
+    @functools.cache
+    def _shared() -> tuple[NodeRepr.Geometric, NodeRepr.Appearance]:
+        return NodeRepr.Geometric(), NodeRepr.Appearance()
 
     def _init_label(self):
 
+        if isinstance(self._label, QtWidgets.QGraphicsTextItem):
+            return
+
         # Import `Label` from gui.graph.reusable
         from gui.graph.reusable.label import Label
 
         # TODO: Find a better way to locate the situate the label w.r.t the node.
-        label = Label(
-            self._attributes.label,
+        label = self._label = Label(
+            self.objectName() or self._attributes.label,
             parent=self,
             width=120,
             align=QtCore.Qt.AlignmentFlag.AlignCenter,
             pos=QtCore.QPointF(-60, 18),
+            lod=self._appearance.lod_threshold,
         )
 
         label.sig_text_changed.connect(self.setObjectName)
@@ -184,6 +189,24 @@ class NodeRepr(QtWidgets.QGraphicsObject):
         pen_dict = self._appearance.border
         brs_dict = self._appearance.background
 
+        # Low level of detail: a plain, non-antialiased rectangle without the icon
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+
+        # The label is readable from here on; create it after this paint (items must not be added while painting)
+        if self._label is None and lod >= self._appearance.lod_threshold:
+            self._label = False
+            QtCore.QTimer.singleShot(0, self, self._init_label)
+
+        if lod < self._appearance.lod_threshold:
+            state = (
+                ItemState.State_Selected
+                if option.state & ItemState.State_Selected
+                else ItemState.State_Enabled
+            )
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, False)
+            painter.fillRect(self._geometry.dimensions, brs_dict[state])
+            return
+
         if option.state & ItemState.State_Selected:
             painter.setPen(pen_dict[ItemState.State_Selected])
             painter.setBrush(brs_dict[ItemState.State_Selected])
@@ -202,19 +225,21 @@ class NodeRepr(QtWidgets.QGraphicsObject):
             self._geometry.border_radius,
         )
 
-        # If an icon is available, paint it on top
-        from qtawesome import icon as qta_icon
-
+        # If an icon is available, paint it on top (from the shared pixmap cache)
         color = "black" if self.isSelected() else self._attributes.color
-        qta_icon(self._attributes.image, color=color).paint(
+        paint_icon(
             painter,
             self.boundingRect().adjusted(8, 8, -8, -8).toRect(),
+            self._attributes.image,
+            color,
         )
 
     def itemChange(self, change: QtWidgets.QGraphicsItem.GraphicsItemChange, value):
 
-        graphics_item_change = QtWidgets.QGraphicsItem.GraphicsItemChange
-        if change == graphics_item_change.ItemScenePositionHasChanged:
+        if change == _POSITION_CHANGED:
+            for edge in (*self._connections.incoming, *self._connections.outgoing):
+                edge.endpoint_shifted()
+
             self.item_shifted.emit(self)
 
         return super().itemChange(change, value)
@@ -246,6 +271,9 @@ class NodeRepr(QtWidgets.QGraphicsObject):
 
     def mouseDoubleClickEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
 
+        # The canvas fetches the node's data and opens the configurator (see `_on_show_node_data`)
+        self.item_focused.emit(self)
+
         # Fetch the node's data using the signal bus
         cuid = getattr(self.scene(), "uid", None)
         # if cuid:
@@ -263,9 +291,10 @@ class NodeRepr(QtWidgets.QGraphicsObject):
         if nuid != self._uid:
             return
 
-        data = json.loads(jstr)
-        self._configurator.from_data(data)
-        self._configurator.show()
+        # The configurator is created on first use and shared by all nodes
+        configurator = NodeConfigWidget.shared()
+        configurator.bind(nuid, json.loads(jstr))
+        configurator.show()
 
     @QtCore.Slot(str)
     def _on_config_save(self, jstr: str) -> None:
@@ -291,6 +320,17 @@ class NodeRepr(QtWidgets.QGraphicsObject):
             "item_focused": self.item_focused,
         }
 
+    def connect_edge(self, edge: QtWidgets.QGraphicsObject, outgoing: bool) -> None:
+        """Register an edge, which is then notified whenever the node moves."""
+
+        connections = self._connections.outgoing if outgoing else self._connections.incoming
+        connections[edge] = None
+
+    def disconnect_edge(self, edge: QtWidgets.QGraphicsObject) -> None:
+
+        self._connections.incoming.pop(edge, None)
+        self._connections.outgoing.pop(edge, None)
+
     # Properties
     # ----------
 
@@ -23,6 +23,13 @@ from gui.widgets import TabWidget
 
 
 class NodeConfigWidget(QtWidgets.QDialog):
+    """
+    Configuration dialog for graph nodes. A single pooled instance (see `shared`) is bound to whichever node is
+    being configured, so that nodes do not each own a hidden dialog.
+    """
+
+    # Pooled instance, created on first use
+    _shared: typing.ClassVar[NodeConfigWidget | None] = None
 
     @dataclass
     class Appearance:
@@ -74,6 +81,9 @@ class NodeConfigWidget(QtWidgets.QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # UID of the node the dialog is bound to
+        self._nuid: str | None = None
+
         # Make window transparent and frameless
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setWindowFlags(QtCore.Qt.WindowType.FramelessWindowHint)
@@ -155,6 +165,25 @@ class NodeConfigWidget(QtWidgets.QDialog):
 
         return tabs
 
+    @classmethod
+    def shared(cls) -> NodeConfigWidget:
+        """Return the pooled dialog, creating it on first use."""
+
+        if cls._shared is None:
+            cls._shared = cls()
+
+        return cls._shared
+
+    def bind(self, nuid: str, data: dict[str, typing.Any]) -> None:
+        """Re-bind the dialog to a node and load its data."""
+
+        self._nuid = nuid
+        self.from_data(data)
+
+    @property
+    def nuid(self) -> str | None:
+        return self._nuid
+
     def from_data(self, data: dict[str, typing.Any]) -> None:
 
         # Metadata
@@ -1,166 +1,729 @@
 # Filename: tree.py
 # Module name: config
-# Description: Four-column QTreeWidget with category headers and editable stream items.
+# Description: Three-column stream tree (model/view) with category headers and editable stream attributes.
+
+"""
+Stream tree of the node configuration dialog.
+
+The tree is a `StreamTreeModel` over one of a technology's stream dictionaries (`Technology.inp`, `out` or `par`),
+shown by a `StreamTree` view. It has four levels:
+
+    category (Fuel, Fluid, ...)  >  stream  >  section (Primary, Emissions, ...)  >  attribute
+
+Each stream is a `Quantity`. Its attributes (see `Composite.attribute_hierarchy`) are stored as nested quantities on
+the stream, so `Quantity.to_dict()` serializes them. Values are edited through a delegate, and the row actions are
+painted and hit-tested by the delegate instead of being embedded widgets. Section and attribute rows are created
+when a stream is first expanded, so a node's widget count and memory do not grow with its number of streams.
+"""
 
 from __future__ import annotations
 
+# Standard
+import logging
+import re
+import typing
+
 # PySide6 (Python/Qt)
 from PySide6 import QtGui
 from PySide6 import QtCore
 from PySide6 import QtWidgets
 import qtawesome as qta
-import typing
 
-
-# core.gui.widgets
-from gui.widgets.toolbar import ToolBar
+# core.streams
+from core.streams import Quantity, ureg
 from core.streams.composite import Composite, Fuel, Fluid, Material, Electricity
 
 
-class StreamTree(QtWidgets.QTreeWidget):
+class _Row:
+    """
+    Internal node of the stream tree, referenced by the model indexes' internal pointers.
 
-    def __init__(self, parent=None):
-        super().__init__(parent, columnCount=3)
-        super().setEditTriggers(QtWidgets.QTreeWidget.EditTrigger.DoubleClicked)
+    Kinds: "category" (key: the stream class), "stream" (key: the stream name), "section" (key: the section name) and
+    "attribute" (key: the attribute name, label: its display label).
+    """
 
-        # Customize appearance and behaviour
-        self.setHeaderLabels(["Stream", "Value", ""])
-        self.setStyleSheet("QTreeWidget::item { height: 28px; padding: 2px;}")
-        self.setSelectionMode(QtWidgets.QTreeWidget.SelectionMode.SingleSelection)
+    __slots__ = ("kind", "key", "label", "parent", "row", "children")
 
-        # Customize header
-        header = self.header()
-        header.setDefaultAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.setColumnWidth(0, 400)
-        self.setColumnWidth(1, 200)
+    def __init__(self, kind: str, key: typing.Any, parent: _Row | None, row: int, label: str = ""):
 
-        # Primary action group for selecting the node's primary stream
-        self._primary_group = QtGui.QActionGroup(self)
-        self._tree_data: dict[str, QtWidgets.QWidget] = {}
+        self.kind = kind
+        self.key = key
+        self.label = label
+        self.parent = parent
+        self.row = row
+        self.children: list[_Row] | None = [] if kind == "attribute" else None  # Streams: None until requested
 
-        # Initialize top-level items
-        self._init_top_level([Fuel, Fluid, Material, Electricity])
+    @property
+    def category(self) -> type:
+        """The category (stream class) this row belongs to."""
 
-    def _init_top_level(self, _stream_list: list[type]):
+        row = self
+        while row.kind != "category":
+            row = row.parent
 
-        for _class in _stream_list:
+        return row.key
 
-            image = "mdi.arrow-right-bold"
-            color = "gray"
-            if issubclass(_class, Composite):
-                image = _class.image
-                color = _class.color
+    @property
+    def stream(self) -> str | None:
+        """The name of the stream this row belongs to, if any."""
 
-            label = getattr(_class, "_label", _class.__name__)
-            item = QtWidgets.QTreeWidgetItem(self)
-            item.setText(0, label)
-            item.setIcon(0, qta.icon(image, color=color))
-            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, _class)
+        row = self
+        while row is not None and row.kind != "stream":
+            row = row.parent
 
-            font = item.font(0)
-            font.setBold(True)
-            item.setFont(0, font)
+        return row.key if row is not None else None
 
-            toolbar = ToolBar(
-                self,
-                trailing=True,
-            )
 
-            add_stream = toolbar.addAction(
-                qta.icon("mdi.plus", color="gray", color_active="white"), "Add Stream"
-            )
-            add_stream.triggered.connect(lambda _, i=item: self.create_row(i))
+class StreamTreeModel(QtCore.QAbstractItemModel):
+    """
+    Item model over a dictionary of streams, grouped by category. Edits are written through to the dictionary.
+    """
 
-            self.setItemWidget(item, 2, toolbar)
+    # Class logger
+    _logger = logging.getLogger("StreamTreeModel")
 
-    def _get_root_from_selection(self) -> QtWidgets.QTreeWidgetItem | None:
+    # Columns
+    NAME, VALUE, ACTIONS = range(3)
 
-        if selected := self.currentItem():
-            while selected.parent():
-                selected = selected.parent()
+    # Units of new streams, by category (default: mass flow)
+    UNITS = {Electricity: "kW"}
 
-            return selected
+    def __init__(
+        self,
+        streams: dict[str, Quantity] | None = None,
+        categories: typing.Sequence[type] = (Fuel, Fluid, Material, Electricity),
+        parent=None,
+    ):
+
+        super().__init__(parent)
+
+        self._icons: dict[str, QtGui.QIcon] = {}
+        self._categories = [
+            _Row("category", category, None, row) for row, category in enumerate(categories)
+        ]
+
+        for category in self._categories:
+            category.children = []
+
+        self._streams: dict[str, Quantity] = {}
+        self.set_streams(streams if streams is not None else {})
+
+    # Section: Binding
+    # ----------------
+
+    def set_streams(self, streams: dict[str, Quantity]) -> None:
+        """
+        Bind the model to a dictionary of streams (e.g. `Technology.inp`), which is edited in place.
+        """
+
+        self.beginResetModel()
+
+        self._streams = streams
+        for category in self._categories:
+            category.children = []
+
+        for name, quantity in streams.items():
+            category = self._category_row(self._category_of(quantity))
+            category.children.append(_Row("stream", name, category, len(category.children)))
+
+        self.endResetModel()
+
+    def _category_of(self, quantity: Quantity) -> type:
+        """
+        The category of a stream: the one recorded on the stream, else the one whose default units match.
+        """
+
+        recorded = getattr(quantity, "category", None)
+        for category in self._categories:
+            if getattr(category.key, "label", category.key.__name__) == recorded:
+                return category.key
+
+        for category in self._categories:
+            units = self.UNITS.get(category.key)
+            if units and ureg.parse_units(units).dimensionality == quantity.dimensionality():
+                return category.key
+
+        return Material if any(row.key is Material for row in self._categories) else self._categories[0].key
+
+    def _category_row(self, category: type) -> _Row:
+        return next(row for row in self._categories if row.key is category)
+
+    # Section: Structure
+    # ------------------
+
+    def _row(self, index: QtCore.QModelIndex) -> _Row | None:
+        return index.internalPointer() if index.isValid() else None
+
+    def _children(self, row: _Row | None) -> list[_Row]:
+
+        if row is None:
+            return self._categories
+
+        if row.children is None:
+            row.children = self._attribute_rows(row)
+
+        return row.children
+
+    def _attribute_rows(self, stream: _Row) -> list[_Row]:
+        """
+        Section and attribute rows of a stream, created on first access.
+        """
+
+        sections = []
+        hierarchy = getattr(stream.category, "attribute_hierarchy", {})
+        for key, attributes in hierarchy.items():
+
+            section = _Row("section", key, stream, len(sections))
+            section.children = [
+                _Row("attribute", attr, section, row, label=label)
+                for row, (attr, label) in enumerate(attributes.items())
+            ]
+            sections.append(section)
+
+        return sections
+
+    def index(self, row: int, column: int, parent=QtCore.QModelIndex()) -> QtCore.QModelIndex:
+
+        children = self._children(self._row(parent))
+        if 0 <= row < len(children) and 0 <= column < 3:
+            return self.createIndex(row, column, children[row])
+
+        return QtCore.QModelIndex()
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+
+        row = self._row(index)
+        if row is None or row.parent is None:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row.parent.row, 0, row.parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+
+        if parent.column() > 0:
+            return 0
+
+        return len(self._children(self._row(parent)))
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 3
+
+    def hasChildren(self, parent=QtCore.QModelIndex()) -> bool:
+
+        row = self._row(parent)
+        if row is not None and row.kind == "stream":
+            return bool(getattr(row.category, "attribute_hierarchy", {}))
+
+        return super().hasChildren(parent)
+
+    # Section: Data
+    # -------------
+
+    def headerData(self, section: int, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return ["Stream", "Value", ""][section]
+
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
 
         return None
 
-    def _add_grouped_attributes(
-        self,
-        root: QtWidgets.QTreeWidgetItem,
-        composite_cls: type,
-    ) -> None:
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+
+        row = self._row(index)
+        if row is None:
+            return QtCore.Qt.ItemFlag.NoItemFlags
+
+        flags = QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+        editable = (row.kind == "stream" and index.column() in (self.NAME, self.VALUE)) or (
+            row.kind == "attribute" and index.column() == self.VALUE
+        )
+
+        return flags | QtCore.Qt.ItemFlag.ItemIsEditable if editable else flags
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+
+        row = self._row(index)
+        if row is None:
+            return None
+
+        column = index.column()
+        display = role in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole)
+
+        if row.kind == "category":
+            category = row.key
+            if display and column == self.NAME:
+                return getattr(category, "label", category.__name__)
+
+            if role == QtCore.Qt.ItemDataRole.DecorationRole and column == self.NAME:
+                if issubclass(category, Composite):
+                    return self._icon(category.image, category.color)
+
+                return self._icon("mdi.arrow-right-bold", "gray")
+
+            if role == QtCore.Qt.ItemDataRole.FontRole and column == self.NAME:
+                font = QtGui.QFont()
+                font.setBold(True)
+                return font
+
+            if role == QtCore.Qt.ItemDataRole.UserRole:
+                return category
+
+        elif row.kind == "stream":
+            if display and column == self.NAME:
+                return row.key
+
+            if display and column == self.VALUE:
+                return self._format(self._streams.get(row.key))
+
+            if role == QtCore.Qt.ItemDataRole.DecorationRole and column == self.NAME:
+                return self._icon("mdi.format-list-bulleted", "#cbcbcb")
+
+        elif row.kind == "section":
+            if display and column == self.NAME:
+                return row.key.capitalize()
+
+            if role == QtCore.Qt.ItemDataRole.DecorationRole and column == self.NAME:
+                return self._icon("mdi.minus", "white")
+
+        elif row.kind == "attribute":
+            if display and column == self.NAME:
+                return row.label
+
+            if display and column == self.VALUE:
+                return self._format(self._attribute(row))
+
+            if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column == self.NAME:
+                return QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignRight
+
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column == self.VALUE:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def setData(self, index: QtCore.QModelIndex, value, role=QtCore.Qt.ItemDataRole.EditRole) -> bool:
+
+        row = self._row(index)
+        if row is None or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+
+        if row.kind == "stream" and index.column() == self.NAME:
+            return self._rename(row, str(value).strip())
+
+        if row.kind == "stream" and index.column() == self.VALUE:
+            current = self._streams[row.key]
+            quantity = self._parse(str(value), str(current.units))
+            if quantity is None or quantity.dimensionality() != current.dimensionality():
+                self._logger.warning(f"Invalid value for stream {row.key}: {value}")
+                return False
+
+            # Keep the stream's attributes
+            for attr, item in vars(current).items():
+                if attr != "_q" and attr != "profile":
+                    setattr(quantity, attr, item)
+
+            self._streams[row.key] = quantity
+            self.dataChanged.emit(index, index)
+            return True
+
+        if row.kind == "attribute" and index.column() == self.VALUE:
+            quantity = self._parse(str(value), self._label_units(row.label))
+            if quantity is None:
+                self._logger.warning(f"Invalid value for {row.key}: {value}")
+                return False
+
+            setattr(self._streams[row.stream], row.key, quantity)
+            self.dataChanged.emit(index, index)
+            return True
+
+        return False
+
+    def _attribute(self, row: _Row) -> Quantity | None:
+
+        value = getattr(self._streams.get(row.stream), row.key, None)
+        return value if isinstance(value, Quantity) else None
+
+    @staticmethod
+    def _format(quantity: Quantity | None) -> str:
+
+        if quantity is None:
+            return ""
+
+        value = quantity.value
+        if getattr(value, "ndim", 0):
+            text = f"{value.flat[0]:g} .. {value.flat[-1]:g}"
+        else:
+            text = f"{value:g}"
 
-        hierarchy = getattr(composite_cls, "attribute_hierarchy", {})
-        for key in hierarchy:
+        units = f"{quantity.units:~}"
+        return f"{text} {units}" if units else text
 
-            section = QtWidgets.QTreeWidgetItem([key.capitalize()])
-            section.setIcon(0, qta.icon("mdi.minus", color="white"))
+    @staticmethod
+    def _label_units(label: str) -> str:
+        """Units in an attribute label, e.g. "kg/s" for "Mass [kg/s]"."""
 
-            icon = "mdi.format-list-bulleted"
-            root.setIcon(0, qta.icon(icon, color="#cbcbcb"))
-            root.addChild(section)
+        match = re.search(r"\[(.*)\]", label)
+        return match.group(1) if match else "dimensionless"
 
-            for attr in hierarchy[key]:
+    @staticmethod
+    def _parse(text: str, units: str) -> Quantity | None:
+        """
+        Parse a value with optional units (default: `units`) into the matching Quantity subclass.
+        """
 
-                label = hierarchy[key][attr]
-                field = QtWidgets.QTreeWidgetItem(section)
-                field.setText(0, label)
-                field.setTextAlignment(
-                    0,
-                    QtCore.Qt.AlignmentFlag.AlignVCenter
-                    | QtCore.Qt.AlignmentFlag.AlignRight,
+        try:
+            parsed = ureg.Quantity(text.strip())
+            if parsed.dimensionless and not re.search(r"[A-Za-z%]", text):
+                parsed = ureg.Quantity(parsed.magnitude, units)
+
+            expected = ureg.parse_units(units).dimensionality
+            if parsed.dimensionality != expected:
+                return None
+
+            value = f"{parsed.magnitude} {parsed.units}"
+            return Quantity.registry.get(Quantity(value).dimensionality(), Quantity)(value)
+
+        except Exception:
+            return None
+
+    def _icon(self, name: str, color: str) -> QtGui.QIcon:
+
+        key = f"{name}:{color}"
+        if key not in self._icons:
+            self._icons[key] = qta.icon(name, color=color)
+
+        return self._icons[key]
+
+    # Section: Editing
+    # ----------------
+
+    def add_stream(self, category: type, name: str | None = None) -> QtCore.QModelIndex:
+        """
+        Add a stream to a category.
+
+        :param category: The stream's category
+        :param name: The stream's name (default: "<Category> <n>")
+        :return: Index of the new stream's name.
+        """
+
+        parent = self._category_row(category)
+        label = getattr(category, "label", category.__name__)
+
+        if name is None:
+            count = len(parent.children) + 1
+            while f"{label} {count}" in self._streams:
+                count += 1
+
+            name = f"{label} {count}"
+
+        if name in self._streams:
+            self._logger.warning(f"Stream {name} already exists")
+            return QtCore.QModelIndex()
+
+        units = self.UNITS.get(category, "kg/s")
+        quantity = Quantity.registry.get(ureg.parse_units(units).dimensionality, Quantity)(f"0 {units}")
+        quantity.category = label
+
+        position = len(parent.children)
+        self.beginInsertRows(self.createIndex(parent.row, 0, parent), position, position)
+        self._streams[name] = quantity
+        parent.children.append(_Row("stream", name, parent, position))
+        self.endInsertRows()
+
+        return self.index(position, self.NAME, self.createIndex(parent.row, 0, parent))
+
+    def remove_stream(self, index: QtCore.QModelIndex) -> bool:
+        """
+        Remove the stream at (or containing) an index.
+        """
+
+        row = self._row(index)
+        while row is not None and row.kind != "stream":
+            row = row.parent
+
+        if row is None:
+            return False
+
+        category = row.parent
+        self.beginRemoveRows(self.createIndex(category.row, 0, category), row.row, row.row)
+        self._streams.pop(row.key, None)
+        del category.children[row.row]
+        for position, sibling in enumerate(category.children[row.row :], start=row.row):
+            sibling.row = position
+        self.endRemoveRows()
+
+        return True
+
+    def erase_stream(self, index: QtCore.QModelIndex) -> None:
+        """
+        Clear the attributes of the stream at (or containing) an index.
+        """
+
+        row = self._row(index)
+        while row is not None and row.kind != "stream":
+            row = row.parent
+
+        if row is None:
+            return
+
+        quantity = self._streams[row.key]
+        for attributes in getattr(row.category, "attribute_hierarchy", {}).values():
+            for attr in attributes:
+                if isinstance(getattr(quantity, attr, None), Quantity):
+                    delattr(quantity, attr)
+
+        if row.children is not None:
+            first = self.index(0, self.VALUE, self.createIndex(row.row, 0, row))
+            self.dataChanged.emit(first, first)
+            for section in row.children:
+                section_index = self.createIndex(section.row, 0, section)
+                self.dataChanged.emit(
+                    self.index(0, self.VALUE, section_index),
+                    self.index(len(section.children) - 1, self.VALUE, section_index),
                 )
 
-                self.setItemWidget(field, 1, QtWidgets.QLineEdit(self))
+    def _rename(self, row: _Row, name: str) -> bool:
+
+        if not name or (name != row.key and name in self._streams):
+            self._logger.warning(f"Invalid stream name: {name!r}")
+            return False
+
+        if name == row.key:
+            return True
+
+        # Rename in place, keeping the streams' order
+        items = [(name if key == row.key else key, value) for key, value in self._streams.items()]
+        self._streams.clear()
+        self._streams.update(items)
+
+        row.key = name
+        index = self.createIndex(row.row, 0, row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    # Section: Queries
+    # ----------------
+
+    def kind(self, index: QtCore.QModelIndex) -> str | None:
+        """The kind of row at an index: "category", "stream", "section" or "attribute"."""
+
+        row = self._row(index)
+        return row.kind if row is not None else None
+
+    def category(self, index: QtCore.QModelIndex) -> type | None:
+        """The category of the row at an index."""
+
+        row = self._row(index)
+        return row.category if row is not None else None
+
+    def category_index(self, category: type) -> QtCore.QModelIndex:
+
+        row = self._category_row(category)
+        return self.createIndex(row.row, 0, row)
+
+    @property
+    def streams(self) -> dict[str, Quantity]:
+        return self._streams
+
+
+class StreamDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Edits values with a line edit, and paints the action icons of category rows (add) and stream rows (erase,
+    delete) in the last column.
+    """
+
+    # Emitted when an action icon is clicked, with the action's name and the row's index:
+    sig_action = QtCore.Signal(str, QtCore.QModelIndex)
+
+    # Actions of each row kind: (name, icon, color, tooltip)
+    ACTIONS = {
+        "category": [("add", "mdi.plus", "gray", "Add Stream")],
+        "stream": [
+            ("erase", "mdi.eraser", "gray", "Erase"),
+            ("delete", "mdi.delete", "red", "Delete"),
+        ],
+    }
+
+    def __init__(self, parent=None, row_height: int = 28, icon_size: int = 18):
+
+        super().__init__(parent)
+
+        self._row_height = row_height
+        self._icon_size = icon_size
+        self._icons = {
+            name: qta.icon(image, color=color)
+            for actions in self.ACTIONS.values()
+            for name, image, color, _ in actions
+        }
+
+    def _action_rects(self, rect: QtCore.QRect, kind: str | None) -> list[tuple[str, QtCore.QRect]]:
+        """Right-aligned icon rects of a row's actions."""
+
+        actions = self.ACTIONS.get(kind, [])
+        size, spacing = self._icon_size, 6
+        top = rect.top() + (rect.height() - size) // 2
+        right = rect.right() - spacing
+
+        rects = []
+        for name, *_ in reversed(actions):
+            rects.append((name, QtCore.QRect(right - size + 1, top, size, size)))
+            right -= size + spacing
+
+        return rects
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+
+        super().paint(painter, option, index)
+
+        if index.column() != StreamTreeModel.ACTIONS:
+            return
+
+        kind = index.model().kind(index)
+        for name, rect in self._action_rects(option.rect, kind):
+            self._icons[name].paint(painter, rect)
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+
+        hint = super().sizeHint(option, index)
+        return QtCore.QSize(hint.width(), self._row_height)
+
+    def createEditor(self, parent, option, index) -> QtWidgets.QWidget:
+
+        editor = QtWidgets.QLineEdit(parent)
+        editor.setFrame(False)
+        if index.column() == StreamTreeModel.VALUE:
+            editor.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+
+        return editor
+
+    def editorEvent(self, event, model, option, index) -> bool:
+
+        if (
+            index.column() == StreamTreeModel.ACTIONS
+            and event.type() == QtCore.QEvent.Type.MouseButtonRelease
+            and event.button() == QtCore.Qt.MouseButton.LeftButton
+        ):
+            for name, rect in self._action_rects(option.rect, model.kind(index)):
+                if rect.contains(event.position().toPoint()):
+                    self.sig_action.emit(name, QtCore.QPersistentModelIndex(index))
+                    return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index) -> bool:
+
+        if event.type() == QtCore.QEvent.Type.ToolTip and index.column() == StreamTreeModel.ACTIONS:
+            kind = index.model().kind(index)
+            tips = {name: tip for name, _, _, tip in self.ACTIONS.get(kind, [])}
+            for name, rect in self._action_rects(option.rect, kind):
+                if rect.contains(event.pos()):
+                    QtWidgets.QToolTip.showText(event.globalPos(), tips[name], view)
+                    return True
+
+        return super().helpEvent(event, view, option, index)
+
+
+class StreamTree(QtWidgets.QTreeView):
+
+    def __init__(self, parent=None, streams: dict[str, Quantity] | None = None):
+        super().__init__(parent)
+
+        self._model = StreamTreeModel(streams, parent=self)
+        self._delegate = StreamDelegate(self)
+        self._delegate.sig_action.connect(self._on_action)
+
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+        self.setEditTriggers(QtWidgets.QTreeView.EditTrigger.DoubleClicked)
+
+        # Customize appearance and behaviour
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QtWidgets.QTreeView.SelectionMode.SingleSelection)
+        self.setMouseTracking(True)
+
+        # Customize header
+        header = self.header()
+        header.setDefaultAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        header.setStretchLastSection(True)
+        self.setColumnWidth(0, 400)
+        self.setColumnWidth(1, 200)
+
+    def _get_root_from_selection(self) -> QtCore.QModelIndex:
+
+        if (selected := self.currentIndex()).isValid():
+            while selected.parent().isValid():
+                selected = selected.parent()
+
+            return selected
+
+        return QtCore.QModelIndex()
+
+    @QtCore.Slot(str, QtCore.QModelIndex)
+    def _on_action(self, action: str, index: QtCore.QModelIndex) -> None:
+
+        index = QtCore.QModelIndex(index)
+        if action == "add":
+            self.create_row(index)
+        elif action == "erase":
+            self._model.erase_stream(index)
+        elif action == "delete":
+            self.delete_row(index)
 
     @QtCore.Slot()
     def create_row(
-        self, root: QtWidgets.QTreeWidgetItem
-    ) -> QtWidgets.QTreeWidgetItem | None:
+        self, root: QtCore.QModelIndex | type | None = None, name: str | None = None
+    ) -> QtCore.QModelIndex:
+        """
+        Add a stream to a category (an index, a stream class, or else the selected category). Unnamed streams are
+        selected and their name is opened for editing.
+        """
 
-        # Resolve the target root from the current selection if not provided
-        root = root or self._get_root_from_selection()
-        if root is None:
-            return None
+        if isinstance(root, type):
+            root = self._model.category_index(root)
 
-        data = root.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        # Resolve the target root from the current selection if not provided
+        if root is None or not root.isValid():
+            root = self._get_root_from_selection()
 
-        item = QtWidgets.QTreeWidgetItem(root)
-        item.setText(0, f"{root.text(0)} {root.childCount()}")
-        item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsEditable)
+        category = self._model.category(root)
+        if category is None:
+            return QtCore.QModelIndex()
 
-        self._add_grouped_attributes(item, data)
+        index = self._model.add_stream(category, name)
+        if index.isValid() and name is None:
+            self.expand(self._model.category_index(category))
+            self.setCurrentIndex(index)
+            self.edit(index)
 
-        # Column 2: Actions toolbar
-        toolbar = ToolBar(
-            self,
-            trailing=True,
-            iconSize=QtCore.QSize(18, 18),
-        )
-        toolbar.addAction(
-            qta.icon("mdi.check-all", color="gray", color_active="white"), "Check"
-        )
-        toolbar.addAction(
-            qta.icon("mdi.eraser", color="gray", color_active="white"), "Erase"
-        )
-        toolbar.addAction(
-            qta.icon("mdi.delete", color="red", color_active="white"), "Delete"
-        )
+        return index
 
-        # Set widgets
-        self.setItemWidget(item, 2, toolbar)
-        self.editItem(item, 0)
-        root.setExpanded(True)
+    @QtCore.Slot()
+    def delete_row(self, index: QtCore.QModelIndex) -> None:
+        self._model.remove_stream(index)
 
-        return item
+    def set_streams(self, streams: dict[str, Quantity]) -> None:
+        """
+        Show and edit a dictionary of streams, e.g. `Technology.inp`.
+        """
 
-    @QtCore.Slot()
-    def delete_row(self, item: QtWidgets.QTreeWidgetItem) -> None:
-        parent = item.parent()
-        if parent:
-            parent.removeChild(item)
-            parent.setText(0, f"{parent.text(0)} {parent.childCount()}")
+        self._model.set_streams(streams)
 
     def from_dict(self, data: dict[str, typing.Any]) -> None:
+        """
+        Load streams from their dictionary representation (see `Technology.to_dict`).
+        """
+
+        self._model.set_streams(
+            {
+                key: Quantity.from_dict(value) if isinstance(value, dict) else value
+                for key, value in data.items()
+            }
+        )
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {key: value.to_dict() for key, value in self._model.streams.items()}
 
-        for key, value in data.items():
-            self.create_row(None, key)
+    @property
+    def streams(self) -> StreamTreeModel:
+        return self._model
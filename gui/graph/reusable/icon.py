@@ -1,14 +1,51 @@
 # Filename: icon.py
 # Module name: graph
-# Description: A reusable QGraphicsSimpleTextItem subclass for displaying icons.
+# Description: A reusable QGraphicsSimpleTextItem subclass for displaying icons, and a shared icon-pixmap cache.
 
 from __future__ import annotations
+import math
+import functools
 import qtawesome as qta
 from PySide6 import QtGui
 from PySide6 import QtCore
 from PySide6 import QtWidgets
 
 
+@functools.lru_cache(maxsize=512)
+def icon_pixmap(name: str, color: str, size: int, ratio: float = 1.0) -> QtGui.QPixmap:
+    """
+    Render a QtAwesome icon to a pixmap, once per (name, color, size, ratio).
+
+    :param name: QtAwesome icon name, e.g. 'mdi.home'
+    :param color: Icon color
+    :param size: Logical size of the (square) pixmap, in pixels
+    :param ratio: Device pixel ratio the pixmap is rendered for
+    """
+
+    physical = round(size * ratio)
+    pixmap = qta.icon(name, color=color).pixmap(QtCore.QSize(physical, physical))
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap
+
+
+def paint_icon(
+    painter: QtGui.QPainter,
+    rect: QtCore.QRect,
+    name: str,
+    color: str,
+) -> None:
+    """
+    Paint a cached icon into `rect` (item coordinates). The pixmap resolution follows the device pixel ratio and
+    the view's zoom, rounded up to a power of two, so that zoomed-in icons stay sharp while the cache stays small.
+    """
+
+    scale = painter.device().devicePixelRatioF() * QtWidgets.QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+        painter.worldTransform()
+    )
+    ratio = 2.0 ** min(max(math.ceil(math.log2(max(scale, 1e-3))), 0), 3)
+    painter.drawPixmap(rect, icon_pixmap(name, color, max(rect.width(), rect.height()), ratio))
+
+
 class QtaItem(QtWidgets.QGraphicsSimpleTextItem):
     """
     Custom QGraphicsSimpleTextItem that shows QtAwesome icons. The icon is rendered as a font glyph for use in a
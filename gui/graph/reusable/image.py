@@ -14,6 +14,7 @@ from PySide6 import QtWidgets
 ImageOpts = {
     "size": QtCore.QSize(20, 20),  # Size of the SVG icon.
     "anim": False,  # Whether to animate the icon on appearance.
+    "lod": 0.0,  # Below this level of detail, the icon is not drawn.
 }
 
 
@@ -32,8 +33,15 @@ class Image(QtWidgets.QGraphicsObject):
         # Set properties:
         self.setProperty("size", kwargs.get("size", ImageOpts["size"]))
         self.setProperty("anim", kwargs.get("anim", False))
+        self.setProperty("lod", kwargs.get("lod", ImageOpts["lod"]))
         self.setProperty("buffer", buffer)
 
+        # The icon's size is fixed, so its bounding rect is computed once (Qt queries it on every hit test):
+        size = self.property("size")
+        self._rect = QtCore.QRectF(
+            -size.width() / 2, -size.height() / 2, size.width(), size.height()
+        )
+
         # Render the buffer:
         self.renderer = QtSvg.QSvgRenderer(self.property("buffer"), self)
 
@@ -49,18 +57,17 @@ class Image(QtWidgets.QGraphicsObject):
         """
         Returns the bounding rectangle of the SVG icon.
         """
-        return QtCore.QRectF(
-            -self.property("size").width() / 2,
-            -self.property("size").height() / 2,
-            self.property("size").width(),
-            self.property("size").height(),
-        )
+        return self._rect
 
     # Reimplementation of QGraphicsObject.paint():
     def paint(self, painter, option, widget=None):
         """
         Paints the SVG icon using the QSvgRenderer.
         """
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.property("lod"):
+            return
+
         painter.save()
         self.renderer.render(painter, self.boundingRect())
         painter.restore()
@@ -14,6 +14,7 @@ LabelOpts = {
     "const": False,  # Whether the string is immutable.
     "round": 4,  # Radius for rounded corners.
     "coord": QPointF(0, 0),  # Default position of the label with respect to its parent.
+    "lod": 0.5,  # Below this level of detail, the label is not drawn.
     "style": {
         "border": Qt.GlobalColor.transparent,
         "background": Qt.GlobalColor.transparent,
@@ -45,6 +46,7 @@ class Label(QGraphicsTextItem):
         self.setProperty("round", kwargs.get("round", LabelOpts["round"]))
         self.setProperty("style", kwargs.get("style", LabelOpts["style"]))
         self.setProperty("pos", kwargs.get("pos", QPointF(0, 0)))
+        self.setProperty("lod", kwargs.get("lod", LabelOpts["lod"]))
 
         # Text properties:
         self.setProperty("text-color", kwargs.get("color", LabelOpts["label"]["color"]))
@@ -66,6 +68,11 @@ class Label(QGraphicsTextItem):
     # Reimplementation of QGraphicsTextItem.paint():
     def paint(self, painter, option, widget):
 
+        # Text is unreadable at low zoom; skip drawing it altogether:
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.property("lod"):
+            return
+
         # Reset the state-flag to prevent the dashed-line selection style.
         option.state = QStyle.StateFlag.State_None
 
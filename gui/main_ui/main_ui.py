@@ -98,15 +98,18 @@ class MainUI(FramelessWindow):
         from PySide6 import QtGui
         from qtawesome import icon
         from gui.widgets.viewer import Viewer
+        from gui.maps import MapScene
 
         # Show a permanent map tab and make it unclosable:
         tab_icon = icon("mdi.map", color="#4a556d")
         position = QtWidgets.QTabBar.ButtonPosition.RightSide
 
-        map_canvas = QtWidgets.QGraphicsScene()
+        # The map layer is read from its binary cache; the background cache keeps pans from repainting it
+        map_canvas = MapScene()
         map_viewer = Viewer(
-            sceneRect=QtCore.QRectF(0, 0, 5000.0, 5000.0),
+            sceneRect=map_canvas.sceneRect(),
             backgroundBrush=QtGui.QBrush(QtGui.QColor(0xEFEFEF)),
+            cacheMode=QtWidgets.QGraphicsView.CacheModeFlag.CacheBackground,
         )
         map_viewer.setScene(map_canvas)
 
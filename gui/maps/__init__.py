@@ -0,0 +1,9 @@
+# Filename: gui/maps/__init__.py
+# Module name: gui.maps
+# Description: Map layer, scene and plant pins for the Maps module
+
+from gui.maps.layer import Level, MapLayer, Projection
+from gui.maps.map_scene import MapScene
+from gui.maps.pins import PinIndex, PinLayer, cluster
+
+__all__ = ["Level", "MapLayer", "MapScene", "PinIndex", "PinLayer", "Projection", "cluster"]
@@ -0,0 +1,409 @@
+# Filename: layer.py
+# Module name: gui.maps
+# Description: Pre-projected, multi-resolution map layer loaded from GeoJSON, with a binary cache.
+
+"""
+Map layer for the Maps module.
+
+The GeoJSON boundaries are parsed and projected once, simplified at several tolerances, and saved to a binary
+(`.npz`) cache. Later launches load the cache instead of the GeoJSON. The coarsest level is the state outline
+from `india-simplified.json`, and the finer levels are district boundaries from `india.geojson`. When painted,
+the layer strokes the coarsest level whose simplification error stays below `MapLayer.max_error` pixels at the
+current zoom. The land fill always comes from the coarsest level, because filling the 800 district rings costs
+ten times as much as stroking them.
+"""
+
+from __future__ import annotations
+
+# Standard
+import hashlib
+import json
+import logging
+import math
+import typing
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+# Pathlib
+from pathlib import Path
+
+# Third-party
+import numpy as np
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+
+# Default sources, relative to the repository root
+ASSETS = Path(__file__).resolve().parents[2] / "assets" / "maps"
+SOURCE = ASSETS / "india.geojson"
+OUTLINE = ASSETS / "india-simplified.json"
+
+# Bump when the cache layout changes
+CACHE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Spherical Mercator projection to scene coordinates, with north up.
+
+    Attributes:
+        lon0: Longitude mapped to x = 0.
+        lat0: Latitude mapped to y = 0.
+        scale: Scene units per degree of longitude.
+    """
+
+    lon0: float = 68.0
+    lat0: float = 37.5
+    scale: float = 150.0
+
+    @staticmethod
+    def _mercator(lat: np.ndarray) -> np.ndarray:
+        return np.degrees(np.log(np.tan(np.pi / 4 + np.radians(lat) / 2)))
+
+    def project(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Project longitudes and latitudes (degrees) to scene coordinates."""
+
+        x = (np.asarray(lon) - self.lon0) * self.scale
+        y = (self._mercator(self.lat0) - self._mercator(np.asarray(lat))) * self.scale
+        return x, y
+
+    def to_scene(self, lon: float, lat: float) -> QtCore.QPointF:
+        x, y = self.project(lon, lat)
+        return QtCore.QPointF(float(x), float(y))
+
+
+@dataclass(frozen=True)
+class Level:
+    """
+    A simplification level: all rings of the layer, stored flat.
+
+    Attributes:
+        tolerance: Maximum simplification error, in scene units.
+        points: `(N, 2)` projected vertices of all rings, concatenated.
+        rings: `R + 1` offsets into `points`; ring `i` is `points[rings[i]:rings[i + 1]]`.
+        states: The state name of each ring.
+    """
+
+    tolerance: float
+    points: np.ndarray
+    rings: np.ndarray
+    states: np.ndarray
+
+
+def simplify(ring: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Douglas-Peucker simplification of a closed ring.
+
+    :param ring: `(N, 2)` vertices, with the first vertex repeated at the end
+    :param tolerance: Maximum distance of a dropped vertex from the simplified ring
+    :return: The retained vertices, in order.
+    """
+
+    if tolerance <= 0 or len(ring) <= 4:
+        return ring
+
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # The ring starts and ends on the same vertex, so split it at its farthest vertex first
+    far = int(np.argmax(np.hypot(*(ring - ring[0]).T)))
+    keep[far] = True
+    stack = [(0, far), (far, len(ring) - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        a, b = ring[start], ring[end]
+        segment = ring[start + 1 : end]
+        chord = b - a
+        length = math.hypot(*chord)
+
+        if length == 0:
+            distance = np.hypot(*(segment - a).T)
+        else:
+            offset = segment - a
+            distance = np.abs(chord[0] * offset[:, 1] - chord[1] * offset[:, 0]) / length
+
+        index = int(np.argmax(distance))
+        if distance[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            stack.extend(((start, split), (split, end)))
+
+    return ring[keep]
+
+
+def _rings(collection: dict) -> typing.Iterator[tuple[str, list]]:
+    """Yield `(state, ring)` for every ring of a GeoJSON feature collection."""
+
+    for feature in collection.get("features", []):
+        geometry = feature.get("geometry") or {}
+        state = feature.get("properties", {}).get("st_nm", "")
+
+        if geometry.get("type") == "Polygon":
+            polygons = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            polygons = geometry["coordinates"]
+        else:
+            continue
+
+        for polygon in polygons:
+            for ring in polygon:
+                yield state, ring
+
+
+def _level(collection: dict, projection: Projection, tolerance: float, simplified: bool = False) -> Level:
+    """Project (and, unless `simplified`, simplify) all rings of a GeoJSON feature collection."""
+
+    points, rings, states = [], [0], []
+    for state, ring in _rings(collection):
+
+        lon, lat = np.asarray(ring, dtype=float).T[:2]
+        ring = np.column_stack(projection.project(lon, lat))
+        if not simplified:
+            ring = simplify(ring, tolerance)
+
+        # Rings that collapse below a triangle are smaller than the tolerance; drop them
+        if len(ring) < 4:
+            continue
+
+        points.append(ring)
+        rings.append(rings[-1] + len(ring))
+        states.append(state)
+
+    return Level(
+        tolerance=tolerance,
+        points=np.concatenate(points).astype(np.float32),
+        rings=np.asarray(rings, dtype=np.int64),
+        states=np.asarray(states, dtype=str),
+    )
+
+
+class MapLayer:
+    """
+    Multi-resolution boundaries of a map, projected to scene coordinates.
+
+    Build a layer with `MapLayer.load()`. It reads the binary cache when one exists for the current sources,
+    and otherwise parses the GeoJSON and writes the cache.
+    """
+
+    # Class logger
+    _logger = logging.getLogger("MapLayer")
+
+    # Largest on-screen simplification error accepted when choosing a level, in pixels
+    max_error: float = 1.5
+
+    # Tolerances (scene units) of the district levels, finest first; the outline level comes last
+    tolerances: tuple[float, ...] = (0.0, 2.0, 5.0)
+    outline_tolerance: float = 6.0
+
+    @dataclass(frozen=True)
+    class Appearance:
+        """Default options for the map's appearance.
+
+        Attributes:
+            land: Fill of the land polygons.
+            border: Pen for the boundaries (cosmetic, so its width does not scale with zoom).
+        """
+
+        land: QtGui.QBrush = field(default_factory=lambda: QtGui.QBrush(QtGui.QColor(0xFFFFFF)))
+        border: QtGui.QPen = field(default_factory=lambda: QtGui.QPen(QtGui.QColor(0xBEBEBE), 0))
+
+    def __init__(self, levels: list[Level], projection: Projection):
+
+        self._levels = sorted(levels, key=lambda level: level.tolerance)
+        self._projection = projection
+        self._appearance = MapLayer.Appearance()
+        self._paths: dict[int, QtGui.QPainterPath] = {}
+
+        points = np.concatenate([level.points for level in self._levels])
+        (x0, y0), (x1, y1) = points.min(axis=0), points.max(axis=0)
+        self._bounds = QtCore.QRectF(float(x0), float(y0), float(x1 - x0), float(y1 - y0))
+
+    @classmethod
+    def build(
+        cls,
+        source: str | Path = SOURCE,
+        outline: str | Path = OUTLINE,
+        projection: Projection | None = None,
+    ) -> MapLayer:
+        """
+        Parse, project and simplify the GeoJSON sources (no cache).
+        """
+
+        projection = projection or Projection()
+        detail = json.loads(Path(source).read_text())
+        levels = [_level(detail, projection, tolerance) for tolerance in cls.tolerances]
+
+        if outline and Path(outline).exists():
+            states = json.loads(Path(outline).read_text())
+            levels.append(_level(states, projection, cls.outline_tolerance, simplified=True))
+
+        return cls(levels, projection)
+
+    @classmethod
+    def load(
+        cls,
+        source: str | Path = SOURCE,
+        outline: str | Path = OUTLINE,
+        projection: Projection | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> MapLayer:
+        """
+        Load the layer from its binary cache, building (and caching) it on a miss.
+
+        :param source: GeoJSON with the detailed boundaries
+        :param outline: Pre-simplified GeoJSON used as the coarsest level
+        :param projection: Projection to scene coordinates (default: `Projection()`)
+        :param cache_dir: Cache directory (default: the application's cache location)
+        """
+
+        projection = projection or Projection()
+        cache = cls._cache_path(Path(source), Path(outline), projection, cache_dir)
+
+        if cache.exists():
+            try:
+                return cls._read(cache, projection)
+            except (OSError, KeyError, ValueError) as exception:
+                cls._logger.warning(f"Ignoring unreadable map cache {cache}: {exception}")
+
+        layer = cls.build(source, outline, projection)
+        try:
+            layer._write(cache)
+        except OSError as exception:
+            cls._logger.warning(f"Could not write map cache {cache}: {exception}")
+
+        return layer
+
+    @classmethod
+    def _cache_path(
+        cls,
+        source: Path,
+        outline: Path,
+        projection: Projection,
+        cache_dir: str | Path | None,
+    ) -> Path:
+        """
+        Name the cache after everything it depends on, so stale caches are never read.
+        """
+
+        if cache_dir is None:
+            location = QtCore.QStandardPaths.StandardLocation.CacheLocation
+            cache_dir = Path(QtCore.QStandardPaths.writableLocation(location) or ".") / "maps"
+
+        key = [CACHE_FORMAT, projection, cls.tolerances, cls.outline_tolerance]
+        for path in (source, outline):
+            if path.exists():
+                stat = path.stat()
+                key.append((path.name, stat.st_size, stat.st_mtime_ns))
+
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        return Path(cache_dir) / f"{source.stem}-{digest}.npz"
+
+    @classmethod
+    def _read(cls, cache: Path, projection: Projection) -> MapLayer:
+
+        with np.load(cache, allow_pickle=False) as data:
+            levels = [
+                Level(
+                    tolerance=float(data[f"tolerance_{i}"]),
+                    points=data[f"points_{i}"],
+                    rings=data[f"rings_{i}"],
+                    states=data[f"states_{i}"],
+                )
+                for i in range(int(data["levels"]))
+            ]
+
+        return cls(levels, projection)
+
+    def _write(self, cache: Path) -> None:
+
+        arrays = {"levels": np.asarray(len(self._levels))}
+        for i, level in enumerate(self._levels):
+            arrays[f"tolerance_{i}"] = np.asarray(level.tolerance)
+            arrays[f"points_{i}"] = level.points
+            arrays[f"rings_{i}"] = level.rings
+            arrays[f"states_{i}"] = level.states
+
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache, "wb") as stream:
+            np.savez(stream, **arrays)
+
+    def level_for(self, lod: float) -> int:
+        """
+        Index of the coarsest level whose error, in pixels at the given level of detail, is at most `max_error`.
+        """
+
+        chosen = 0
+        for index, level in enumerate(self._levels):
+            if level.tolerance * lod <= self.max_error:
+                chosen = index
+
+        return chosen
+
+    def path(self, index: int) -> QtGui.QPainterPath:
+        """
+        The painter path of a level, built on first use.
+        """
+
+        if index not in self._paths:
+            level = self._levels[index]
+            # Holes wind opposite to their outer rings (RFC 7946), and neighbouring rings may overlap slightly
+            # once simplified, so winding fill leaves neither holes filled nor slivers between districts
+            path = QtGui.QPainterPath()
+            path.setFillRule(QtCore.Qt.FillRule.WindingFill)
+
+            for start, end in zip(level.rings[:-1], level.rings[1:]):
+                ring = level.points[start:end]
+                path.addPolygon(QtGui.QPolygonF([QtCore.QPointF(x, y) for x, y in ring.tolist()]))
+
+            self._paths[index] = path
+
+        return self._paths[index]
+
+    def paint(self, painter: QtGui.QPainter, lod: float | None = None) -> None:
+        """
+        Paint the level that suits the painter's zoom.
+
+        :param painter: Painter in scene coordinates
+        :param lod: Level of detail; derived from the painter's transform when omitted
+        """
+
+        if lod is None:
+            lod = QtWidgets.QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+                painter.worldTransform()
+            )
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        # Land: fill the coarsest level
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(self._appearance.land)
+        painter.drawPath(self.path(len(self._levels) - 1))
+
+        # Boundaries: stroke the level that suits the zoom
+        painter.setPen(self._appearance.border)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.drawPath(self.path(self.level_for(lod)))
+        painter.restore()
+
+    @property
+    def bounds(self) -> QtCore.QRectF:
+        return self._bounds
+
+    @property
+    def levels(self) -> list[Level]:
+        return self._levels
+
+    @property
+    def projection(self) -> Projection:
+        return self._projection
@@ -0,0 +1,62 @@
+# Filename: map_scene.py
+# Module name: gui.maps
+# Description: QGraphicsScene that draws a map layer as its background.
+
+from __future__ import annotations
+
+# Standard
+import logging
+import typing
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+# Climact modules: core.models, gui.maps
+from core.models import Plant
+from gui.maps.layer import MapLayer
+from gui.maps.pins import PinLayer
+
+
+class MapScene(QtWidgets.QGraphicsScene):
+    """
+    A QGraphicsScene with a map layer as its background. Items (e.g. plant pins) are placed on top, in the
+    layer's projected coordinates (see `MapScene.to_scene`).
+
+    The map is drawn in `drawBackground`, so views that cache their background (`CacheBackground`) repaint it
+    only when the zoom changes.
+    """
+
+    # Class logger
+    _logger = logging.getLogger("MapScene")
+
+    def __init__(self, layer: MapLayer | None = None, parent=None, margin: float = 250.0):
+
+        self._layer = layer or MapLayer.load()
+
+        super().__init__(
+            self._layer.bounds.adjusted(-margin, -margin, margin, margin),
+            parent=parent,
+            backgroundBrush=QtGui.QBrush(QtGui.QColor(0xEFEFEF)),
+        )
+
+    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+
+        super().drawBackground(painter, rect)
+        self._layer.paint(painter)
+
+    def add_pins(self, plants: typing.Sequence[Plant]) -> PinLayer:
+        """Add plant pins, drawn and clustered by a single `PinLayer` item."""
+
+        pins = PinLayer(plants, self._layer.projection)
+        self.addItem(pins)
+        return pins
+
+    def to_scene(self, lon: float, lat: float) -> QtCore.QPointF:
+        """Scene position of a longitude/latitude, in degrees."""
+        return self._layer.projection.to_scene(lon, lat)
+
+    @property
+    def layer(self) -> MapLayer:
+        return self._layer
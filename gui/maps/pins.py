@@ -0,0 +1,448 @@
+# Filename: pins.py
+# Module name: gui.maps
+# Description: Grid-indexed, zoom-clustered plant pins drawn by a single graphics item.
+
+"""
+Plant pins for the map.
+
+All pins are drawn by one `PinLayer` item instead of one QGraphicsItem per plant. Each frame, the layer:
+
+1. queries a uniform-grid `PinIndex` for the plants inside the exposed rect,
+2. drops plants rejected by the current filter (a boolean mask, rebuilt in microseconds),
+3. merges the remaining plants into clusters on a screen-space grid (`cluster`), and
+4. draws one pixel-sized marker per cluster.
+
+Hover and click events use the same index to find the plant under the cursor and its cluster.
+"""
+
+from __future__ import annotations
+
+# Standard
+import logging
+import math
+import typing
+
+# Dataclass
+from dataclasses import field
+from dataclasses import dataclass
+
+# Third-party
+import numpy as np
+
+# PySide6 (Python/Qt)
+from PySide6 import QtGui
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+# Climact modules: core.models, gui.maps
+from core.models import Plant
+from gui.maps.layer import Projection
+
+
+class PinIndex:
+    """
+    Uniform-grid index over 2D points.
+
+    Points are bucketed by cell and sorted by cell key (row-major), so all cells of one grid row within a query rect
+    are a single contiguous slice. A rect query touches one slice per row and then filters exactly.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, cell: float = 50.0):
+
+        self._x = np.asarray(x, dtype=float)
+        self._y = np.asarray(y, dtype=float)
+        self._cell = cell
+
+        x0 = float(self._x.min()) if len(self._x) else 0.0
+        y0 = float(self._y.min()) if len(self._y) else 0.0
+        self._origin = (x0, y0)
+
+        ix = ((self._x - x0) // cell).astype(np.int64)
+        iy = ((self._y - y0) // cell).astype(np.int64)
+        self._shape = (int(iy.max()) + 1 if len(iy) else 1, int(ix.max()) + 1 if len(ix) else 1)
+
+        keys = iy * self._shape[1] + ix
+        self._order = np.argsort(keys, kind="stable")
+        counts = np.bincount(keys, minlength=self._shape[0] * self._shape[1])
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def query(self, rect: QtCore.QRectF) -> np.ndarray:
+        """
+        Indices of the points inside a rect.
+        """
+
+        if not len(self._x):
+            return np.empty(0, dtype=np.int64)
+
+        rows, cols = self._shape
+        (x0, y0), cell = self._origin, self._cell
+
+        ix0 = max(int((rect.left() - x0) // cell), 0)
+        ix1 = min(int((rect.right() - x0) // cell), cols - 1)
+        iy0 = max(int((rect.top() - y0) // cell), 0)
+        iy1 = min(int((rect.bottom() - y0) // cell), rows - 1)
+
+        if ix0 > ix1 or iy0 > iy1:
+            return np.empty(0, dtype=np.int64)
+
+        slices = [
+            self._order[self._offsets[row * cols + ix0] : self._offsets[row * cols + ix1 + 1]]
+            for row in range(iy0, iy1 + 1)
+        ]
+        candidates = np.concatenate(slices)
+
+        x, y = self._x[candidates], self._y[candidates]
+        inside = (x >= rect.left()) & (x <= rect.right()) & (y >= rect.top()) & (y <= rect.bottom())
+        return candidates[inside]
+
+    def nearest(
+        self, x: float, y: float, radius: float, mask: np.ndarray | None = None
+    ) -> int:
+        """
+        Index of the nearest point within `radius` of `(x, y)` (among the points where `mask` is set), or -1.
+        """
+
+        candidates = self.query(QtCore.QRectF(x - radius, y - radius, 2 * radius, 2 * radius))
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+
+        if not len(candidates):
+            return -1
+
+        distance = np.hypot(self._x[candidates] - x, self._y[candidates] - y)
+        best = int(np.argmin(distance))
+        return int(candidates[best]) if distance[best] <= radius else -1
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y
+
+
+def cluster(
+    x: np.ndarray, y: np.ndarray, cell: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge points on a square grid anchored at the scene origin, so clusters stay put while panning.
+
+    :param x: Point x-coordinates
+    :param y: Point y-coordinates
+    :param cell: Grid spacing, in scene units
+    :return: Cluster centroids `(cx, cy)`, the size of each cluster, and each point's cluster number.
+    """
+
+    ix = np.floor(x / cell).astype(np.int64)
+    iy = np.floor(y / cell).astype(np.int64)
+
+    _, labels, counts = np.unique(np.column_stack((ix, iy)), axis=0, return_inverse=True, return_counts=True)
+    labels = labels.reshape(-1)
+
+    cx = np.bincount(labels, weights=x) / counts
+    cy = np.bincount(labels, weights=y) / counts
+    return cx, cy, counts, labels
+
+
+class PinLayer(QtWidgets.QGraphicsObject):
+    """
+    Draws all plant pins of a map as zoom-dependent clusters.
+    """
+
+    # Class logger
+    _logger = logging.getLogger("PinLayer")
+
+    # Signals:
+    plant_clicked = QtCore.Signal(str)
+    cluster_clicked = QtCore.Signal(QtCore.QRectF)
+
+    @dataclass(frozen=True)
+    class Appearance:
+        """Default options for the pins' appearance.
+
+        Attributes:
+            pathways: Pin color for each production pathway.
+            default: Pin color for other pathways.
+            cluster: Fill of cluster markers.
+            radius: Pin radius, in pixels.
+            spacing: Grid spacing for clustering, in pixels.
+        """
+
+        pathways: dict[str, QtGui.QColor] = field(
+            default_factory=lambda: {
+                "BF-BOF": QtGui.QColor(0xD64545),
+                "DRI-EAF": QtGui.QColor(0x3A6FD8),
+                "Hybrid": QtGui.QColor(0x3BA55C),
+            }
+        )
+        default: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0x8A8F98))
+        cluster: QtGui.QColor = field(default_factory=lambda: QtGui.QColor(0x232A2E))
+        radius: float = 5.0
+        spacing: float = 60.0
+
+    def __init__(
+        self,
+        plants: typing.Sequence[Plant],
+        projection: Projection | None = None,
+        parent: QtWidgets.QGraphicsItem | None = None,
+    ):
+
+        super().__init__(parent)
+
+        self._plants = list(plants)
+        self._projection = projection or Projection()
+        self._appearance = PinLayer.Appearance()
+        self._lod = 1.0
+        self._sprites: dict[tuple, QtGui.QPixmap] = {}
+
+        # Columns, in plant order
+        lon = np.array([plant.lon for plant in self._plants], dtype=float)
+        lat = np.array([plant.lat for plant in self._plants], dtype=float)
+        x, y = self._projection.project(lon, lat)
+
+        self._capacity = np.array([plant.capacity_mtpa for plant in self._plants], dtype=float)
+        self._pathways, self._pathway_codes = np.unique(
+            np.array([plant.pathway for plant in self._plants], dtype=str), return_inverse=True
+        )
+        self._states, self._state_codes = np.unique(
+            np.array([plant.state for plant in self._plants], dtype=str), return_inverse=True
+        )
+
+        self._index = PinIndex(x, y)
+        self._mask = np.ones(len(self._plants), dtype=bool)
+
+        margin = 500.0
+        if len(self._plants):
+            self._bounds = QtCore.QRectF(
+                float(x.min()), float(y.min()), float(np.ptp(x)), float(np.ptp(y))
+            ).adjusted(-margin, -margin, margin, margin)
+        else:
+            self._bounds = QtCore.QRectF()
+
+        self.setAcceptHoverEvents(True)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.setZValue(10)
+
+    # Section: Filtering
+    # ------------------
+
+    def set_filter(
+        self,
+        pathways: typing.Iterable[str] | None = None,
+        capacity: tuple[float, float] | None = None,
+        states: typing.Iterable[str] | None = None,
+    ) -> int:
+        """
+        Show only the plants that match all given criteria; `None` leaves a criterion open.
+
+        :param pathways: Production pathways to show
+        :param capacity: Inclusive `(lower, upper)` capacity range, in Mtpa
+        :param states: States to show
+        :return: The number of plants shown.
+        """
+
+        mask = np.ones(len(self._plants), dtype=bool)
+
+        if pathways is not None:
+            mask &= np.isin(self._pathway_codes, self._codes(self._pathways, pathways))
+
+        if capacity is not None:
+            mask &= (self._capacity >= capacity[0]) & (self._capacity <= capacity[1])
+
+        if states is not None:
+            mask &= np.isin(self._state_codes, self._codes(self._states, states))
+
+        self._mask = mask
+        self.update()
+        return int(mask.sum())
+
+    @staticmethod
+    def _codes(values: np.ndarray, wanted: typing.Iterable[str]) -> np.ndarray:
+        wanted = np.asarray(list(wanted), dtype=str)
+        return np.flatnonzero(np.isin(values, wanted))
+
+    # Section: Queries
+    # ----------------
+
+    def plants_in(self, rect: QtCore.QRectF) -> list[Plant]:
+        """Plants shown inside a scene rect."""
+
+        indices = self._index.query(rect)
+        return [self._plants[i] for i in indices[self._mask[indices]]]
+
+    def plants_at(self, pos: QtCore.QPointF) -> np.ndarray:
+        """
+        Indices of the plants under the marker at a scene position (one plant, or all plants of a cluster), at the
+        zoom of the last paint.
+        """
+
+        cell = self._appearance.spacing / self._lod
+        reach = self._appearance.radius / self._lod + cell
+        nearest = self._index.nearest(pos.x(), pos.y(), reach, self._mask)
+        if nearest < 0:
+            return np.empty(0, dtype=np.int64)
+
+        # The nearest plant's cluster is its grid cell
+        x, y = self._index.x[nearest], self._index.y[nearest]
+        left, top = math.floor(x / cell) * cell, math.floor(y / cell) * cell
+        members = self._index.query(QtCore.QRectF(left, top, cell, cell))
+        members = members[self._mask[members]]
+
+        # Drop members on the far edges, which belong to the neighbouring cells
+        inside = (np.floor(self._index.x[members] / cell) * cell == left) & (
+            np.floor(self._index.y[members] / cell) * cell == top
+        )
+        members = members[inside]
+
+        # The marker is drawn at the cluster's centroid; the cursor must be on it
+        cx, cy = self._index.x[members].mean(), self._index.y[members].mean()
+        radius = self._marker_radius(len(members)) / self._lod
+        if math.hypot(pos.x() - cx, pos.y() - cy) > radius:
+            return np.empty(0, dtype=np.int64)
+
+        return members
+
+    def _sprite(self, color: QtGui.QColor, count: int, ratio: float) -> QtGui.QPixmap:
+        """
+        Pre-rendered marker for a pin (`count == 1`) or a cluster. Antialiased ellipses and text are expensive to
+        draw hundreds of times per frame, whereas blitting a pixmap is cheap.
+        """
+
+        key = (color.rgba(), count, ratio)
+        if key in self._sprites:
+            return self._sprites[key]
+
+        if len(self._sprites) > 1024:
+            self._sprites.clear()
+
+        radius = self._marker_radius(count)
+        side = math.ceil(2 * radius + 2)
+
+        sprite = QtGui.QPixmap(math.ceil(side * ratio), math.ceil(side * ratio))
+        sprite.setDevicePixelRatio(ratio)
+        sprite.fill(QtCore.Qt.GlobalColor.transparent)
+
+        painter = QtGui.QPainter(sprite)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(QtGui.QPen(QtGui.QColor(0xFFFFFF), 1.5))
+        painter.setBrush(color)
+        painter.drawEllipse(QtCore.QPointF(side / 2, side / 2), radius, radius)
+
+        if count > 1:
+            font = painter.font()
+            font.setPixelSize(10)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.drawText(QtCore.QRectF(0, 0, side, side), QtCore.Qt.AlignmentFlag.AlignCenter, str(count))
+
+        painter.end()
+        self._sprites[key] = sprite
+        return sprite
+
+    def _marker_radius(self, count: int) -> float:
+        """Marker radius in pixels: pins are `radius`, clusters grow with the log of their size."""
+
+        if count <= 1:
+            return self._appearance.radius
+
+        return self._appearance.radius + 2.0 * math.log2(count) + 4.0
+
+    # Section: Reimplementation
+    # -------------------------
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._bounds
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionGraphicsItem,
+        /,
+        widget: QtWidgets.QWidget | None = None,
+    ) -> None:
+
+        transform = painter.worldTransform()
+        self._lod = option.levelOfDetailFromTransform(transform)
+
+        # Markers are pixel-sized, so include pins just outside the exposed rect
+        cell = self._appearance.spacing / self._lod
+        exposed = option.exposedRect.adjusted(-cell, -cell, cell, cell)
+
+        visible = self._index.query(exposed)
+        visible = visible[self._mask[visible]]
+        if not len(visible):
+            return
+
+        cx, cy, counts, labels = cluster(self._index.x[visible], self._index.y[visible], cell)
+
+        # Color single pins by pathway; clusters use the cluster color
+        pathway = np.zeros(len(counts), dtype=np.int64)
+        pathway[labels] = self._pathway_codes[visible]
+
+        # Draw in device coordinates, so that markers keep their pixel size
+        ratio = painter.device().devicePixelRatioF()
+        colors = [self._appearance.pathways.get(name, self._appearance.default) for name in self._pathways]
+
+        painter.save()
+        painter.resetTransform()
+
+        for x, y, count, code in zip(cx.tolist(), cy.tolist(), counts.tolist(), pathway.tolist()):
+            sprite = self._sprite(colors[code] if count == 1 else self._appearance.cluster, count, ratio)
+            center = transform.map(QtCore.QPointF(x, y))
+            half = sprite.width() / ratio / 2
+            painter.drawPixmap(QtCore.QPointF(center.x() - half, center.y() - half), sprite)
+
+        painter.restore()
+
+    def hoverMoveEvent(self, event: QtWidgets.QGraphicsSceneHoverEvent) -> None:
+
+        members = self.plants_at(event.pos())
+        if len(members) == 1:
+            plant = self._plants[int(members[0])]
+            self.setToolTip(
+                f"{plant.name}\n{plant.state}\n{plant.pathway}, {plant.capacity_mtpa:g} Mtpa"
+            )
+        elif len(members):
+            self.setToolTip(
+                f"{len(members)} plants, {self._capacity[members].sum():g} Mtpa"
+            )
+        else:
+            self.setToolTip("")
+
+        super().hoverMoveEvent(event)
+
+    def mousePressEvent(self, event: QtWidgets.QGraphicsSceneMouseEvent) -> None:
+
+        members = self.plants_at(event.pos())
+        if not len(members):
+            event.ignore()
+            return
+
+        if len(members) == 1:
+            self.plant_clicked.emit(self._plants[int(members[0])].id)
+        else:
+            x, y = self._index.x[members], self._index.y[members]
+            self.cluster_clicked.emit(
+                QtCore.QRectF(float(x.min()), float(y.min()), float(np.ptp(x)), float(np.ptp(y)))
+            )
+
+        event.accept()
+
+    # Properties
+    # ----------
+
+    @property
+    def plants(self) -> list[Plant]:
+        return self._plants
+
+    @property
+    def index(self) -> PinIndex:
+        return self._index
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self._mask
@@ -5,15 +5,24 @@
 """
 File table widget for displaying and managing projects.
 Includes action buttons for opening, cloning, and deleting projects.
+
+Directories are scanned on a worker thread (`DirectoryScanner`), which streams rows into a `ProjectTableModel`.
+Listings are cached between launches, so the table shows the previous listing while the scan runs. The action
+buttons are created only for the row under the cursor.
 """
 
 from __future__ import annotations
 from pathlib import Path
+from datetime import datetime
 from qtawesome import icon as qta_icon
 from PySide6 import QtGui, QtCore, QtWidgets
 from gui.widgets.layouts import HLayout
 from gui.widgets import ToolBar
 import dataclasses
+import hashlib
+import logging
+import typing
+import json
 
 
 # Widget representing a single file/project, added to the FileTable:
@@ -36,7 +45,7 @@ class FileTableItem(QtWidgets.QWidget):
         Args:
             name: The project name to display.
             path: The project file path (default: empty string).
-            **kwargs: Additional keyword arguments (e.g., buttons list).
+            **kwargs: Additional keyword arguments (e.g., buttons list, or `label=False` to show only the buttons).
         """
 
         super().__init__(None)
@@ -49,6 +58,10 @@ class FileTableItem(QtWidgets.QWidget):
         self._project_label = QtWidgets.QLabel(name)
         self._project_acts = self._project_actions()
         self._buttons = kwargs.get("buttons", [])
+        self._project_label.setVisible(kwargs.get("label", True))
+
+        # Without a label, the item is a hover overlay and shows its buttons right away:
+        self._project_acts.setVisible(not kwargs.get("label", True))
 
         # Arrange UI components in a horizontal layout:
         HLayout(
@@ -76,14 +89,14 @@ class FileTableItem(QtWidgets.QWidget):
                 (
                     qta_icon("ph.upload-simple", color="gray", color_active="white"),
                     "Open Project",
-                    lambda path=self._project_path: self.sig_open_project.emit(path),
+                    lambda: self.sig_open_project.emit(self._project_path),
                 ),
                 (
                     qta_icon(
                         "ph.shield-check-fill", color="gray", color_active="white"
                     ),
                     "Open Project (Safe Mode)",
-                    lambda path=self._project_path: self.sig_open_project.emit(path),
+                    lambda: self.sig_open_project.emit(self._project_path),
                 ),
                 (
                     qta_icon(
@@ -92,12 +105,12 @@ class FileTableItem(QtWidgets.QWidget):
                         color_active="white",
                     ),
                     "Clone Project",
-                    lambda path=self._project_path: self.sig_clone_project.emit(path),
+                    lambda: self.sig_clone_project.emit(self._project_path),
                 ),
                 (
                     qta_icon("mdi.delete", color="gray", color_active="red"),
                     "Delete Project",
-                    lambda path=self._project_path: self.sig_delete_project.emit(path),
+                    lambda: self.sig_delete_project.emit(self._project_path),
                 ),
             ],
         )
@@ -126,14 +139,294 @@ class FileTableItem(QtWidgets.QWidget):
         self._project_acts.hide()
 
 
-class StartupFileTable(QtWidgets.QTableWidget):
+@dataclasses.dataclass(frozen=True)
+class ProjectEntry:
+    """
+    A project file found by a directory scan.
+
+    Attributes:
+        path: The project file path.
+        modified: The last modified time, in seconds since the epoch.
+    """
+
+    path: str
+    modified: float
+
+    @property
+    def name(self) -> str:
+        return Path(self.path).stem
+
+    @property
+    def date(self) -> str:
+        return datetime.fromtimestamp(self.modified).strftime("%Y-%m-%d")
+
+
+class DirectoryScanner(QtCore.QThread):
+    """
+    Lists the files matching a glob pattern on a worker thread.
+
+    Entries are emitted in batches as they are found (`sig_batch`), then all together when the scan completes
+    (`sig_finished`). The complete listing is written to the cache, which `DirectoryScanner.cached()` reads back.
+    """
+
+    # Class logger
+    _logger = logging.getLogger("DirectoryScanner")
+
+    # Scanners with a running thread. Scanners have no parent, so that the widget that started one can be destroyed
+    # mid-scan, and are kept alive here until their thread exits (a QThread must not be deleted while it runs).
+    _active: typing.ClassVar[set[DirectoryScanner]] = set()
+    _hooked: typing.ClassVar[bool] = False
+
+    # Signals:
+    sig_batch = QtCore.Signal(list)
+    sig_finished = QtCore.Signal(list)
+
+    @dataclasses.dataclass(frozen=True)
+    class Options:
+        """
+        Scanner options.
+
+        Attributes:
+            batch_size: Maximum number of entries per batch.
+            batch_interval: Maximum time between batches, in seconds.
+        """
+
+        batch_size: int = 200
+        batch_interval: float = 0.05
+
+    def __init__(self, directory: str, pattern: str, parent=None):
+        """
+        Initialize the scanner.
+
+        Args:
+            directory: The directory path to search for files.
+            pattern: A glob pattern to match files (e.g., "*.h5").
+            parent: Parent object (optional).
+        """
+
+        super().__init__(parent)
+
+        self._opts = DirectoryScanner.Options()
+        self._directory = directory
+        self._pattern = pattern
+
+        self.finished.connect(self._on_finished)
+
+    def start(self, *args) -> None:
+        """
+        Start the scan, keeping the scanner alive until its thread exits.
+        """
+
+        if not DirectoryScanner._hooked:
+            QtCore.QCoreApplication.instance().aboutToQuit.connect(DirectoryScanner.stop_all)
+            DirectoryScanner._hooked = True
+
+        DirectoryScanner._active.add(self)
+        super().start(*args)
+
+    @classmethod
+    def stop_all(cls, timeout: int = 1000) -> None:
+        """
+        Interrupt all running scans and wait, at most `timeout` milliseconds each, for their threads to exit. Called
+        when the application quits.
+        """
+
+        for scanner in list(cls._active):
+            scanner.requestInterruption()
+
+        for scanner in list(cls._active):
+            if not scanner.wait(timeout):
+                cls._logger.warning(f"Scan of {scanner._directory} did not stop within {timeout} ms")
+
+    @QtCore.Slot()
+    def _on_finished(self) -> None:
+
+        # `finished` is emitted just before the thread exits: wait for it (briefly), and release the scanner only
+        # after this slot has returned
+        self.wait(1000)
+        QtCore.QTimer.singleShot(0, lambda: DirectoryScanner._active.discard(self))
+
+    def run(self) -> None:
+        """
+        Scan the directory (runs on the worker thread).
+        """
+
+        import time
+
+        entries: list[ProjectEntry] = []
+        batch: list[ProjectEntry] = []
+        flushed = time.perf_counter()
+
+        try:
+            for item in Path(self._directory).glob(self._pattern):
+                if self.isInterruptionRequested():
+                    return
+
+                try:
+                    batch.append(ProjectEntry(str(item), item.stat().st_mtime))
+                except OSError:
+                    continue  # Removed or unreadable since it was listed
+
+                now = time.perf_counter()
+                if len(batch) >= self._opts.batch_size or now - flushed >= self._opts.batch_interval:
+                    entries.extend(batch)
+                    self.sig_batch.emit(batch)
+                    batch, flushed = [], now
+
+        except OSError as error:
+            self._logger.warning(f"Scan of {self._directory} failed: {error}")
+            return
+
+        entries.extend(batch)
+        if batch:
+            self.sig_batch.emit(batch)
+
+        self._write_cache(entries)
+        self.sig_finished.emit(entries)
+
+    @staticmethod
+    def cache_path(directory: str, pattern: str) -> Path:
+        """
+        Cache file of a directory listing, in the application's cache location.
+        """
+
+        location = QtCore.QStandardPaths.StandardLocation.CacheLocation
+        root = Path(QtCore.QStandardPaths.writableLocation(location) or ".") / "startup"
+
+        key = f"{Path(directory).resolve()}|{pattern}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        return root / f"listing-{digest}.json"
+
+    @classmethod
+    def cached(cls, directory: str, pattern: str) -> list[ProjectEntry] | None:
+        """
+        The cached listing of a directory, or None if there is none.
+        """
+
+        try:
+            with open(cls.cache_path(directory, pattern), encoding="utf-8") as file:
+                return [ProjectEntry(path, modified) for path, modified in json.load(file)["entries"]]
+
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_cache(self, entries: list[ProjectEntry]) -> None:
+
+        path = self.cache_path(self._directory, self._pattern)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"entries": [[entry.path, entry.modified] for entry in entries]}, file)
+
+        except OSError as error:
+            self._logger.warning(f"Could not cache the listing of {self._directory}: {error}")
+
+
+class ProjectTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model of project files: the project name (with the application logo) and its last modified date.
     """
-    A table widget for displaying and managing project files.
+
+    def __init__(self, columns: list[str], parent=None):
+
+        super().__init__(parent)
+
+        self._columns = list(columns)
+        self._entries: list[ProjectEntry] = []
+        self._icon = QtGui.QIcon(":/logo/logo.png")
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+
+        if not index.isValid():
+            return None
+
+        entry = self._entries[index.row()]
+        column = index.column()
+
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return entry.name if column == 0 else entry.date
+
+        if role == QtCore.Qt.ItemDataRole.DecorationRole and column == 0:
+            return self._icon
+
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and column == 0:
+            return entry.path
+
+        return None
+
+    def headerData(self, section: int, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._columns[section]
+
+        return super().headerData(section, orientation, role)
+
+    def set_header(self, section: int, label: str) -> None:
+        """
+        Set the label of a column.
+        """
+
+        self._columns[section] = label
+        self.headerDataChanged.emit(QtCore.Qt.Orientation.Horizontal, section, section)
+
+    def append(self, entries: list[ProjectEntry]) -> None:
+        """
+        Append rows to the table.
+        """
+
+        if not entries:
+            return
+
+        first = len(self._entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def set_entries(self, entries: list[ProjectEntry]) -> None:
+        """
+        Replace all rows; does nothing if the rows are unchanged.
+        """
+
+        if entries == self._entries:
+            return
+
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def entry(self, row: int) -> ProjectEntry:
+        return self._entries[row]
+
+    @property
+    def entries(self) -> list[ProjectEntry]:
+        return self._entries
+
+
+class StartupFileTable(QtWidgets.QTableView):
+    """
+    A table view for displaying and managing project files.
 
     Displays files along with their last modified dates.
-    Supports filtering by file pattern and automatically populates from a directory.
+    Supports filtering by file pattern and populates from a directory in the background.
     """
 
+    # Signals emitted when the action buttons of a row are clicked:
+    sig_open_project = QtCore.Signal(str)
+    sig_clone_project = QtCore.Signal(str)
+    sig_delete_project = QtCore.Signal(str)
+
+    # Emitted when a directory scan completes, with the number of projects found:
+    sig_scan_finished = QtCore.Signal(int)
+
     # TODO: Split this dataclass into `Style` and `Attrs` classes.
     @dataclasses.dataclass
     class Options:
@@ -160,16 +453,27 @@ class StartupFileTable(QtWidgets.QTableWidget):
         self._opts = StartupFileTable.Options()
 
         # Initialize parent class:
-        super().__init__(parent, columnCount=len(self._opts.columns))
+        super().__init__(parent)
+
+        self._model = ProjectTableModel(self._opts.columns, self)
+        self._scanner: DirectoryScanner | None = None
+        self._hover_row = -1
+
+        self.setModel(self._model)
+        self._model.modelReset.connect(self._on_model_reset)
 
         # Configure table appearance and behavior:
         self.setShowGrid(False)
+        self.setMouseTracking(True)
         self.setIconSize(self._opts.icon_size)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
         self.setColumnWidth(1, 120)
-        self.setHorizontalHeaderLabels(self._opts.columns)
         self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self._opts.row_height)
 
         # Configure column resizing:
         header = self.horizontalHeader()
@@ -186,7 +490,7 @@ class StartupFileTable(QtWidgets.QTableWidget):
         super().paintEvent(event)  # Call base-class implementation
 
         # Paint an empty indicator if the table is empty:
-        if self.rowCount() == 0:
+        if self._model.rowCount() == 0:
 
             painter = QtGui.QPainter(self.viewport())
             painter.setOpacity(self._opts.empty_icon_opacity)
@@ -196,7 +500,7 @@ class StartupFileTable(QtWidgets.QTableWidget):
             painter.drawText(
                 self.viewport().rect(),
                 QtCore.Qt.AlignmentFlag.AlignCenter,
-                "No items found",
+                "Scanning..." if self.scanning else "No items found",
             )
             painter.end()
 
@@ -209,70 +513,127 @@ class StartupFileTable(QtWidgets.QTableWidget):
         """
 
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            item = self.itemAt(event.pos())
-            if item is None:
+            if not self.indexAt(event.pos()).isValid():
                 self.clearSelection()  # Clear selection to re-disable the "Open" button
 
         super().mousePressEvent(event)  # Call base-class implementation
 
-    def add_item(self, path: Path, time: str) -> None:
+    def mouseMoveEvent(self, event) -> None:
         """
-        Add a new project row to the table.
+        Move the action buttons to the row under the cursor.
 
         Args:
-            path: The project file path.
-            time: The last modified time as a string.
+            event: The mouse move event.
         """
 
-        row = self.rowCount()  # Get the current row count
-        self.insertRow(self.rowCount())  # Insert a new row at the end
+        self._set_hover_row(self.indexAt(event.pos()).row())
+        super().mouseMoveEvent(event)
 
-        # The second column displays the last modified time:
-        item_second_column = QtWidgets.QTableWidgetItem(time)
-        item_second_column.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        item_second_column.setFlags(
-            item_second_column.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable
-        )
+    def leaveEvent(self, event) -> None:
 
-        # Change the icon based on whether the item is a directory or not:
-        item_first_column = QtWidgets.QTableWidgetItem(
-            QtGui.QIcon(":/logo/logo.png"), str()
-        )
+        self._set_hover_row(-1)
+        super().leaveEvent(event)
+
+    def hideEvent(self, event) -> None:
+
+        self.stop_scan()
+        super().hideEvent(event)
+
+    def _set_hover_row(self, row: int) -> None:
+        """
+        Show the action buttons on a row (or on none, if `row` is -1). Only the hovered row has buttons, so they are
+        created on demand instead of once per row.
+        """
+
+        if row == self._hover_row:
+            return
+
+        if self._hover_row >= 0:
+            self.setIndexWidget(self._model.index(self._hover_row, 0), None)
+
+        self._hover_row = row
+        if row < 0:
+            return
+
+        entry = self._model.entry(row)
+        item = FileTableItem(entry.name, path=entry.path, label=False)
+        item.sig_open_project.connect(self.sig_open_project)
+        item.sig_clone_project.connect(self.sig_clone_project)
+        item.sig_delete_project.connect(self.sig_delete_project)
 
-        self.setRowHeight(row, self._opts.row_height)
-        file_item = FileTableItem(path.stem, path=str(path))
-        self.setCellWidget(row, 0, file_item)
-        self.setItem(row, 1, item_second_column)
-        self.setItem(row, 0, item_first_column)
+        self.setIndexWidget(self._model.index(row, 0), item)
+
+    def _on_model_reset(self) -> None:
+        self._hover_row = -1  # Index widgets are dropped on reset
 
     def populate(self, directory: str, pattern: str) -> None:
         """
         Populate the table with project files from a directory.
 
+        The cached listing from the previous launch (if any) is shown immediately, while the directory is scanned in
+        the background. Without a cache, rows are streamed in as they are found.
+
         Args:
             directory: The directory path to search for files.
             pattern: A glob pattern to match files (e.g., "*.h5").
         """
 
-        # Import required modules:
-        from pathlib import Path
-        from datetime import datetime
-
         # Check validity of directory:
         base = Path(directory)
         if not base.is_dir():
             return
 
-        self.clearContents()
-        self.setRowCount(0)
+        self.stop_scan()
 
-        stem = Path(directory).stem  # Extract the directory name
+        stem = base.stem  # Extract the directory name
         stem = stem.capitalize()  # Capitalize the first letter
+        self._model.set_header(0, stem)
+
+        cached = DirectoryScanner.cached(directory, pattern)
+        self._model.set_entries(cached or [])
+
+        self._scanner = DirectoryScanner(directory, pattern)
+        if cached is None:
+            self._scanner.sig_batch.connect(self._on_scan_batch)
+
+        self._scanner.sig_finished.connect(self._on_scan_finished)
+        self._scanner.finished.connect(self.viewport().update)
+        self._scanner.start()
+
+    def stop_scan(self) -> None:
+        """
+        Stop a running scan without waiting for its thread: the scanner is disconnected from the table and asked to
+        stop (it checks for interruption between files). It is released once its thread has exited.
+        """
+
+        scanner, self._scanner = self._scanner, None
+        if scanner is None:
+            return
+
+        scanner.disconnect(self)
+        scanner.disconnect(self.viewport())
+        scanner.requestInterruption()
+
+    @QtCore.Slot(list)
+    def _on_scan_batch(self, entries: list[ProjectEntry]) -> None:
+
+        # Batches are queued across threads, so ignore those of a scan that was stopped:
+        if self.sender() is self._scanner:
+            self._model.append(entries)
+
+    @QtCore.Slot(list)
+    def _on_scan_finished(self, entries: list[ProjectEntry]) -> None:
+
+        if self.sender() is not self._scanner:
+            return
+
+        self._model.set_entries(entries)
+        self.sig_scan_finished.emit(len(entries))
 
-        self.setHorizontalHeaderLabels([stem, self._opts.columns[1]])
-        for item in Path(directory).glob(pattern):
-            stat = item.stat().st_mtime  # Get last modified time
-            date = datetime.fromtimestamp(stat)  # Convert to datetime object
-            time = date.strftime("%Y-%m-%d")  # Format as string
+    @property
+    def scanning(self) -> bool:
+        return self._scanner is not None and self._scanner.isRunning()
 
-            self.add_item(item, time)
+    @property
+    def projects(self) -> ProjectTableModel:
+        return self._model
@@ -13,7 +13,7 @@ from PySide6 import QtWidgets
 
 # Climact modules: gui.widgets, gui.startup
 from gui.startup.choice import StartupChoice
-from gui.startup.ftable import StartupFileTable, FileTableItem
+from gui.startup.ftable import StartupFileTable
 from gui.widgets import GLayout
 
 
@@ -211,12 +211,9 @@ class StartupWindow(QtWidgets.QDialog):
         self._choice.sig_button_tmp_clicked.connect(self._on_library_clicked)
         self._choice.sig_button_quit_clicked.connect(self._on_quit)
 
-        for row in range(self._ftable.rowCount()):
-            item = self._ftable.cellWidget(row, 0)
-            if isinstance(item, FileTableItem):
-                item.sig_open_project.connect(self._on_open_project)
-                item.sig_clone_project.connect(self._on_clone_project)
-                item.sig_delete_project.connect(self._on_delete_project)
+        self._ftable.sig_open_project.connect(self._on_open_project)
+        self._ftable.sig_clone_project.connect(self._on_clone_project)
+        self._ftable.sig_delete_project.connect(self._on_delete_project)
 
     @QtCore.Slot()
     def _on_new_project(self) -> None:
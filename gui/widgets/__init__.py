@@ -2,6 +2,7 @@ from .combobox import ComboBox
 from .dock import Dock
 from .tabwidget import TabWidget
 from .field import Field
+from .framestats import FrameStats
 from .layouts import *
 from .toolbar import ToolBar
 from .traffic import TrafficLights
@@ -11,6 +12,7 @@ __all__ = [
     "ComboBox",
     "Dock",
     "Field",
+    "FrameStats",
     "GLayout",
     "HLayout",
     "VLayout",
@@ -0,0 +1,85 @@
+# Filename: framestats.py
+# Module name: widgets
+# Description: Frame-rate and frame-time overlay for graphics views.
+
+"""
+Overlay label that reports the frame rate and paint times of a QGraphicsView.
+
+The view records the duration of each of its paint events with `FrameStats.record()`; the label summarizes the last
+second of frames twice per second. Times are measured on the CPU, so with an OpenGL viewport they cover issuing the
+draw calls rather than rasterization.
+"""
+
+from __future__ import annotations
+
+# Standard
+import collections
+import time
+
+# PySide6 (Python/Qt)
+from PySide6 import QtCore
+from PySide6 import QtWidgets
+
+
+class FrameStats(QtWidgets.QLabel):
+    """
+    A small, mouse-transparent label that shows frames per second and mean/max paint time.
+    """
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None, interval: int = 500):
+
+        super().__init__(parent)
+
+        # Paint events as (end, duration) pairs, in seconds
+        self._frames: collections.deque[tuple[float, float]] = collections.deque(maxlen=1000)
+
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "QLabel {"
+            "background: rgba(35, 42, 46, 200);"
+            "color: #efefef;"
+            "font: 11px monospace;"
+            "padding: 4px 6px;"
+            "border-radius: 4px;"
+            "}"
+        )
+
+        self._timer = QtCore.QTimer(self, interval=interval)
+        self._timer.timeout.connect(self.refresh)
+
+        self.move(8, 8)
+        self.hide()
+
+    def record(self, start: float, end: float) -> None:
+        """
+        Record a paint event's start and end times, as returned by `time.perf_counter()`.
+        """
+        self._frames.append((end, end - start))
+
+    def refresh(self) -> None:
+        """
+        Summarize the frames painted during the last second.
+        """
+
+        now = time.perf_counter()
+        recent = [duration for end, duration in self._frames if now - end <= 1.0]
+
+        if recent:
+            mean = 1e3 * sum(recent) / len(recent)
+            peak = 1e3 * max(recent)
+            self.setText(f"{len(recent):3d} fps  {mean:6.1f} ms  (max {peak:.1f} ms)")
+        else:
+            self.setText("  0 fps")
+
+        self.adjustSize()
+        self.raise_()
+
+    def setVisible(self, visible: bool) -> None:
+
+        super().setVisible(visible)
+        if visible:
+            self._frames.clear()
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
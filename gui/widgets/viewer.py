@@ -11,6 +11,9 @@ for hardware acceleration, and keyboard/mouse event handling for navigation and
 
 from __future__ import annotations
 
+# Standard
+import time
+
 # PySide6 (Python/Qt)
 from PySide6 import QtGui
 from PySide6 import QtCore
@@ -19,6 +22,7 @@ from PySide6 import QtOpenGLWidgets
 
 # Climact modules: gui.graph, core.graph
 from gui.graph import Canvas
+from gui.widgets.framestats import FrameStats
 
 
 class Viewer(QtWidgets.QGraphicsView):
@@ -30,6 +34,8 @@ class Viewer(QtWidgets.QGraphicsView):
     - OpenGL viewport for hardware acceleration
     - Keyboard and mouse event handling for intuitive navigation
     - Standard shortcuts (Undo, Redo, Copy, Paste) passed to the scene
+    - Large-scene mode for canvases with thousands of items (see `set_large_scene`)
+    - Frame-rate/frame-time overlay, toggled with Ctrl+Shift+F
     """
 
     # Initializer
@@ -44,6 +50,8 @@ class Viewer(QtWidgets.QGraphicsView):
         }
 
         # Invoke super class initializer
+        opengl = kwargs.pop("opengl", True)
+        large_scene = kwargs.pop("large_scene", False)
         super().__init__(**kwargs)
 
         # Zoom animation with exponential easing
@@ -57,7 +65,7 @@ class Viewer(QtWidgets.QGraphicsView):
         self._focus_anim.setDuration(720)
 
         # OpenGL viewport with 4x MSAA for hardware-accelerated rendering
-        if kwargs.get("opengl", True):
+        if opengl:
             self._setup_opengl_viewport()
 
         # Set scene
@@ -70,6 +78,11 @@ class Viewer(QtWidgets.QGraphicsView):
         test_guid = uuid.uuid4().hex
         canvas.load_graph(test_guid)
 
+        # Frame-rate overlay (hidden by default) and large-scene mode
+        self._frame_stats = FrameStats(self)
+        if large_scene:
+            self.set_large_scene(True)
+
         # Register keyboard shortcuts for zoom, undo/redo, and copy/paste:
         QtGui.QShortcut(
             QtGui.QKeySequence("Ctrl+="), self, lambda: self.execute_zoom(1.2, True)
@@ -92,6 +105,11 @@ class Viewer(QtWidgets.QGraphicsView):
         QtGui.QShortcut(
             QtGui.QKeySequence.StandardKey.Delete, self, self._shortcut_handler
         )
+        QtGui.QShortcut(
+            QtGui.QKeySequence("Ctrl+Shift+F"),
+            self,
+            lambda: self.show_frame_stats(not self._frame_stats.isVisible()),
+        )
 
         # Connect to the application's viewer instructions signal group
         app = QtWidgets.QApplication.instance()
@@ -109,6 +127,50 @@ class Viewer(QtWidgets.QGraphicsView):
         self._openGL_viewport.setMouseTracking(True)
         self.setViewport(self._openGL_viewport)
 
+    def set_large_scene(self, enabled: bool = True) -> None:
+        """
+        Toggle the large-scene mode for this view and its canvas.
+
+        When enabled, only the exposed parts of the viewport are repainted, the static background is cached, and
+        the view neither pads item exposures for antialiasing nor saves painter state around each item (the items
+        set their pen, brush and render hints before drawing). The canvas switches to a shallow BSP index, see
+        `Canvas.set_large_scene`.
+
+        Args:
+            enabled: Whether to enable (default) or disable the mode.
+        """
+
+        update_mode = QtWidgets.QGraphicsView.ViewportUpdateMode
+        cache_mode = QtWidgets.QGraphicsView.CacheModeFlag
+        optimization = QtWidgets.QGraphicsView.OptimizationFlag
+        flags = optimization.DontAdjustForAntialiasing | optimization.DontSavePainterState
+
+        self.setViewportUpdateMode(update_mode.MinimalViewportUpdate)
+        self.setCacheMode(cache_mode.CacheBackground if enabled else cache_mode.CacheNone)
+        self.setOptimizationFlags(flags if enabled else QtWidgets.QGraphicsView.OptimizationFlag(0))
+        self.resetCachedContent()
+
+        scene = self.scene()
+        if hasattr(scene, "set_large_scene"):
+            scene.set_large_scene(enabled)
+
+    def show_frame_stats(self, visible: bool = True) -> None:
+        """
+        Show or hide the frame-rate/frame-time overlay.
+        """
+        self._frame_stats.setVisible(visible)
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+
+        # Time each frame only while the overlay is shown
+        if not self._frame_stats.isVisible():
+            super().paintEvent(event)
+            return
+
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self._frame_stats.record(start, time.perf_counter())
+
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         """
         Handle keyboard press events for view manipulation.
@@ -0,0 +1,513 @@
+"""Test suite for core.graph module"""
+
+import asyncio
+import json
+import unittest
+import uuid
+
+from core.graph import Edge, GraphController, Node
+from core.graph.arrays import GraphArrays
+from core.graph.evaluator import compile_expression
+
+
+def _quantity(value, units, kind="Quantity"):
+    return {"type": kind, "value": value, "units": units}
+
+
+class TestGraphController(unittest.TestCase):
+    """Test GraphController operations"""
+
+    def setUp(self):
+        self.ctrl = GraphController()
+        self.guid = uuid.uuid4().hex
+        asyncio.run(self.ctrl.create_graph(self.guid))
+
+    def _node(self, tech: dict) -> str:
+        response = asyncio.run(self.ctrl.create_node(self.guid, json.dumps({})))
+        nuid = response["response"]["nuid"]
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), nuid
+            )
+        )
+        return nuid
+
+    def _edge(self, suid: str, tuid: str) -> str:
+        payload = json.dumps({"source_uid": suid, "target_uid": tuid})
+        response = asyncio.run(self.ctrl.create_edge(self.guid, payload))
+        return response["response"]["euid"]
+
+    def _chain(self):
+        """Build `mine -> furnace -> ccus` plus an unconnected `other` node."""
+
+        mine = self._node(
+            {
+                "out": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+                "par": {"rate": _quantity(10, "kg/s", "MassFlowRate")},
+                "eqn": {"ore": "rate"},
+            }
+        )
+        furnace = self._node(
+            {
+                "inp": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+                "out": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+                "par": {"ef": _quantity(2, "dimensionless")},
+                "eqn": {"CO2": "ore * ef"},
+            }
+        )
+        ccus = self._node(
+            {
+                "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+                "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+                "par": {"penetration": _quantity(0, "dimensionless")},
+                "eqn": {"emitted": "CO2 * (1 - penetration)"},
+            }
+        )
+        other = self._node(
+            {
+                "par": {"x": _quantity(1, "kg")},
+                "eqn": {"y": "x"},
+            }
+        )
+
+        self._edge(mine, furnace)
+        self._edge(furnace, ccus)
+        return mine, furnace, ccus, other
+
+    def test_update_recomputes_downstream_only(self):
+        """Editing a parameter recomputes the edited node and its downstream nodes only"""
+
+        mine, furnace, ccus, other = self._chain()
+        graph = self.ctrl.database[self.guid]
+        self.assertAlmostEqual(graph.cache[ccus]["emitted"].magnitude, 20.0)
+
+        tech = {
+            "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+            "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {"penetration": _quantity(0.5, "dimensionless")},
+            "eqn": {"emitted": "CO2 * (1 - penetration)"},
+        }
+        response = asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), ccus
+            )
+        )
+        self.assertEqual(response["response"]["recomputed"], 1)
+        self.assertAlmostEqual(graph.cache[ccus]["emitted"].magnitude, 10.0)
+
+        tech = {
+            "out": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {"rate": _quantity(20, "kg/s", "MassFlowRate")},
+            "eqn": {"ore": "rate"},
+        }
+        response = asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), mine
+            )
+        )
+        self.assertEqual(response["response"]["recomputed"], 3)
+        self.assertAlmostEqual(graph.cache[ccus]["emitted"].magnitude, 20.0)
+
+    def test_invalid_technology_leaves_node_unchanged(self):
+        """Technologies with invalid units or quantities are rejected before the node is modified"""
+
+        mine, furnace, ccus, other = self._chain()
+        graph = self.ctrl.database[self.guid]
+        before = dict(graph.nodes[ccus].tech)
+
+        for quantity in (
+            _quantity(0, "furlongz"),
+            _quantity(0, "s", "Mass"),
+            {"type": "Quantity", "value": 0, "units": "kg", "profile": {"kind": "Unknown"}},
+        ):
+            tech = {
+                "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+                "par": {"penetration": quantity},
+            }
+            response = asyncio.run(
+                self.ctrl.update_node_data(
+                    self.guid, json.dumps({"tech": {"default": tech}, "meta": {"label": "x"}}), ccus
+                )
+            )
+            self.assertEqual(response["status"], "FAILED")
+            self.assertEqual(graph.nodes[ccus].tech, before)
+            self.assertNotIn("label", graph.nodes[ccus].meta)
+            self.assertAlmostEqual(graph.cache[ccus]["emitted"].magnitude, 20.0)
+
+    def test_equations_are_restricted_to_arithmetic(self):
+        """Equations that reach attributes, subscripts or other syntax are rejected before they run"""
+
+        escape = (
+            "[c for c in ().__class__.__base__.__subclasses__() "
+            "if c.__name__ == 'BuiltinImporter'][0].load_module('os').getcwd()"
+        )
+        for source in (escape, "().__class__", "x[0]", "(lambda: 1)()", "__import__('os')", "exp(x=1)"):
+            with self.assertRaises(ValueError):
+                compile_expression(source)
+
+        self.assertEqual(compile_expression("sqrt(a) * -b + 2 ** c").names, {"a", "b", "c"})
+
+        # Through the controller, the node's other equations still evaluate
+        node = self._node(
+            {
+                "par": {"x": _quantity(1, "kg")},
+                "eqn": {"y": "x", "z": escape},
+            }
+        )
+        self.assertEqual(set(self.ctrl.database[self.guid].cache[node]), {"y"})
+
+    def test_unchanged_output_stops_propagation(self):
+        """Downstream nodes are skipped when the edited node's outputs do not change"""
+
+        mine, furnace, ccus, other = self._chain()
+
+        tech = {
+            "out": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {
+                "rate": _quantity(10, "kg/s", "MassFlowRate"),
+                "unused": _quantity(3, "dimensionless"),
+            },
+            "eqn": {"ore": "rate"},
+        }
+        response = asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), mine
+            )
+        )
+        self.assertEqual(response["response"]["recomputed"], 1)
+
+    def test_profiles_evaluate_over_horizon(self):
+        """Profile-backed parameters evaluate the graph over all years in one pass"""
+
+        mine, furnace, ccus, other = self._chain()
+        tech = {
+            "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+            "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {
+                "penetration": {
+                    **_quantity(0, "dimensionless"),
+                    "profile": {"kind": "Linear", "points": [2024, 2050], "values": [0, 0.5]},
+                }
+            },
+            "eqn": {"emitted": "CO2 * (1 - penetration)"},
+        }
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), ccus
+            )
+        )
+
+        emitted = self.ctrl.database[self.guid].cache[ccus]["emitted"].magnitude
+        self.assertEqual(emitted.shape, (27,))
+        self.assertAlmostEqual(emitted[0], 20.0)
+        self.assertAlmostEqual(emitted[-1], 10.0)
+
+    def test_graph_snapshot(self):
+        """The graph snapshot lists every node and edge by UID"""
+
+        mine, furnace, ccus, other = self._chain()
+        response = asyncio.run(self.ctrl.send_graph_data(self.guid))
+        snapshot = response["response"]
+
+        self.assertEqual(set(snapshot["nodes"]), {mine, furnace, ccus, other})
+        self.assertEqual(
+            {(e["source_uid"], e["target_uid"]) for e in snapshot["edges"].values()},
+            {(mine, furnace), (furnace, ccus)},
+        )
+        json.dumps(snapshot)
+
+    def test_node_round_trip(self):
+        """Updated technologies deserialize to quantities and serialize back"""
+
+        mine, *_ = self._chain()
+        response = asyncio.run(self.ctrl.send_node_data(self.guid, mine))
+        par = response["response"]["tech"]["default"]["par"]
+        self.assertEqual(par["rate"]["type"], "MassFlowRate")
+        self.assertEqual(par["rate"]["value"], 10)
+
+    def test_search_index_tracks_updates(self):
+        """Search matches labels and streams by prefix and fuzzily, and follows node updates"""
+
+        mine, furnace, ccus, other = self._chain()
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"meta": {"label": "Blast Furnace"}}), furnace
+            )
+        )
+
+        def search(text: str, **options) -> list[str]:
+            payload = json.dumps({"text": text, **options})
+            response = asyncio.run(self.ctrl.search(self.guid, payload))
+            return [match["nuid"] for match in response["response"]["matches"]]
+
+        self.assertEqual(search("furnace"), [furnace])
+        self.assertEqual(search("furn"), [furnace])
+        self.assertEqual(search("furnaec"), [furnace])
+        self.assertEqual(search("furnaec", fuzzy=False), [])
+        self.assertEqual(set(search("inp:co2")), {ccus})
+        self.assertEqual(set(search("co2")), {furnace, ccus})
+        self.assertEqual(search("blast co2"), [furnace])
+
+        tech = {
+            "par": {"x": _quantity(1, "kg")},
+            "eqn": {"y": "x"},
+        }
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), ccus
+            )
+        )
+        self.assertEqual(search("inp:co2"), [])
+        self.assertEqual(set(search("par:x")), {ccus, other})
+
+    def test_search_across_graphs(self):
+        """A search without a GUID spans all graphs through one index, and follows updates"""
+
+        token = uuid.uuid4().hex[:12]
+        first = self._node({})
+        asyncio.run(self.ctrl.update_node_data(self.guid, json.dumps({"meta": {"label": f"{token} A"}}), first))
+
+        guid = uuid.uuid4().hex
+        asyncio.run(self.ctrl.create_graph(guid))
+        response = asyncio.run(self.ctrl.create_node(guid, json.dumps({"label": f"{token} B"})))
+        second = response["response"]["nuid"]
+
+        def search(text: str, **options) -> dict:
+            return asyncio.run(self.ctrl.search(None, json.dumps({"text": text, **options})))
+
+        matches = search(token)["response"]["matches"]
+        self.assertEqual({(m["guid"], m["nuid"]) for m in matches}, {(self.guid, first), (guid, second)})
+
+        asyncio.run(self.ctrl.update_node_data(guid, json.dumps({"meta": {"label": "renamed"}}), second))
+        self.assertEqual([m["nuid"] for m in search(token)["response"]["matches"]], [first])
+
+        # Graphs dropped from the database are skipped
+        del self.ctrl.database[self.guid]
+        self.assertEqual(search(token)["response"]["matches"], [])
+
+        # Limits are coerced to integers
+        self.assertEqual(len(search("renamed", limit="1")["response"]["matches"]), 1)
+        for limit in ("ten", -1, [1]):
+            self.assertEqual(search("renamed", limit=limit)["status"], "FAILED")
+
+    def test_attribute_query(self):
+        """Queries compare stream values and attributes across units, and combine with metadata"""
+
+        mine, furnace, ccus, other = self._chain()
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"meta": {"state": "Odisha"}}), furnace
+            )
+        )
+        tech = {
+            "out": {
+                "Electricity": {
+                    **_quantity(100, "kW", "EnergyFlowRate"),
+                    "CO2_intensity": _quantity(0.7, "kg/kWh"),
+                }
+            },
+        }
+        asyncio.run(
+            self.ctrl.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), other
+            )
+        )
+
+        def query(text: str) -> set[str]:
+            response = asyncio.run(self.ctrl.query(self.guid, json.dumps({"query": text})))
+            return set(response["response"]["matches"])
+
+        self.assertEqual(query("out.Electricity.CO2_intensity > 500 g/kWh"), {other})
+        self.assertEqual(query("out.Electricity.CO2_intensity > 1 kg/kWh"), set())
+        self.assertEqual(query("par.rate >= 36 t/h"), {mine})
+        self.assertEqual(query("par.* > 1 or out.Elec* > 0.05 MW"), {mine, furnace, other})
+        self.assertEqual(query('inp.ore > -1 kg/s and not meta.state == "Odisha"'), set())
+        self.assertEqual(query('meta.state == "Odisha"'), {furnace})
+
+        response = asyncio.run(self.ctrl.query(self.guid, json.dumps({"query": "par.rate >"})))
+        self.assertEqual(response["status"], "FAILED")
+
+    def test_edges_store_node_indices(self):
+        """Edges hold indices into the graph's node index and resolve them back to UIDs"""
+
+        mine, furnace, ccus, other = self._chain()
+        graph = self.ctrl.database[self.guid]
+        edge = graph.edges[next(iter(graph.links_out[furnace]))]
+
+        self.assertEqual((edge.source_uid, edge.target_uid), (furnace, ccus))
+        self.assertEqual(graph.ids.uid(edge.source), furnace)
+        self.assertIsInstance(edge.target, int)
+        self.assertFalse(hasattr(edge, "__dict__") or hasattr(graph.nodes[mine], "__dict__"))
+
+        response = asyncio.run(self.ctrl.send_graph_data(self.guid))
+        self.assertEqual(
+            {(e["source_uid"], e["target_uid"]) for e in response["response"]["edges"].values()},
+            {(mine, furnace), (furnace, ccus)},
+        )
+
+    def test_graph_arrays(self):
+        """Graphs export to cached COO/CSR arrays, and analytics run on their igraph form"""
+
+        mine, furnace, ccus, other = self._chain()
+        arrays = self.ctrl.graph_arrays(self.guid)
+        self.assertIs(self.ctrl.graph_arrays(self.guid), arrays)
+
+        self.assertEqual(arrays.shape, (4, 2))
+        self.assertEqual(arrays.successors(mine), [furnace])
+        self.assertEqual(arrays.indptr.tolist(), [0, 1, 2, 2, 2])
+        self.assertEqual(arrays.to_igraph().ecount(), 2)
+
+        response = asyncio.run(self.ctrl.analyze(self.guid, json.dumps({})))["response"]
+        self.assertTrue(response["acyclic"])
+        self.assertEqual([n for n in response["order"] if n != other], [mine, furnace, ccus])
+        self.assertEqual(response["components"], [[mine, furnace, ccus], [other]])
+
+        # Mutations drop the cached arrays
+        asyncio.run(self.ctrl.create_node(self.guid, json.dumps({})))
+        self.assertEqual(self.ctrl.graph_arrays(self.guid).shape, (5, 2))
+
+        # A cycle, built directly
+        graph = GraphController.Graph()
+        for nuid in "abc":
+            graph.nodes[nuid] = Node(nuid=nuid, meta={"rank": ord(nuid)})
+        for source, target in ("ab", "bc", "ca"):
+            graph.edges[source + target] = Edge.between(source + target, source, target, graph.ids)
+
+        arrays = GraphArrays(graph)
+        self.assertFalse(arrays.is_acyclic())
+        self.assertEqual(len(arrays.feedback_edges()), 1)
+        self.assertEqual(arrays.node_column("rank").tolist(), [97.0, 98.0, 99.0])
+        with self.assertRaises(ValueError):
+            arrays.topological_order()
+
+    def test_validate_incrementally(self):
+        """Validation reports dangling streams, mismatched dimensions and components, re-checking changed nodes only"""
+
+        mine, furnace, ccus, other = self._chain()
+
+        def validate(full=False) -> dict:
+            return asyncio.run(self.ctrl.validate(self.guid, json.dumps({"full": full})))["response"]
+
+        result = validate()
+        self.assertTrue(result["valid"])
+        self.assertTrue(result["checked"]["full"])
+        kinds = {(issue["kind"], issue.get("nuid"), issue.get("stream")) for issue in result["issues"]}
+        self.assertEqual(
+            kinds,
+            {("unconsumed_output", ccus, "emitted"), ("disconnected", None, None)},
+        )
+
+        # Nothing changed: nothing re-checked
+        result = validate()
+        self.assertEqual((result["checked"]["nodes"], result["added"], result["resolved"]), (0, [], []))
+
+        # Feed the CCUS unit with energy instead of mass
+        tech = {
+            "inp": {"CO2": _quantity(0, "kW", "EnergyFlowRate")},
+            "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+        }
+        asyncio.run(
+            self.ctrl.update_node_data(self.guid, json.dumps({"tech": {"default": tech}}), ccus)
+        )
+        result = validate()
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["checked"], {"nodes": 2, "edges": 1, "full": False})
+        self.assertEqual([issue["kind"] for issue in result["added"]], ["dimension_mismatch"])
+
+        self.assertEqual(validate(full=True)["issues"], result["issues"])
+
+    def test_identical_technologies_are_shared(self):
+        """Nodes with identical technologies share one read-only instance until one of them is edited"""
+
+        tech = {
+            "inp": {"ore": _quantity(0, "kg/s", "MassFlowRate")},
+            "par": {"ef": _quantity(2, "dimensionless")},
+        }
+        first, second = self._node(tech), self._node(json.loads(json.dumps(tech)))
+        nodes = self.ctrl.database[self.guid].nodes
+        self.assertIs(nodes[first].tech["default"], nodes[second].tech["default"])
+
+        with self.assertRaises(TypeError):
+            nodes[first].tech["default"].par["ef"] = None
+
+        tech["par"]["ef"] = _quantity(3, "dimensionless")
+        asyncio.run(
+            self.ctrl.update_node_data(self.guid, json.dumps({"tech": {"default": tech}}), first)
+        )
+        self.assertIsNot(nodes[first].tech["default"], nodes[second].tech["default"])
+        self.assertEqual(nodes[second].tech["default"].par["ef"].value, 2)
+
+    def test_template_instances_share_technology(self):
+        """Template instances share technologies and recompute only overridden nodes"""
+
+        name = uuid.uuid4().hex
+        template = {
+            "nodes": {
+                "furnace": {
+                    "meta": {"label": "Furnace"},
+                    "tech": {"default": {
+                        "out": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+                        "par": {"rate": _quantity(10, "kg/s", "MassFlowRate")},
+                        "eqn": {"CO2": "rate"},
+                    }},
+                },
+                "ccus": {
+                    "meta": {"label": "CCUS"},
+                    "tech": {"default": {
+                        "inp": {"CO2": _quantity(0, "kg/s", "MassFlowRate")},
+                        "out": {"emitted": _quantity(0, "kg/s", "MassFlowRate")},
+                        "par": {"penetration": _quantity(0, "dimensionless")},
+                        "eqn": {"emitted": "CO2 * (1 - penetration)"},
+                    }},
+                },
+            },
+            "edges": [["furnace", "ccus"]],
+        }
+        response = asyncio.run(self.ctrl.create_template(name, json.dumps(template)))
+        self.assertEqual(response["status"], "OK")
+
+        instances = [
+            {"meta": {"plant": "P1"}},
+            {"meta": {"plant": "P2"}, "parameters": {"ccus.penetration": 0.5, "Owner": "SAIL"}},
+        ]
+        response = asyncio.run(
+            self.ctrl.instantiate_template(name, json.dumps({"instances": instances}))
+        )
+        self.assertEqual(response["response"]["recomputed"], 1)
+
+        first, second = (self.ctrl.database[guid] for guid in response["response"]["graphs"])
+        (a, b) = response["response"]["nodes"]
+        prototype = self.ctrl.templates[name].graph
+        self.assertIs(first.nodes[a["ccus"]].tech["default"], prototype.nodes["ccus"].tech["default"])
+        self.assertIs(second.nodes[b["furnace"]].tech["default"], prototype.nodes["furnace"].tech["default"])
+        self.assertIsNot(second.nodes[b["ccus"]].tech["default"], prototype.nodes["ccus"].tech["default"])
+        self.assertAlmostEqual(first.cache[a["ccus"]]["emitted"].magnitude, 10.0)
+        self.assertAlmostEqual(second.cache[b["ccus"]]["emitted"].magnitude, 5.0)
+        self.assertEqual(
+            second.nodes[b["furnace"]].meta, {"label": "Furnace", "plant": "P2", "template_node": "furnace"}
+        )
+
+        # Every instance has its own node and edge UIDs
+        self.assertFalse(set(a.values()) & set(b.values()) or set(a.values()) & set(prototype.nodes))
+        self.assertFalse(first.edges.keys() & second.edges.keys())
+        (edge,) = second.edges.values()
+        self.assertEqual((edge.source_uid, edge.target_uid), (b["furnace"], b["ccus"]))
+        self.assertEqual(second.links_out[b["furnace"]], {edge.uid})
+
+        # Overridden parameters must exist in the template
+        payload = json.dumps({"parameters": {"ccus.efficiency": 0.9}})
+        response = asyncio.run(self.ctrl.instantiate_template(name, payload))
+        self.assertEqual(response["status"], "FAILED")
+
+        # Invalid units are reported, not raised
+        payload = json.dumps({"parameters": {"ccus.penetration": _quantity(0.5, "furlongz")}})
+        response = asyncio.run(self.ctrl.instantiate_template(name, payload))
+        self.assertEqual(response["status"], "FAILED")
+
+        template["nodes"]["ccus"]["tech"]["default"]["par"]["penetration"] = _quantity(0, "furlongz")
+        response = asyncio.run(self.ctrl.create_template(uuid.uuid4().hex, json.dumps(template)))
+        self.assertEqual(response["status"], "FAILED")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Test suite for core.models module"""
+
+import asyncio
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+
+from core.graph import GraphController, executable
+from core.models import Plant, PlantImporter
+
+
+ROWS = [
+    ["Plant ID", "Name", "State", "Latitude", "Longitude", "Capacity [t/day]", "Pathway", "Year", "Cost (INR/t)", "Owner"],
+    ["P1", "Rourkela", "Odisha", "22.2", "84.9", "1000", "BF-BOF", "1959", "42000", "SAIL"],
+    ["P2", "Bhilai", "Chhattisgarh", "21.2", "81.4", "", "BF-BOF", "", "", ""],
+    ["P3", "Nowhere", "", "", "80.0", "10", "DRI-EAF", "2001", "1", "-"],
+    ["P4", "Hazira", "Gujarat", "21.1", "72.6", "2000", "DRI-EAF", "2010", "38000", "AM/NS"],
+]
+
+
+class TestPlantImporter(unittest.TestCase):
+    """Test streaming plant table imports"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w") as stream:
+            stream.write("\n".join(",".join(row) for row in ROWS))
+
+        # Imports through the controller are restricted to its data directory
+        self.data_dir = GraphController.data_dir
+        GraphController.data_dir = pathlib.Path(self.path).parent
+
+    def tearDown(self):
+        GraphController.data_dir = self.data_dir
+        os.remove(self.path)
+
+    def test_read_converts_units_per_column(self):
+        importer = PlantImporter(PlantImporter.Options(chunk_size=2))
+        chunks = list(importer.chunks(self.path))
+
+        # P3 has no latitude and is skipped
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual((importer.stats.rows, importer.stats.plants, importer.stats.skipped), (4, 3, 1))
+
+        rourkela, bhilai, hazira = [plant for chunk in chunks for plant in chunk]
+        self.assertIsInstance(rourkela, Plant)
+        self.assertEqual((rourkela.id, rourkela.state, rourkela.year_commissioned), ("P1", "Odisha", 1959))
+        self.assertAlmostEqual(rourkela.capacity_mtpa, 1000 * 365.25 / 1e6)
+        self.assertEqual(
+            rourkela.parameters,
+            {"Cost": {"type": "Quantity", "value": 42000.0, "units": "INR/t"}, "Owner": "SAIL"},
+        )
+
+        # Blank cells
+        self.assertEqual((bhilai.capacity_mtpa, bhilai.year_commissioned, bhilai.parameters), (0.0, None, {}))
+        self.assertEqual(hazira.parameters["Owner"], "AM/NS")
+
+    def test_invalid_units_fail_on_header(self):
+        options = PlantImporter.Options(units={"Capacity": "MW"})
+        with self.assertRaises(ValueError):
+            PlantImporter(options).read(self.path)
+
+    def test_import_creates_plant_graphs(self):
+        execute = executable()
+        response = asyncio.run(execute("import_plants", json.dumps({"data": {"path": self.path}})))
+
+        self.assertEqual(response["status"], "OK")
+        self.assertEqual((response["response"]["count"], response["response"]["skipped"]), (3, 1))
+
+        graph = response["response"]["graphs"]["P4"]
+        node = GraphController().database[graph["guid"]].nodes[graph["nuid"]]
+        self.assertEqual((node.meta["label"], node.meta["pathway"]), ("Hazira", "DRI-EAF"))
+
+        search = asyncio.run(GraphController().search(graph["guid"], json.dumps({"text": "hazira"})))
+        self.assertEqual([match["nuid"] for match in search["response"]["matches"]], [graph["nuid"]])
+
+        # Paths are relative to the data directory
+        response = asyncio.run(execute("import_plants", json.dumps({"data": {"path": os.path.basename(self.path)}})))
+        self.assertEqual((response["status"], response["response"]["count"]), ("OK", 3))
+
+    def test_import_is_restricted_to_data_directory(self):
+        execute = executable()
+        GraphController.data_dir = pathlib.Path(self.path).parent / "data"
+
+        for path in (self.path, os.path.join("..", os.path.basename(self.path))):
+            response = asyncio.run(execute("import_plants", json.dumps({"data": {"path": path}})))
+            self.assertEqual(response["status"], "FAILED")
+            self.assertIn("data directory", response["reason"])
+
+
+if __name__ == "__main__":
+    unittest.main()
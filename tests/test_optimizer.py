@@ -0,0 +1,279 @@
+"""Test suite for core.optimizer module"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+import uuid
+
+import numpy as np
+from pathlib import Path
+
+from core.graph import GraphController
+from core.optimizer import OptimizerController, build_model
+from core.optimizer.model import _check_linear
+
+
+def _quantity(value, units, kind="Quantity"):
+    return {"type": kind, "value": value, "units": units}
+
+
+class TestOptimizerController(unittest.TestCase):
+    """Test LP assembly and solution over a small supply graph"""
+
+    def setUp(self):
+        self.graphs = GraphController()
+        self.guid = uuid.uuid4().hex
+        asyncio.run(self.graphs.create_graph(self.guid))
+
+        supplier_a = self._node(
+            {
+                "inp": {"coal_a": _quantity(0, "kg/s")},
+                "out": {"fuel": _quantity(0, "kg/s")},
+                "eqn": {"fuel": "coal_a"},
+            }
+        )
+        supplier_b = self._node(
+            {
+                "inp": {"coal_b": _quantity(0, "kg/s")},
+                "out": {"fuel": _quantity(0, "kg/s")},
+                "eqn": {"fuel": "coal_b"},
+            }
+        )
+        self.plant = self._node(
+            {
+                "inp": {"fuel": _quantity(0, "kg/s")},
+                "out": {"steel": _quantity(0, "kg/s")},
+                "par": {"ratio": _quantity(0.5, "dimensionless")},
+                "eqn": {"steel": "ratio * fuel"},
+            }
+        )
+
+        self._edge(supplier_a, self.plant)
+        self._edge(supplier_b, self.plant)
+        self.supplier_a = supplier_a
+        self.supplier_b = supplier_b
+
+    def _node(self, tech: dict) -> str:
+        response = asyncio.run(self.graphs.create_node(self.guid, json.dumps({})))
+        nuid = response["response"]["nuid"]
+        asyncio.run(
+            self.graphs.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), nuid
+            )
+        )
+        return nuid
+
+    def _edge(self, suid: str, tuid: str) -> None:
+        payload = json.dumps({"source_uid": suid, "target_uid": tuid})
+        asyncio.run(self.graphs.create_edge(self.guid, payload))
+
+    def test_model_is_sparse(self):
+        """Each equation and balance row only touches its own variables"""
+
+        model = build_model(self.graphs.database[self.guid])
+        self.assertEqual(model.a_eq.shape, (6, 8))
+        self.assertEqual(model.a_eq.nnz, 13)
+
+    def test_cheapest_supplier(self):
+        """The solver buys from the cheaper supplier until its bound is hit"""
+
+        data = {
+            "objective": {"coal_a": 2.0, "coal_b": 3.0},
+            "bounds": {self.plant: {"steel": [10, 10]}},
+        }
+        response = asyncio.run(OptimizerController().solve(self.guid, data))
+        self.assertEqual(response["status"], "OK")
+        self.assertAlmostEqual(response["response"]["objective"], 40.0)
+        self.assertIn("build", response["response"]["timing"])
+        self.assertIn("solve", response["response"]["timing"])
+
+        data["bounds"][self.supplier_a] = {"coal_a": [0, 5]}
+        data["integers"] = [f"{self.supplier_a}.coal_a"]
+        response = asyncio.run(OptimizerController().solve(self.guid, data))
+        self.assertAlmostEqual(response["response"]["objective"], 55.0)
+
+    def test_flows_convert_units(self):
+        """Edges convert between the units of the connected streams, and reject mismatched dimensions"""
+
+        tech = {
+            "inp": {"coal_a": _quantity(0, "t/h")},
+            "out": {"fuel": _quantity(0, "t/h")},
+            "eqn": {"fuel": "coal_a"},
+        }
+        asyncio.run(
+            self.graphs.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), self.supplier_a
+            )
+        )
+
+        # 10 kg/s of steel needs 20 kg/s of fuel; coal A costs 2 per t/h, i.e. 7.2 per kg/s
+        data = {
+            "objective": {"coal_a": 2.0, "coal_b": 3.0},
+            "bounds": {self.plant: {"steel": [10, 10]}},
+        }
+        response = asyncio.run(OptimizerController().solve(self.guid, data))
+        self.assertAlmostEqual(response["response"]["objective"], 60.0)
+
+        # With coal B limited to 10 kg/s, the other 10 kg/s (36 t/h) come from supplier A
+        data["bounds"][self.supplier_b] = {"coal_b": [0, 10]}
+        response = asyncio.run(OptimizerController().solve(self.guid, data))
+        flows = response["response"]["flows"]
+        self.assertAlmostEqual(flows[self.supplier_a]["out"]["fuel"], 36.0)
+        self.assertAlmostEqual(response["response"]["objective"], 2.0 * 36 + 3.0 * 10)
+
+        tech["out"]["fuel"] = _quantity(0, "kW")
+        asyncio.run(
+            self.graphs.update_node_data(
+                self.guid, json.dumps({"tech": {"default": tech}}), self.supplier_a
+            )
+        )
+        response = asyncio.run(OptimizerController().solve(self.guid, data))
+        self.assertEqual(response["status"], "FAILED")
+
+    def test_nonlinear_equation_fails(self):
+        """Nonlinear equations are reported instead of silently linearized"""
+
+        # Technologies are shared between nodes, so edit a copy. `abs` and `maximum` agree with a linear function on
+        # non-negative probes, so they must be rejected from the equation itself.
+        graph = self.graphs.database[self.guid]
+        prototype = graph.nodes[self.plant].tech["default"]
+        for equation in ("fuel * fuel", "abs(fuel)", "maximum(fuel, 0)", "ratio * abs(fuel)", "fuel ** 1", "1 / fuel"):
+            tech = prototype.thaw()
+            tech.eqn["steel"] = equation
+            graph.nodes[self.plant].tech["default"] = tech
+            response = asyncio.run(OptimizerController().solve(self.guid, {}))
+            self.assertEqual(response["status"], "FAILED", equation)
+            self.assertIn("not linear", response["reason"])
+
+        # Functions of parameters only, and products and quotients with them, are linear
+        for equation in ("sqrt(ratio) * fuel", "fuel * (1 - ratio) / 2", "-fuel + abs(ratio)"):
+            self.assertIsNone(_check_linear(equation, frozenset({"fuel", "steel"})))
+
+    def test_job_lifecycle(self):
+        """Submitted jobs solve in the process pool while the event loop keeps running"""
+
+        controller = OptimizerController()
+        data = {
+            "objective": {"coal_a": 2.0, "coal_b": 3.0},
+            "bounds": {self.plant: {"steel": [10, 10]}},
+        }
+
+        async def run_test():
+            submitted = await controller.submit(self.guid, data)
+            self.assertEqual(submitted["status"], "OK")
+            juid = submitted["response"]["job"]
+
+            ticks, since, events = 0, 0, []
+            while True:
+                status = await controller.status(juid, since)
+                since = status["response"]["next"]
+                events.extend(e["event"] for e in status["response"]["events"])
+                if status["response"]["state"] in ("done", "failed", "cancelled"):
+                    break
+
+                # The loop stays responsive while the solver runs
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+            self.assertEqual(events[0], "built")
+            self.assertEqual(events[-1], "done")
+            self.assertGreater(ticks, 0)
+
+            result = await controller.result(juid)
+            self.assertAlmostEqual(result["response"]["objective"], 40.0)
+
+            cancelled = await controller.cancel(juid)
+            self.assertEqual(cancelled["status"], "FAILED")
+
+        try:
+            asyncio.run(run_test())
+        finally:
+            controller.shutdown()
+
+    def _run_sweep(self, controller, data):
+        async def run_test():
+            submitted = await controller.sweep(self.guid, data)
+            self.assertEqual(submitted["status"], "OK")
+            juid = submitted["response"]["job"]
+
+            while (await controller.status(juid))["response"]["state"] not in (
+                "done",
+                "failed",
+                "cancelled",
+            ):
+                await asyncio.sleep(0.01)
+
+            return await controller.result(juid)
+
+        return asyncio.run(run_test())
+
+    def test_scenario_sweep(self):
+        """Sweeps evaluate and optimize every scenario and write one column per quantity"""
+
+        controller = OptimizerController()
+        ratio = f"{self.plant}.default.ratio"
+
+        feed = {
+            "inp": {"coal_a": _quantity(10, "kg/s")},
+            "out": {"fuel": _quantity(0, "kg/s")},
+            "eqn": {"fuel": "coal_a"},
+        }
+        asyncio.run(
+            self.graphs.update_node_data(
+                self.guid, json.dumps({"tech": {"default": feed}}), self.supplier_a
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as output:
+            # Sweeps write inside the controller's output directory only
+            self.addCleanup(setattr, OptimizerController, "output_dir", OptimizerController.output_dir)
+            OptimizerController.output_dir = Path(output)
+
+            for outside in ("../escaped", str(Path(output).parent / "escaped")):
+                data = {"parameters": {ratio: [0.5]}, "output": outside}
+                response = asyncio.run(controller.sweep(self.guid, data))
+                self.assertEqual(response["status"], "FAILED")
+                self.assertIn("output directory", response["reason"])
+                self.assertFalse((Path(output).parent / "escaped").exists())
+
+            data = {
+                "parameters": {ratio: [0.25, 0.5, 1.0]},
+                "output": "evaluate",
+                "chunk": 2,
+                "workers": 2,
+            }
+            result = self._run_sweep(controller, data)
+            self.assertEqual(result["status"], "OK")
+            self.assertEqual(result["response"]["scenarios"], 3)
+
+            path = Path(output) / data["output"]
+            manifest = json.loads((path / "columns.json").read_text())
+            self.assertEqual(manifest["parameters"], [ratio])
+            steel = np.load(path / manifest["files"][f"{self.plant}.steel"])
+            np.testing.assert_allclose(steel, [2.5, 5.0, 10.0])
+
+            data = {
+                "mode": "optimize",
+                "sample": "lhs",
+                "samples": 4,
+                "seed": 0,
+                "parameters": {ratio: [0.5, 1.0]},
+                "objective": {"coal_a": 2.0, "coal_b": 3.0},
+                "bounds": {self.plant: {"steel": [10, 10]}},
+                "output": str(Path(output) / "optimize"),
+                "workers": 2,
+            }
+            result = self._run_sweep(controller, data)
+            self.assertEqual(result["status"], "OK")
+
+            path = Path(data["output"])
+            manifest = json.loads((path / "columns.json").read_text())
+            ratios = np.load(path / manifest["files"][ratio])
+            objective = np.load(path / manifest["files"]["objective"])
+            self.assertEqual(len(np.unique(np.floor(ratios * 8))), 4)
+            np.testing.assert_allclose(objective, 20.0 / ratios)
+
+
+if __name__ == "__main__":
+    unittest.main()
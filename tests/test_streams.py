@@ -0,0 +1,91 @@
+"""Test suite for core.streams module"""
+
+import unittest
+
+import numpy as np
+
+from core.streams import YEARS, CostPerMass, Fixed, Linear, Profile, Quantity, Stepped
+
+
+class TestProfiles(unittest.TestCase):
+    """Test time profiles and profile-backed quantities"""
+
+    def test_profiles_tabulate_over_year_grid(self):
+        """Profiles evaluate to one value per year of the horizon"""
+
+        fixed = Fixed(12.0)
+        linear = Linear([2024, 2050], [80, 120])
+        stepped = Stepped([2024, 2030, 2050], [1.8, 1.6, 1.2])
+
+        self.assertEqual(fixed.values.shape, YEARS.shape)
+        self.assertAlmostEqual(linear.at(2024), 80.0)
+        self.assertAlmostEqual(linear.at(2037), 100.0)
+        self.assertAlmostEqual(stepped.at(2029), 1.8)
+        self.assertAlmostEqual(stepped.at(2030), 1.6)
+        self.assertAlmostEqual(stepped.at(2049), 1.6)
+        self.assertAlmostEqual(stepped.at(2050), 1.2)
+
+        with self.assertRaises(ValueError):
+            linear.values[0] = 0.0
+
+    def test_profile_subclasses_must_tabulate(self):
+        """The base class and subclasses without `_tabulate` cannot be instantiated"""
+
+        class Incomplete(Profile):
+            kind = "Incomplete"
+
+        for cls in (Profile, Incomplete):
+            with self.assertRaises(TypeError):
+                cls()
+
+    def test_invalid_profiles_raise_value_error(self):
+        """Unknown kinds and missing, unexpected or malformed arguments are reported as ValueError"""
+
+        for data in (
+            {"kind": "Unknown"},
+            {"kind": "Linear", "points": [2024]},
+            {"kind": "Fixed", "value": 1.0, "slope": 2.0},
+            {"kind": "Linear", "points": 2024, "values": [1.0]},
+        ):
+            with self.assertRaises(ValueError):
+                Profile.from_dict(data)
+
+        self.assertEqual(Profile.from_dict({"kind": "Fixed", "value": 2}).at(2030), 2.0)
+
+    def test_profile_quantity_round_trip(self):
+        """Profile-backed quantities serialize their profile and rebuild it"""
+
+        cost = CostPerMass(Linear([2024, 2050], [80, 120]), "INR/kg")
+        self.assertEqual(cost.value.shape, YEARS.shape)
+
+        data = cost.to_dict()
+        self.assertEqual(data["profile"]["kind"], "Linear")
+
+        restored = Quantity.from_dict(data)
+        self.assertIsInstance(restored, CostPerMass)
+        self.assertEqual(restored.profile, cost.profile)
+        np.testing.assert_allclose(restored.value, cost.value)
+
+        restored.value = 5.0
+        self.assertIsNone(restored.profile)
+
+    def test_nested_quantity_round_trip(self):
+        """Quantities nested as attributes (e.g. stream attributes) are restored as attributes"""
+
+        stream = Quantity.from_dict({"type": "MassFlowRate", "value": 3.0, "units": "kg/s"})
+        stream.cost = CostPerMass("5 INR/kg")
+        stream.category = "Fuel"
+
+        restored = Quantity.from_dict(stream.to_dict())
+        self.assertEqual(restored.value, 3.0)
+        self.assertIsInstance(restored.cost, CostPerMass)
+        self.assertEqual(restored.cost.value, 5.0)
+
+        # The category is kept, as a Fuel stream's units are those of any other mass flow
+        self.assertEqual(restored.category, "Fuel")
+        plain = Quantity.from_dict({"type": "MassFlowRate", "value": 1.0, "units": "kg/s"})
+        self.assertNotIn("category", plain.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()